@@ -3,18 +3,73 @@
 # Last Modified: Wed 09 Dec 2015 03:50:00 PM PST
 # Author: Brett Fedack, Woo Choi, Eric Christensen
 
-from uiframework import signals
+from uiframework import signals, ResultBatch
+from dbmonitor import ServerMonitor
+from sqlscript import ScriptRunner
 import psycopg2
+import psycopg2.errors
+import psycopg2.extensions
+from psycopg2 import sql
 import subprocess
 import os
 import sys
 import pickle
 import uuid
 import os.path
+import math
+import re
 
 # NOTE: By convention, signals with "UI_" prefix are sent to the user
 # interface, and those with "DB_" prefix are received by this component.
 
+# Condition of a table content filter: column, operator, and value.
+filter_pattern = re.compile(r'^("[^"]+"|\w+)\s*(<=|>=|<>|!=|=|<|>|~)\s*(.+)$')
+
+# Typecaster passing values through in PostgreSQL's text representation, for
+# listings that are only displayed; covers every type the driver would parse.
+display_text = psycopg2.extensions.new_type(
+    tuple(psycopg2.extensions.string_types), 'DISPLAY_TEXT',
+    lambda value, cursor: value
+)
+
+# Catalog queries, each prepared once per connection; parameters are $1, $2, ...
+catalog_queries = {
+    'databases': """SELECT d.datname FROM pg_database d
+        JOIN pg_roles r ON r.oid = d.datdba
+        WHERE r.rolname = $1""",
+    'relations': """SELECT n.nspname, c.relname FROM pg_namespace n
+        LEFT JOIN pg_class c ON c.relnamespace = n.oid
+            AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+        WHERE n.nspname <> 'information_schema'
+            AND n.nspname NOT LIKE 'pg\\_%'
+        ORDER BY n.nspname, c.relname""",
+    'table_structure': """SELECT DISTINCT c.column_name, c.data_type,
+        c.character_maximum_length, c.is_nullable
+        FROM information_schema.columns c
+        WHERE c.table_schema = $1 AND c.table_name = $2""",
+    'table_stats': """SELECT s.seq_scan, s.seq_tup_read, s.idx_scan,
+        s.idx_tup_fetch, s.n_live_tup, s.n_dead_tup, s.last_vacuum,
+        s.last_autovacuum, s.last_analyze, s.last_autoanalyze,
+        io.heap_blks_read, io.heap_blks_hit, io.idx_blks_read,
+        io.idx_blks_hit, c.relpages, c.reltuples
+        FROM pg_stat_user_tables s
+        JOIN pg_statio_user_tables io ON io.relid = s.relid
+        JOIN pg_class c ON c.oid = s.relid
+        WHERE s.schemaname = $1 AND s.relname = $2""",
+    'table_indexes': """SELECT indexrelname, idx_scan, idx_tup_read,
+        pg_size_pretty(pg_relation_size(indexrelid))
+        FROM pg_stat_user_indexes
+        WHERE schemaname = $1 AND relname = $2
+        ORDER BY indexrelname""",
+    'table_width': """SELECT current_setting('block_size')::integer,
+        sum(avg_width)
+        FROM pg_stats
+        WHERE schemaname = $1 AND tablename = $2""",
+    'table_rows': """SELECT c.reltuples::bigint FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = $1 AND c.relname = $2"""
+}
+
 class DatabaseManager():
     '''
     Database manager class that exposes both method-based and signal-based
@@ -32,8 +87,33 @@ class DatabaseManager():
         _dbname (str): Name of current database
         _connected (bool): Flag indicating if component is connect to a server
         _database_curr (str): Name of currently selected database
+        _schema_curr (str): Name of currently selected schema
         _table_curr (str): Name of currently selected table
+        _relation_tree (dict<str:list<str>>): Relation names keyed by schema
+            name for the current database; None until fetched
         _database_state (connect): psycopg2 connect object
+        _prepared (set<str>): Names of catalog queries prepared on the current
+            connection
+        _monitor (ServerMonitor): Background poller of server activity
+        _monitor_intervals (dict<str:float>): Poll interval (sec) of each
+            monitored view
+        _backend_curr (int): Process ID of currently selected server backend
+        _table_stats (dict<2-tuple:list>): Cached table statistics keyed by
+            schema & table
+        _content_preview (bool): Flag indicating if table contents are sampled
+        _preview_limit (int): Maximum number of rows in a content preview
+        _content_filter (list<3-tuple<str, str, str>>): Column, operator, and
+            value of each condition filtering table contents
+        _content_sort (2-tuple<str, bool>): Column sorting table contents, and
+            whether the order is descending; None if unsorted
+        _transfer_process (Popen): pg_dump/pg_restore process of the latest
+            export/import; None if neither has been started
+        _script_autocommit (bool): Flag indicating if raw query statements are
+            committed one at a time, rather than as a single transaction
+        _script_state (connect): psycopg2 connect object on which raw queries
+            run, apart from browsing; None until the first raw query
+        _script (ScriptRunner): Raw query whose statements are running; None
+            if no raw query is running
     '''
     def __init__(self, signal_router = None):
         '''
@@ -53,24 +133,61 @@ class DatabaseManager():
         self._password = ''
         self._connected = False
         self._database_curr = ''
+        self._schema_curr = 'public'
         self._table_curr = ''
+        self._relation_tree = None
         self._database_state = ''
+        self._prepared = set()
+        self._monitor = None
+        self._monitor_intervals = {'activity': 1, 'locks': 1, 'databases': 5}
+        self._backend_curr = None
+        self._table_stats = {}
+        self._content_preview = False
+        self._preview_limit = 1000
+        self._content_filter = []
+        self._content_sort = None
+        self._transfer_process = None
+        self._script_autocommit = False
+        self._script_state = None
+        self._script = None
 
         # Setup signal handling.
         self._add_signal_handler('DB_CONNECT', self.connect)
         self._add_signal_handler('DB_DISCONNECT', self.disconnect)
         self._add_signal_handler('DB_LIST_DATABASES', self.list_databases)
+        self._add_signal_handler('DB_LIST_SCHEMAS', self.list_schemas)
         self._add_signal_handler('DB_LIST_TABLES', self.list_tables)
         self._add_signal_handler('DB_SET_DATABASE', self.set_database)
+        self._add_signal_handler('DB_SET_SCHEMA', self.set_schema)
         self._add_signal_handler('DB_SET_TABLE', self.set_table)
         self._add_signal_handler('DB_TABLE_CONTENT', self.list_table_content)
+        self._add_signal_handler('DB_CONTENT_MODE', self.set_content_mode)
+        self._add_signal_handler('DB_CONTENT_FILTER', self.set_content_filter)
+        self._add_signal_handler('DB_CONTENT_SORT', self.set_content_sort)
         self._add_signal_handler('DB_TABLE_STRUCTURE', self.list_table_structure)
+        self._add_signal_handler('DB_TABLE_STATS', self.list_table_stats)
         self._add_signal_handler('DB_RAW_QUERY', self.query_raw)
+        self._add_signal_handler('DB_SCRIPT_MODE', self.set_script_mode)
         self._add_signal_handler('DB_EXPORT_DATABASE', self.export_db)
         self._add_signal_handler('DB_IMPORT_DATABASE', self.import_db)
+        self._add_signal_handler('DB_MONITOR', self.monitor)
+        self._add_signal_handler('DB_MONITOR_INTERVAL', self.set_monitor_interval)
+        self._add_signal_handler('DB_SET_BACKEND', self.set_backend)
+        self._add_signal_handler('DB_CANCEL_BACKEND', self.cancel_backend)
+        self._add_signal_handler('DB_TERMINATE_BACKEND', self.terminate_backend)
+        self._add_signal_handler('DB_SIGNAL_BACKEND', self.signal_backend)
+
+        # NOTE: The user interface emits "UI_IDLE" while it waits for input,
+        # which is when monitor results are relayed from the polling thread,
+        # and when the statements of a raw query run a few at a time.
+        self._add_signal_handler('UI_IDLE', self.relay_monitor)
+        self._add_signal_handler('UI_IDLE', self.relay_script)
 
     def __del__(self):
-        ''' Deregisters signal handlers before destroying this component '''
+        ''' Stops polling & deregisters signal handlers before destruction '''
+        if self._monitor:
+            self._monitor.stop()
+        self._close_script()
         for signame, handler in self._registration_log:
             self._signal_router.deregister(signame, handler)
 
@@ -155,12 +272,18 @@ class DatabaseManager():
             # Attempt to connect
             # ** Connects to db template1 as it is required to connect to a db
             # when first connecting. template1 is available to all users by default.
+            self._close_script()
             psql_db = psycopg2.connect(dbname="template1",user=self._username,
 	           password=self._password,host=self._hostname,port=self._port)
 
             # Set below if connection is successful
             self._connected = True
             self._database_state = psql_db
+            self._prepared = set()
+
+            # Monitor the newly connected server.
+            if self._monitor:
+                self._start_monitor()
 
         except NameError as e:
             ### TESTING ###
@@ -197,7 +320,13 @@ class DatabaseManager():
             self._connected = False
             return False
 
+        # Stop monitoring the current server.
+        if self._monitor:
+            self._monitor.stop()
+            self._monitor = None
+
         # Disconnect from the current server.
+        self._close_script()
         try:
             self._database_state.close()
         except:
@@ -209,6 +338,10 @@ class DatabaseManager():
         self._database_curr = ''
         self._table_curr = ''
         self._database_state = ''
+        self._prepared = set()
+        self._schema_curr = 'public'
+        self._relation_tree = None
+        self._table_stats = {}
         # Inform the system of success.
         self._emit_success('Connection with server terminated')
 
@@ -258,7 +391,7 @@ class DatabaseManager():
             location = r"%s/%s"%(path_name,file_name)
             #print("Importing database %s from %s"%(db_name,location))
 
-            pg_restore_arr = ['pg_restore','-U',db_user, '-h', self._hostname]
+            pg_restore_arr = ['pg_restore','-U',db_user, '-h', self._hostname, '-p', str(self._port)]
 
 
             if 'clean' in kwargs:
@@ -273,6 +406,7 @@ class DatabaseManager():
             subenv['PGPASSWORD'] = self._password
             devnull = open(os.devnull, 'w')
             ps = subprocess.Popen(tuple(pg_restore_arr),stdout=devnull, stderr=devnull, env = subenv)
+            self._transfer_process = ps
         except NameError as e:
             #print("Name error %s"%(str(e)))
             self._emit_error('Name error %s'%(str(e)))
@@ -286,6 +420,7 @@ class DatabaseManager():
             self._emit_error('Error passing args %s'%(str(e.child_traceback)))
             return False
         # Inform system of success.
+        self._relation_tree = None
         self._emit_success('Database successfully imported from file')
 
         return True
@@ -331,7 +466,7 @@ class DatabaseManager():
             #print("Exporting database %s from %s"%(db_name,destination))
 
 
-            pg_dump_arr = ['pg_dump','-U', db_user, '-h', self._hostname,'-O']
+            pg_dump_arr = ['pg_dump','-U', db_user, '-h', self._hostname, '-p', str(self._port),'-O']
 
             if 'plain' in kwargs:
                 if kwargs['plain']:
@@ -351,6 +486,7 @@ class DatabaseManager():
             subenv = os.environ.copy()
             subenv['PGPASSWORD'] = self._password
             ps = subprocess.Popen(tuple(pg_dump_arr),stdout=subprocess.PIPE, env = subenv)
+            self._transfer_process = ps
         except NameError as e:
             #print("Name error %s"%(str(e)))
             self._emit_error('Name error %s'%(str(e)))
@@ -394,6 +530,7 @@ class DatabaseManager():
             return False
 
         # First disconnect from current connection
+        self._close_script()
         if self._database_state:
             self._database_state.close()
             self._database_state = ''
@@ -405,6 +542,10 @@ class DatabaseManager():
         try:
             # Set the database.
             self._database_curr = database
+            self._schema_curr = 'public'
+            self._table_curr = ''
+            self._relation_tree = None
+            self._table_stats = {}
 
             # Attempt connection
             psql_db = psycopg2.connect(dbname=self._database_curr,user=self._username,
@@ -412,8 +553,13 @@ class DatabaseManager():
 
             self._connected = True
             self._database_state = psql_db
+            self._prepared = set()
             ### TESTING ###
             #print("db set connected")
+
+            # Resolve monitored relation names within the new database.
+            if self._monitor:
+                self._start_monitor()
         except NameError as e:
             ### TESTING ###
             #print("Name error %s"%(str(e)))
@@ -458,8 +604,10 @@ class DatabaseManager():
             self._emit_error('No database selected')
             return False
 
-        # Set the table.
+        # Set the table, discarding the previous table's filter & sort.
         self._table_curr = table
+        self._content_filter = []
+        self._content_sort = None
         ### TESTING ###
         #print(self._table_curr)
 
@@ -490,11 +638,7 @@ class DatabaseManager():
         # Acquire a listing of databases on the server.
         # This will return list of databases owned by user ONLY
         cursor = self._database_state.cursor()
-        cursor.execute("SELECT oid FROM pg_roles WHERE rolname='%s';"%self._username)
-        records = cursor.fetchall()
-        user_oid = records[0]
-        user_oid = user_oid[0]
-        cursor.execute("SELECT datname FROM pg_database WHERE datdba='%s';"%user_oid)
+        self._execute_catalog(cursor, 'databases', self._username)
         records = cursor.fetchall()
 
         # older version
@@ -534,21 +678,12 @@ class DatabaseManager():
             self._emit_error('No connection to database')
             return []
 
-        # Acquire a listing of tables in the current database.
+        # Acquire a listing of tables in the current schema.
         try:
-            cursor = self._database_state.cursor()
-            cursor.execute("""SELECT table_name FROM information_schema.tables
-            WHERE table_schema='public';""")
-            records = cursor.fetchall()
-
-            # Converting to acceptable format
-            table_list = [i[0] for i in records]
-
-            ### TESTING ###
-            #print(table_list)
-            cursor.close()
-        except:
-            self._emit_error('Error while executing table list')
+            table_list = self._relation_index().get(self._schema_curr, [])
+        except psycopg2.Error as e:
+            self._database_state.rollback()
+            self._emit_error('Error while executing table list %s'%(str(e)))
             return []
 
         # Transmit table list.
@@ -557,12 +692,87 @@ class DatabaseManager():
         return table_list
 
 
+    def list_schemas(self, **kwargs):
+        '''
+        Queries current database for a list of schema names
+
+        Returns:
+            list: List of schema names
+        '''
+        # Validate inputs & component state.
+        if not self._connected:
+            self._emit_error('Not connected to a server')
+            return []
+        if not self._database_curr:
+            self._emit_error('No database selected')
+            return []
+        if not self._database_state:
+            self._emit_error('No connection to database')
+            return []
+
+        # Acquire a listing of schemas in the current database.
+        try:
+            schema_list = list(self._relation_index())
+        except psycopg2.Error as e:
+            self._database_state.rollback()
+            self._emit_error('Error while executing schema list %s'%(str(e)))
+            return []
+
+        # Transmit schema list.
+        self._emit('UI_SCHEMA_LIST', schemas = schema_list)
+
+        return schema_list
+
+
+    def set_schema(self, schema, **kwargs):
+        '''
+        Designates current schema in database, unsetting the current table
+
+        Parameters:
+            schema (str): Identifier for schema; "public" if unspecified
+
+        Returns:
+            bool: True if schema is set; False otherwise
+        '''
+        # Validate inputs & component state.
+        if not self._connected:
+            self._emit_error('Not connected to a server')
+            return False
+        if not self._database_curr:
+            self._emit_error('No database selected')
+            return False
+        try:
+            schema = schema if schema is not None else 'public'
+            if schema not in self._relation_index():
+                self._emit_error('"{}" schema not found in "{}" database'.format(
+                    schema, self._database_curr
+                ))
+                return False
+        except psycopg2.Error as e:
+            self._database_state.rollback()
+            self._emit_error('Error while executing schema list %s'%(str(e)))
+            return False
+
+        # Set the schema.
+        self._schema_curr = schema
+        self._table_curr = ''
+
+        # Inform the system of success.
+        self._emit('UI_SET_SCHEMA', schema = schema)
+        self._emit_success('"{}" set as current schema'.format(schema))
+
+        return True
+
+
     def list_table_content(self, **kwargs):
         '''
-        Queries current table for a listing of its contents
+        Queries current table for a listing of its contents, with any filter
+        and sort applied by the server; in preview mode, only a sample of rows
+        is fetched and the row count is estimated from planner statistics
 
         Returns:
-            list<list>: List of table rows (first is header)
+            ResultBatch: Typed columns of table rows, in PostgreSQL's text
+                representation
         '''
         # Validate inputs & component state.
         if not self._connected:
@@ -579,38 +789,164 @@ class DatabaseManager():
         try:
             cursor = self._database_state.cursor()
 
-            # Get row headers
-            cursor_str = "SELECT column_name FROM information_schema.columns WHERE table_name=\'%s\';"%(self._table_curr)
-            cursor.execute(cursor_str)
+            # Build the query, pushing any filter & sort down to the server.
+            query = [sql.SQL('SELECT * FROM {}').format(self._qualified_table())]
+            sample = None
+            if self._content_preview:
+                row_estimate = self._estimate_rows(cursor)
+
+                # Sampled pages would defeat index scans for a filter or sort.
+                if not self._content_filter and not self._content_sort:
+                    sample = self._sample_clause(row_estimate)
+                    query.append(sample)
+            if self._content_filter:
+                conditions = []
+                for column, operator, value in self._content_filter:
+                    if operator == '~':
+                        condition = sql.SQL('{}::text ILIKE {}')
+                        value = '%' + re.sub(r'([\\%_])', r'\\\1', value) + '%'
+                    else:
+                        condition = sql.SQL('{} ' + operator + ' {}')
+                    conditions.append(condition.format(sql.Identifier(column), sql.Literal(value)))
+                query.append(sql.SQL(' WHERE ') + sql.SQL(' AND ').join(conditions))
+            if self._content_sort:
+                column, descending = self._content_sort
+                query.append(sql.SQL(' ORDER BY {} {}').format(
+                    sql.Identifier(column), sql.SQL('DESC' if descending else 'ASC')
+                ))
+            if self._content_preview:
+                query.append(sql.SQL(' LIMIT {}').format(sql.Literal(self._preview_limit)))
+
+            # Get rows as text, since they are only displayed; values are
+            # rendered as literals, so "%" in identifiers is not a placeholder.
+            psycopg2.extensions.register_type(display_text, cursor)
+            cursor.execute(sql.Composed(query))
             records = cursor.fetchall()
 
-            # Convert to acceptable list
-            table_column = [i[0] for i in records]
-
-            # Get rows
-            cursor_str = "SELECT * FROM %s;"%(self._table_curr)
-            cursor.execute(cursor_str)
-            records = cursor.fetchall()
-
-            # Combine row headers and rows
-            table_content = [table_column] + records
+            # Fall back to the leading pages if too few pages were sampled.
+            if sample not in (None, sql.SQL('')) and len(records) < self._preview_limit:
+                query.remove(sample)
+                cursor.execute(sql.Composed(query))
+                records = cursor.fetchall()
 
-            ### TESTING ###
-            #print("table_content:")
-            #print(table_content)
+            # Summarize the number of rows.
+            row_count = len(records)
+            noun = 'matching rows' if self._content_filter else 'rows'
+            if not self._content_preview:
+                caption = '{:,} {}'.format(row_count, noun)
+            elif not self._content_filter:
+                caption = '~{:,} rows (estimated)'.format(row_estimate)
+            elif row_count < self._preview_limit:
+                caption = '{:,} {}'.format(row_count, noun)
+            else:
+                caption = '{:,}+ {} of ~{:,} (estimated)'.format(row_count, noun, row_estimate)
+
+            # Combine row headers, type OIDs, and columns of rows, in the same
+            # order as the fetched columns.
+            table_content = ResultBatch.from_rows(
+                [column[0] for column in cursor.description],
+                [column[1] for column in cursor.description],
+                records, is_text = True
+            )
 
             # close cursor
             cursor.close()
-        except:
-            self._emit_error('Error while querying table content')
+        except psycopg2.Error as e:
+            self._database_state.rollback()
+            self._emit_error('Error while querying table content %s'%(str(e)))
             return []
 
         # Transmit table contents.
-        self._emit('UI_TABLE_CONTENT', table_content = table_content)
+        sort, descending = self._content_sort if self._content_sort else (None, False)
+        self._emit(
+            'UI_TABLE_CONTENT', table_content = table_content, caption = caption,
+            sort = sort, descending = descending
+        )
 
         return table_content
 
 
+    def set_content_mode(self, preview, **kwargs):
+        '''
+        Switches table content listings between full and preview modes, then
+        relists the current table's contents, if any
+
+        Parameters:
+            preview (bool): Flag indicating if only a sample of rows is listed
+
+        Returns:
+            bool: True if mode is set; False otherwise
+        '''
+        self._content_preview = bool(preview)
+        if self._connected and self._table_curr:
+            self.list_table_content()
+
+        return True
+
+
+    def set_content_filter(self, expression, **kwargs):
+        '''
+        Filters table content listings, then relists the current table's
+        contents
+
+        Parameters:
+            expression (str): Conditions of the form "column op value", joined
+                by "and"; op is one of =, <>, !=, <, <=, >, >=, or ~ (contains)
+
+        Returns:
+            bool: True if filter is set; False otherwise
+        '''
+        # Validate inputs & component state.
+        if not self._connected:
+            self._emit_error('Not connected to a server')
+            return False
+        if not self._table_curr:
+            self._emit_error('No table selected')
+            return False
+        try:
+            conditions = _parse_filter(expression)
+        except ValueError as e:
+            self._emit_error(str(e))
+            return False
+        if not self._validate_columns([column for column, _, _ in conditions]):
+            return False
+
+        # Set the filter, and relist table contents.
+        self._content_filter = conditions
+        self.list_table_content()
+
+        return True
+
+
+    def set_content_sort(self, sort, descending = False, **kwargs):
+        '''
+        Sorts table content listings, then relists the current table's contents
+
+        Parameters:
+            sort (str): Name of column to sort by; unsorted if None
+            descending (bool): Flag indicating if sort order is descending
+                (Optional)
+
+        Returns:
+            bool: True if sort is set; False otherwise
+        '''
+        # Validate inputs & component state.
+        if not self._connected:
+            self._emit_error('Not connected to a server')
+            return False
+        if not self._table_curr:
+            self._emit_error('No table selected')
+            return False
+        if sort is not None and not self._validate_columns([sort]):
+            return False
+
+        # Set the sort, and relist table contents.
+        self._content_sort = (sort, bool(descending)) if sort is not None else None
+        self.list_table_content()
+
+        return True
+
+
     def list_table_structure(self, **kwargs):
         '''
         Queries current table for a listing of its structure
@@ -633,11 +969,7 @@ class DatabaseManager():
         try:
             cursor = self._database_state.cursor()
             # Query for table structure
-            cursor_str = """SELECT DISTINCT c.column_name, c.data_type,
-            c.character_maximum_length, c.is_nullable
-            FROM information_schema.columns c
-            WHERE c.table_name = '%s';"""%(self._table_curr)
-            cursor.execute(cursor_str)
+            self._execute_catalog(cursor, 'table_structure', self._schema_curr, self._table_curr)
             records = cursor.fetchall()
 
             # Fromat list<list>
@@ -648,8 +980,9 @@ class DatabaseManager():
             #print("db_table_structure:")
             #print(table_structure)
             cursor.close()
-        except:
-            self.emit_error('Error while executing table structure')
+        except psycopg2.Error as e:
+            self._database_state.rollback()
+            self._emit_error('Error while executing table structure %s'%(str(e)))
             return []
 
         # Transmit table structure.
@@ -658,15 +991,116 @@ class DatabaseManager():
         return table_structure
 
 
+    def list_table_stats(self, refresh = False, **kwargs):
+        '''
+        Queries usage & storage statistics of the current table; results are
+        cached per table until a refresh is requested
+
+        Parameters:
+            refresh (bool): Flag controlling bypass of cached statistics
+                (Optional)
+
+        Returns:
+            list<list>: List of table statistics (first is header)
+        '''
+        # Validate inputs & component state.
+        if not self._connected:
+            self._emit_error('Not connected to a server')
+            return []
+        if not self._table_curr:
+            self._emit_error('No table selected')
+            return []
+        if not self._database_state:
+            self._emit_error('No connection to database')
+            return []
+
+        # Reuse cached statistics unless a refresh is requested.
+        schema, table = self._schema_curr, self._table_curr
+        if not refresh and (schema, table) in self._table_stats:
+            table_stats = self._table_stats[(schema, table)]
+            self._emit('UI_TABLE_STATS', table_stats = table_stats)
+            return table_stats
+
+        # Acquire the current table's statistics.
+        try:
+            cursor = self._database_state.cursor()
+
+            # Query for scan, tuple, and cache statistics.
+            self._execute_catalog(cursor, 'table_stats', schema, table)
+            record = cursor.fetchone()
+            if record is None:
+                cursor.close()
+                self._emit_error('No statistics found for "{}"'.format(table))
+                return []
+            (seq_scan, seq_tup_read, idx_scan, idx_tup_fetch, live, dead,
+             last_vacuum, last_autovacuum, last_analyze, last_autoanalyze,
+             heap_read, heap_hit, idx_read, idx_hit, relpages, reltuples
+            ) = record
+
+            # Query for index usage.
+            self._execute_catalog(cursor, 'table_indexes', schema, table)
+            indexes = cursor.fetchall()
+
+            # Query for the inputs of the bloat estimate.
+            self._execute_catalog(cursor, 'table_width', schema, table)
+            block_size, row_width = cursor.fetchone()
+
+            cursor.close()
+        except psycopg2.Error as e:
+            self._database_state.rollback()
+            self._emit_error('Error while querying table statistics %s'%(str(e)))
+            return []
+
+        # Estimate bloat by comparing actual pages with those needed to hold
+        # the live tuples (23 byte tuple header, 4 byte item pointer, 24 byte
+        # page header).
+        if row_width is None or not relpages:
+            bloat = 'Unknown (ANALYZE the table)'
+        else:
+            tuples_per_page = max(1, (block_size - 24) // (row_width + 27))
+            needed_pages = math.ceil(reltuples / tuples_per_page)
+            bloat_pages = max(0, relpages - needed_pages)
+            bloat = '{:.1f}% ({} of {} pages)'.format(
+                100.0 * bloat_pages / relpages, bloat_pages, relpages
+            )
+
+        # Format list<list>
+        table_stats = [
+            ['Statistic', 'Value'],
+            ['Sequential Scans', '{} ({} rows read)'.format(seq_scan, seq_tup_read)],
+            ['Index Scans', '{} ({} rows fetched)'.format(idx_scan or 0, idx_tup_fetch or 0)],
+            ['Live Tuples', str(live)],
+            ['Dead Tuples', '{} ({})'.format(dead, _percent(dead, live + dead))],
+            ['Heap Cache Hits', _percent(heap_hit, heap_hit + heap_read)],
+            ['Index Cache Hits', _percent(idx_hit, (idx_hit or 0) + (idx_read or 0))],
+            ['Estimated Bloat', bloat],
+            ['Last Vacuum', str(max(filter(None, [last_vacuum, last_autovacuum]), default = 'Never'))],
+            ['Last Analyze', str(max(filter(None, [last_analyze, last_autoanalyze]), default = 'Never'))]
+        ] + [
+            ['Index ' + name, '{} scans ({} rows read), {}'.format(scans, rows, size)]
+            for name, scans, rows, size in indexes
+        ]
+        self._table_stats[(schema, table)] = table_stats
+
+        # Transmit table statistics.
+        self._emit('UI_TABLE_STATS', table_stats = table_stats)
+
+        return table_stats
+
+
     def query_raw(self, raw, **kwargs):
         '''
-        Queries current database using the given string
+        Queries current database using the given script of statements, which
+        run as a single transaction unless each is committed as it runs; the
+        statements run a few at a time while the user interface is idle,
+        reporting progress as they go
 
         Parameters:
             raw (str): Literal form of query
 
         Returns:
-            str: Query result
+            str: Status, timing, and results of each statement, if they have
+                all run without waiting for the user interface; empty otherwise
         '''
         # Validate inputs & component state.
         if not self._connected:
@@ -684,38 +1118,484 @@ class DatabaseManager():
             self._emit('UI_RAW_QUERY', result = easter_egg)
             return ''
 
-        # Submit raw query to the DBMS.
+        if self._script:
+            self._emit_error('A raw query is still running')
+            return ''
+
+        # Start running the statements of the raw query on a connection of its
+        # own, so that browsing cannot interleave with its transaction.
+        runner = ScriptRunner(raw, self._script_autocommit)
+        try:
+            if not self._script_state or self._script_state.closed:
+                self._script_state = psycopg2.connect(
+                    dbname = self._database_curr, user = self._username,
+                    password = self._password, host = self._hostname, port = self._port
+                )
+            cursor = self._script_state.cursor()
+            psycopg2.extensions.register_type(display_text, cursor)
+            runner.start(cursor)
+        except psycopg2.Error as e:
+            # Display error in the output box
+            self._emit('UI_RAW_QUERY', result = str(e))
+            self._close_script()
+            return ''
+        self._script = runner
+
+        # Run the first statements right away; the rest run while idle.
+        return self._step_script()
+
+
+    def relay_script(self, **kwargs):
+        '''
+        Runs the next few statements of the running raw query, if any
+        '''
+        if self._script:
+            self._step_script()
+
+
+    def set_script_mode(self, autocommit, **kwargs):
+        '''
+        Switches raw queries between running as a single transaction and
+        committing each statement as it runs
+
+        Parameters:
+            autocommit (bool): Flag indicating if each statement is committed
+
+        Returns:
+            bool: True if mode is set; False otherwise
+        '''
+        self._script_autocommit = bool(autocommit)
+
+        return True
+
+
+    def monitor(self, enabled, **kwargs):
+        '''
+        Starts or stops polling of server activity statistics
+
+        Parameters:
+            enabled (bool): Flag indicating if polling should be running
+
+        Returns:
+            bool: True if polling state is changed; False otherwise
+        '''
+        # Stop polling.
+        if not enabled:
+            if self._monitor:
+                self._monitor.stop()
+                self._monitor = None
+            self._emit_success('Server monitor stopped')
+            return True
+
+        # Validate inputs & component state.
+        if not self._connected:
+            self._emit_error('Not connected to a server')
+            return False
+
+        # Start polling.
+        self._start_monitor()
+        self._emit_success('Server monitor started')
+
+        return True
+
+
+    def set_monitor_interval(self, interval, view = None, **kwargs):
+        '''
+        Sets how often server activity statistics are polled
+
+        Parameters:
+            interval (float): Poll interval (sec)
+            view (str): Monitored view in {'activity', 'locks', 'databases'};
+                all views if unspecified (Optional)
+
+        Returns:
+            bool: True if interval is set; False otherwise
+        '''
+        # Validate inputs.
+        if not interval or interval <= 0:
+            self._emit_error('Poll interval must be positive')
+            return False
+        if view is not None and view not in self._monitor_intervals:
+            self._emit_error('"{}" is not a monitored view'.format(view))
+            return False
+
+        # Set the interval(s).
+        for name in self._monitor_intervals:
+            if view is None or name == view:
+                self._monitor_intervals[name] = interval
+        if self._monitor:
+            self._monitor.set_interval(interval, view)
+
+        return True
+
+
+    def relay_monitor(self, **kwargs):
+        '''
+        Transmits the latest server activity statistics, if any, to the UI
+        '''
+        if not self._monitor:
+            return
+
+        # Transmit each view under its own signal.
+        for view, table in self._monitor.collect().items():
+            if view == 'error':
+                self._monitor = None
+                self._emit_error(table)
+            else:
+                self._emit('UI_MONITOR_' + view.upper(), snapshot = table)
+
+
+    def set_backend(self, pid, **kwargs):
+        '''
+        Designates current server backend
+
+        Parameters:
+            pid (int): Process ID of server backend
+
+        Returns:
+            bool: True if backend is set; False otherwise
+        '''
+        self._backend_curr = pid
+        return pid is not None
+
+
+    def cancel_backend(self, **kwargs):
+        '''
+        Prompts for confirmation to cancel the current backend's query
+
+        Returns:
+            bool: True if confirmation is requested; False otherwise
+        '''
+        return self._confirm_signal_backend(terminate = False)
+
+
+    def terminate_backend(self, **kwargs):
+        '''
+        Prompts for confirmation to terminate the current backend
+
+        Returns:
+            bool: True if confirmation is requested; False otherwise
+        '''
+        return self._confirm_signal_backend(terminate = True)
+
+
+    def signal_backend(self, pid, terminate, **kwargs):
+        '''
+        Cancels the query of, or terminates, the given server backend
+
+        Parameters:
+            pid (int): Process ID of server backend
+            terminate (bool): Flag indicating if backend should be terminated
+                rather than have its current query cancelled
+
+        Returns:
+            bool: True if the backend was signalled; False otherwise
+        '''
+        # Validate inputs & component state.
+        if not self._connected or not self._database_state:
+            self._emit_error('Not connected to a server')
+            return False
+
+        # Signal the backend.
+        function = 'pg_terminate_backend' if terminate else 'pg_cancel_backend'
         try:
             cursor = self._database_state.cursor()
-            cursor.execute(raw)
+            cursor.execute('SELECT %s(%%s);'%(function), (pid,))
+            signalled = cursor.fetchone()[0]
+            cursor.close()
             self._database_state.commit()
+        except psycopg2.Error as e:
+            self._database_state.rollback()
+            self._emit_error('Signal error %s'%(str(e)))
+            return False
+
+        # Inform the system of the outcome.
+        if not signalled:
+            self._emit_error('Backend {} could not be signalled'.format(pid))
+            return False
+        self._emit_success('Backend {} {}'.format(
+            pid, 'terminated' if terminate else 'cancelled'
+        ))
+
+        return True
+
+
+    def _step_script(self):
+        '''
+        Runs statements of the running raw query for a moment, then transmits
+        its report and progress
+
+        Returns:
+            str: Status, timing, and results of each statement, if the raw
+                query has finished; empty otherwise
+        '''
+        runner = self._script
+        try:
+            is_done = runner.step()
+        except psycopg2.Error as e:
+            self._emit('UI_RAW_QUERY', result = runner.report() + '\n' + str(e))
+            self._emit_error('Raw query failed')
+            self._close_script()
+            return ''
+        query_result = runner.report()
+        self._emit('UI_RAW_QUERY', result = query_result)
+
+        # Report progress while statements remain.
+        if not is_done:
+            self._emit_success('Running statement {} of {}'.format(
+                runner.completed + 1, len(runner)
+            ))
+            return ''
+
+        self._script = None
+        if runner.completed:
+            self._relation_tree = None # Relations may have been (re)defined
+        if runner.error is None:
+            self._emit_success('Ran {} statement(s) in {:.1f} ms'.format(
+                runner.completed, 1000 * runner.elapsed
+            ))
+        else:
+            self._emit_error('Statement {} of {} failed'.format(runner.completed + 1, len(runner)))
 
-            # If query returns anything, set it to raw_query_result
-            # Else, notify user that query was accepted
+        return query_result
+
+
+    def _close_script(self):
+        ''' Abandons any running raw query and closes its connection '''
+        if self._script:
+            self._script.stop()
+            self._script = None
+        if self._script_state:
             try:
-                records = cursor.fetchall()
-                ### TESTING ###
-                #print (records)
+                self._script_state.close()
+            except psycopg2.Error:
+                pass
+            self._script_state = None
+
+
+    def _start_monitor(self):
+        ''' (Re)starts polling with the current connection parameters '''
+        if self._monitor:
+            self._monitor.stop()
+        self._monitor = ServerMonitor(
+            {
+                'dbname': self._database_curr or 'template1',
+                'user': self._username,
+                'password': self._password,
+                'host': self._hostname,
+                'port': self._port
+            },
+            self._monitor_intervals
+        )
+        self._monitor.start()
+
+
+    def _execute_catalog(self, cursor, name, *params):
+        '''
+        Executes a catalog query as a prepared statement, preparing it first
+        if the current connection has not already done so
+
+        Parameters:
+            cursor (cursor): psycopg2 cursor object
+            name (str): Name of query in the catalog
+            *params: Query parameters
+        '''
+        statement = sql.Identifier(name)
+        if name not in self._prepared:
+            cursor.execute(sql.SQL('PREPARE {} AS {};').format(
+                statement, sql.SQL(catalog_queries[name])
+            ))
+            self._prepared.add(name)
+        try:
+            if params:
+                placeholders = sql.SQL(', ').join([sql.Placeholder()] * len(params))
+                cursor.execute(sql.SQL('EXECUTE {} ({});').format(statement, placeholders), params)
+            else:
+                cursor.execute(sql.SQL('EXECUTE {};').format(statement))
+        except psycopg2.errors.InvalidSqlStatementName:
+            # Prepare the query again if a raw query deallocated it, e.g. by
+            # "DEALLOCATE ALL" or "DISCARD ALL".
+            self._database_state.rollback()
+            self._prepared.discard(name)
+            self._execute_catalog(cursor, name, *params)
+
+
+    def _relation_index(self):
+        '''
+        Fetches every schema & relation name in the current database with a
+        single catalog query, unless already fetched
+
+        Returns:
+            dict<str:list<str>>: Sorted relation names keyed by schema name
+        '''
+        if self._relation_tree is None:
+            cursor = self._database_state.cursor()
+            self._execute_catalog(cursor, 'relations')
+            relation_tree = {}
+            for schema, relation in cursor.fetchall():
+                relations = relation_tree.setdefault(schema, [])
+                if relation is not None: # Schema without relations
+                    relations.append(relation)
+            cursor.close()
+            self._relation_tree = relation_tree
+        return self._relation_tree
+
+
+    def _qualified_table(self):
+        '''
+        Quotes the schema-qualified name of the current table
+
+        Returns:
+            Composable: Table identifier
+        '''
+        return sql.SQL('{}.{}').format(
+            sql.Identifier(self._schema_curr), sql.Identifier(self._table_curr)
+        )
+
+
+    def _estimate_rows(self, cursor):
+        '''
+        Estimates the current table's row count from planner statistics rather
+        than a full scan
+
+        Parameters:
+            cursor (cursor): psycopg2 cursor object
+
+        Returns:
+            int: Estimated row count
+        '''
+        self._execute_catalog(cursor, 'table_rows', self._schema_curr, self._table_curr)
+        record = cursor.fetchone()
+        return max(0, record[0]) if record else 0 # -1 if never analyzed
+
+
+    def _sample_clause(self, row_estimate):
+        '''
+        Builds a clause sampling random pages of large tables (9.5+); smaller
+        tables are left to the preview limit, which only reads as many pages
+        as needed
+
+        Parameters:
+            row_estimate (int): Estimated row count of the current table
+
+        Returns:
+            Composable: Sampling clause, possibly empty
+        '''
+        limit = self._preview_limit
+        if (self._database_state.server_version < 90500
+            or row_estimate <= 10 * limit
+        ):
+            return sql.SQL('')
+        percent = 100.0 * 2 * limit / row_estimate # Oversample sparse pages
+        return sql.SQL(' TABLESAMPLE SYSTEM ({})').format(sql.Literal(percent))
+
 
-                # Return query_result as a string
-                query_result = "" + str(records)
-            except:
-                query_result = 'Query Accepted:\n' + raw
-                ### TESTING ###
-                #print (query_result)
+    def _validate_columns(self, columns):
+        '''
+        Checks that the current table has the given columns
+
+        Parameters:
+            columns (list<str>): Column names
 
+        Returns:
+            bool: True if all columns exist; False otherwise
+        '''
+        try:
+            cursor = self._database_state.cursor()
+            cursor.execute(sql.SQL('SELECT * FROM {} LIMIT 0;').format(
+                self._qualified_table()
+            ))
+            table_columns = [column[0] for column in cursor.description]
             cursor.close()
         except psycopg2.Error as e:
-            # Display error in the output box
-            self._emit('UI_RAW_QUERY', result = str(e))
-            # roll back when there is an error
             self._database_state.rollback()
-            return ''
+            self._emit_error('Error while querying table columns %s'%(str(e)))
+            return False
 
-        # Transmit query result.
-        self._emit('UI_RAW_QUERY', result = query_result)
+        for column in columns:
+            if column not in table_columns:
+                self._emit_error('No column "{}" in "{}"'.format(column, self._table_curr))
+                return False
+        return True
+
+
+    def _confirm_signal_backend(self, terminate):
+        '''
+        Prompts for confirmation before signalling the current backend
+
+        Parameters:
+            terminate (bool): Flag indicating if backend should be terminated
+
+        Returns:
+            bool: True if confirmation is requested; False otherwise
+        '''
+        # Validate inputs & component state.
+        if not self._connected:
+            self._emit_error('Not connected to a server')
+            return False
+        if self._backend_curr is None:
+            self._emit_error('No backend PID entered')
+            return False
+
+        # Request confirmation, as in the exit prompt.
+        pid = self._backend_curr
+        self._emit(
+            'UI_PROMPT_CONFIRM',
+            prompt = 'Are you sure you want to {} backend {}?'.format(
+                'terminate' if terminate else 'cancel the query of', pid
+            ),
+            sigconfirm = signals.Signal(
+                'DB_SIGNAL_BACKEND', pid = pid, terminate = terminate
+            )
+        )
+
+        return True
+
+def _parse_filter(expression):
+    '''
+    Parses a filter expression into conditions
+
+    Parameters:
+        expression (str): Conditions of the form "column op value", joined by
+            "and"; blank for no conditions
+
+    Returns:
+        list<3-tuple<str, str, str>>: Column, operator, and value of each
+            condition
+
+    Raises:
+        ValueError: If any condition is malformed
+    '''
+    conditions = []
+    if not expression.strip():
+        return conditions
+    for term in re.split(r'\s+and\s+', expression.strip(), flags = re.IGNORECASE):
+        match = filter_pattern.match(term)
+        if not match:
+            raise ValueError('Malformed filter condition "{}"'.format(term))
+        column, operator, value = match.groups()
+        if column[0] == '"':
+            column = column[1:-1]
+        if len(value) > 1 and value[0] == value[-1] == "'":
+            value = value[1:-1]
+        operator = '<>' if operator == '!=' else operator
+        conditions.append((column, operator, value))
+    return conditions
+
+
+def _percent(part, whole):
+    '''
+    Formats the given ratio as a percentage
+
+    Parameters:
+        part (int): Numerator
+        whole (int): Denominator
+
+    Returns:
+        str: Percentage; "N/A" if the denominator is zero
+    '''
+    return '{:.1f}%'.format(100.0 * part / whole) if whole else 'N/A'
 
-        return query_result
 
 easter_egg = '''\
 HAL: Good afternoon, gentlemen.
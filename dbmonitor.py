@@ -0,0 +1,190 @@
+# Filename: dbmonitor.py
+# Creation Date: Mon 19 Oct 2026
+# Last Modified: Mon 19 Oct 2026
+
+
+import threading
+import time
+import psycopg2
+from psycopg2 import sql
+
+
+# Monitored views of server activity; each maps to a header and a query.
+monitor_views = {
+    'activity': (
+        ['PID', 'User', 'Database', 'State', 'Waiting', 'Duration', 'Query'],
+        """SELECT pid, usename, datname, state, {waiting},
+        date_trunc('second', now() - query_start),
+        left(regexp_replace(query, '\\s+', ' ', 'g'), 80)
+        FROM pg_stat_activity
+        WHERE pid <> pg_backend_pid()
+        ORDER BY pid;"""
+    ),
+    'locks': (
+        ['PID', 'Lock Type', 'Relation', 'Mode', 'Granted'],
+        """SELECT l.pid, l.locktype, coalesce(c.relname, ''), l.mode,
+        CASE WHEN l.granted THEN 'yes' ELSE 'WAITING' END
+        FROM pg_locks l LEFT JOIN pg_class c ON c.oid = l.relation
+        WHERE l.pid <> pg_backend_pid()
+        ORDER BY l.pid, l.locktype, l.mode;"""
+    ),
+    'databases': (
+        ['Database', 'Backends', 'Commits', 'Rollbacks', 'Hit %', 'Deadlocks'],
+        """SELECT datname, numbackends, xact_commit, xact_rollback,
+        round(100.0 * blks_hit / nullif(blks_hit + blks_read, 0), 1),
+        deadlocks
+        FROM pg_stat_database
+        WHERE datname IS NOT NULL
+        ORDER BY datname;"""
+    )
+}
+
+
+class ServerMonitor():
+    '''
+    Polls server activity statistics in a background thread, retaining only
+    the latest snapshot of each view for pickup by the main thread
+
+    Attributes:
+        _connect_kwargs (dict): Keyword arguments for psycopg2.connect
+        _intervals (dict<str:float>): Poll interval (sec) keyed by view name
+        _snapshots (dict<str:list>): Latest uncollected table keyed by view
+            name; 'error' keys an error message instead
+        _condition (threading.Condition): Guards shared state and wakes the
+            polling thread early
+        _running (bool): Flag controlling run state of the polling thread
+        _thread (threading.Thread): Polling thread
+    '''
+    @property
+    def is_running(self):
+        ''' Getter for "is_running" property '''
+        return self._running
+
+
+    def __init__(self, connect_kwargs, intervals):
+        '''
+        Parameters:
+            connect_kwargs (dict): Keyword arguments for psycopg2.connect
+            intervals (dict<str:float>): Poll interval (sec) keyed by view name
+        '''
+        self._connect_kwargs = connect_kwargs
+        self._intervals = dict(intervals)
+        self._snapshots = {}
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread = None
+
+
+    def start(self):
+        ''' Starts polling in a background thread '''
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target = self._run, daemon = True)
+        self._thread.start()
+
+
+    def stop(self):
+        ''' Stops polling, and waits for the background thread to finish '''
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+
+    def set_interval(self, interval, view = None):
+        '''
+        Sets the poll interval of one or all views
+
+        Parameters:
+            interval (float): Poll interval (sec)
+            view (str): View name; all views if unspecified (Optional)
+        '''
+        with self._condition:
+            for name in self._intervals:
+                if view is None or name == view:
+                    self._intervals[name] = max(0.1, interval)
+            self._condition.notify()
+
+
+    def collect(self):
+        '''
+        Retrieves and discards the latest snapshots
+
+        Returns:
+            dict<str:list>: Tabulated data (first row is header) keyed by view
+                name; 'error' keys an error message instead
+        '''
+        with self._condition:
+            snapshots = self._snapshots
+            self._snapshots = {}
+        return snapshots
+
+
+    def _run(self):
+        ''' Polls each view whenever its interval elapses '''
+        try:
+            connection = psycopg2.connect(**self._connect_kwargs)
+            connection.autocommit = True # Fresh statistics on every query
+        except psycopg2.Error as e:
+            self._report_error('Connection error %s'%(str(e)))
+            return
+
+        # Prefer wait events on servers that report them (9.6+).
+        if connection.server_version >= 90600:
+            waiting = "coalesce(wait_event_type || ': ' || wait_event, '')"
+        else:
+            waiting = "CASE WHEN waiting THEN 'Lock' ELSE '' END"
+        try:
+            cursor = connection.cursor()
+
+            # Prepare each view's query once, since every poll repeats it.
+            queries = {}
+            for view, (header, query) in monitor_views.items():
+                statement = sql.Identifier('monitor_' + view)
+                cursor.execute(sql.SQL('PREPARE {} AS {}').format(
+                    statement, sql.SQL(query.format(waiting = waiting))
+                ))
+                queries[view] = (header, sql.SQL('EXECUTE {};').format(statement))
+
+            polled = {view: None for view in queries}
+            while self._running:
+
+                # Poll views that are due.
+                for view, (header, query) in queries.items():
+                    if (polled[view] is None
+                        or time.monotonic() - polled[view] >= self._intervals[view]
+                    ):
+                        cursor.execute(query)
+                        table = [header] + cursor.fetchall()
+                        polled[view] = time.monotonic()
+                        with self._condition:
+                            self._snapshots[view] = table
+
+                # Sleep until the next poll is due or polling is reconfigured.
+                with self._condition:
+                    if self._running:
+                        due = min(
+                            polled[view] + self._intervals[view]
+                            for view in queries
+                        )
+                        self._condition.wait(max(0, due - time.monotonic()))
+            cursor.close()
+        except psycopg2.Error as e:
+            self._report_error('Monitor error %s'%(str(e)))
+        finally:
+            connection.close()
+
+
+    def _report_error(self, error_message):
+        '''
+        Stops polling and stores the given error for pickup
+
+        Parameters:
+            error_message (str): Message indicating an error
+        '''
+        with self._condition:
+            self._running = False
+            self._snapshots['error'] = error_message
@@ -1,20 +1,81 @@
 #!/bin/env python3
 
 
+import argparse
+import os
 from dbmanager import DatabaseManager
 from ui import build_ui
-from uiframework import signals
+from uiframework import signals, Profiler, SessionRecorder, SessionReplayer
+from uiframework.core import key_from_char
 
 
 def main():
+    # Parse command line options.
+    parser = argparse.ArgumentParser(description = 'Curses-based PostgreSQL client')
+    parser.add_argument('--record', metavar = 'FILE',
+                        help = 'record keystrokes of this session to a file')
+    parser.add_argument('--replay', metavar = 'FILE',
+                        help = 'replay a recorded session, then exit')
+    parser.add_argument('--realtime', action = 'store_true',
+                        help = 'replay with recorded timing instead of full speed')
+    parser.add_argument('--profile', metavar = 'FILE',
+                        default = os.environ.get('UI_PROFILE'),
+                        help = 'profile the user interface (F12 toggles an overlay), '
+                               'then write timings readable by pstats to a file; '
+                               'also enabled by the UI_PROFILE variable')
+    parser.add_argument('--trace-signals', action = 'store_true',
+                        help = 'trace forwarded signals, then summarize them')
+    args = parser.parse_args()
+
+    # Trace signals from the start, if requested.
+    if args.trace_signals:
+        signals.SignalRouter.start_tracing()
+
     # Initialize database manager (model), UI (view), and signal router (hub).
     signal_router = signals.SignalRouter()
     dbm = DatabaseManager(signal_router)
     ui = build_ui(signal_router)
 
+    # Record or replay user input, if requested.
+    recorder = None
+    replayer = None
+    if args.replay:
+        replayer = SessionReplayer.load(
+            args.replay, args.realtime,
+            lambda: signal_router.forward(signals.Signal('UI_EXIT'))
+        )
+        ui.set_input_source(replayer)
+    elif args.record:
+        recorder = SessionRecorder()
+        ui.set_input_source(recorder)
+
+    # Profile the user interface, if requested.
+    profiler = None
+    if args.profile:
+        profiler = Profiler(show_overlay = True)
+        ui.set_profiler(profiler)
+
     # Run the application.
     ui.run()
 
+    # Save the recorded session, or report the latency of each replayed step.
+    if recorder:
+        recorder.save(args.record)
+    if replayer or profiler or args.trace_signals:
+        import curses
+        curses.endwin()
+    if replayer:
+        print(replayer.report(key_from_char))
+
+    # Save and summarize profiled timings.
+    if profiler:
+        profiler.dump(args.profile)
+        print(profiler.report(20))
+
+    # Summarize traced signals.
+    if args.trace_signals:
+        print(signals.SignalRouter.stop_tracing().report())
+
 
 if __name__ == '__main__':
     try:
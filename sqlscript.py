@@ -0,0 +1,356 @@
+# Filename: sqlscript.py
+# Creation Date: Mon 19 Oct 2026
+# Last Modified: Mon 19 Oct 2026
+
+
+import re
+import time
+import psycopg2
+import psycopg2.extensions
+import psycopg2.extras
+
+
+# Tokens that can hide a statement terminator, or that end a statement: quoted
+# literals & identifiers, dollar quotes, comments, and semicolons.
+token_pattern = re.compile(r"""
+    (?P<quote>(?<!\w)[Ee]'(?:[^'\\]|\\.|'')*'?|'(?:[^']|'')*'?|"(?:[^"]|"")*"?)
+    |(?P<dollar>(?<![\w$])\$(?:[A-Za-z_]\w*)?\$)
+    |(?P<line>--[^\n]*)
+    |(?P<block>/\*)
+    |(?P<end>;)
+""", re.VERBOSE)
+
+# Statements run in batches of consecutive statements when they match.
+batch_pattern = re.compile(r'INSERT\s+INTO\b(?!.*\bRETURNING\b)', re.IGNORECASE | re.DOTALL)
+
+# Maximum number of batched statements sent to the server per round trip.
+page_size = 100
+
+
+def split_statements(script):
+    '''
+    Splits a script into statements on semicolons that are not quoted or
+    commented out; comments preceding a statement are dropped, as are empty
+    statements
+
+    Parameters:
+        script (str): Text of SQL script
+
+    Returns:
+        list<tuple>: Line number (starting at 1) and text of each statement
+    '''
+    statements = []
+    start = None # Offset of current statement's first token
+    i = 0
+    while True:
+        match = token_pattern.search(script, i)
+        stop = match.start() if match else len(script)
+
+        # Start the statement at its first token, skipping whitespace.
+        if start is None and script[i:stop].strip():
+            start = i + len(script[i:stop]) - len(script[i:stop].lstrip())
+        if not match:
+            break
+
+        kind = match.lastgroup
+        if start is None and kind in ('quote', 'dollar'):
+            start = match.start()
+        if kind == 'end':
+            if start is not None:
+                statements.append(_statement(script, start, stop))
+                start = None
+            i = match.end()
+        elif kind == 'dollar':
+            close = script.find(match.group(), match.end())
+            i = close + len(match.group()) if close >= 0 else len(script)
+        elif kind == 'block':
+            i = _skip_comment(script, match.end())
+        else:
+            i = match.end()
+
+    if start is not None:
+        statements.append(_statement(script, start, len(script)))
+    return statements
+
+
+def _statement(script, start, stop):
+    '''
+    Extracts a statement from a script
+
+    Parameters:
+        script (str): Text of SQL script
+        start (int): Offset of the statement's first token
+        stop (int): Offset following the statement's last character
+
+    Returns:
+        tuple: Line number (starting at 1) and text of the statement
+    '''
+    return (script.count('\n', 0, start) + 1, script[start:stop].rstrip())
+
+
+def _skip_comment(script, i):
+    '''
+    Skips a block comment, which may contain nested block comments
+
+    Parameters:
+        script (str): Text of SQL script
+        i (int): Offset following the comment's opening delimiter
+
+    Returns:
+        int: Offset following the comment's closing delimiter
+    '''
+    depth = 1
+    while depth:
+        close = script.find('*/', i)
+        if close < 0:
+            return len(script)
+        nested = script.find('/*', i, close)
+        if nested >= 0:
+            depth += 1
+            i = nested + 2
+        else:
+            depth -= 1
+            i = close + 2
+    return i
+
+
+class ScriptRunner():
+    '''
+    Runs the statements of a script a few at a time, timing each statement and
+    collecting its results as text; in a single transaction, consecutive
+    INSERT statements are sent to the server in batches
+
+    Attributes:
+        _autocommit (bool): Flag indicating if each statement is committed as
+            it runs, rather than the script as a single transaction
+        _statements (list<tuple>): Line number and text of each statement
+        _cursor (cursor): psycopg2 cursor running the script; None until the
+            script is started, and after it has finished
+        _lines (list<str>): Lines of the report
+        _completed (int): Number of statements run successfully
+        _elapsed (float): Total time (sec) spent running statements
+        _error (str): Message of the error that stopped the script; None if
+            no statement has failed
+    '''
+    @property
+    def completed(self):
+        ''' Getter for "completed" property '''
+        return self._completed
+
+
+    @property
+    def elapsed(self):
+        ''' Getter for "elapsed" property '''
+        return self._elapsed
+
+
+    @property
+    def error(self):
+        ''' Getter for "error" property '''
+        return self._error
+
+
+    def __init__(self, script, autocommit = False):
+        '''
+        Parameters:
+            script (str): Text of SQL script
+            autocommit (bool): _autocommit attribute initializer (Optional)
+        '''
+        self._autocommit = autocommit
+        self._statements = split_statements(script)
+        self._cursor = None
+        self._lines = []
+        self._completed = 0
+        self._elapsed = 0.0
+        self._error = None
+
+
+    def __len__(self):
+        return len(self._statements)
+
+
+    def is_done(self):
+        '''
+        Checks if the script has finished
+
+        Returns:
+            bool: True if every statement has run, or one has failed
+        '''
+        return self._error is not None or self._completed == len(self._statements)
+
+
+    def start(self, cursor):
+        '''
+        Prepares to run the script with the given cursor, switching its
+        connection to the script's transaction mode
+
+        Parameters:
+            cursor (cursor): psycopg2 cursor object
+        '''
+        connection = cursor.connection
+
+        # Leave any transaction in progress before switching modes.
+        connection.commit()
+        connection.autocommit = self._autocommit
+        self._cursor = cursor
+        if self.is_done():
+            self._finish()
+
+
+    def step(self, budget = 0.1):
+        '''
+        Runs statements until the given time has been spent, stopping at the
+        first failure; in a single transaction, a failure rolls back every
+        statement
+
+        Parameters:
+            budget (float): Time (sec) after which no further statement is
+                started (Optional)
+
+        Returns:
+            bool: True if the script has finished
+        '''
+        if not self._cursor:
+            return self.is_done()
+
+        deadline = time.perf_counter() + budget
+        while not self.is_done() and time.perf_counter() < deadline:
+            self._run_next()
+        if self.is_done():
+            self._finish()
+        return self.is_done()
+
+
+    def stop(self):
+        ''' Abandons the script, rolling back any uncommitted statements '''
+        if not self._cursor:
+            return
+        cursor = self._cursor
+        self._cursor = None
+        try:
+            cursor.connection.rollback()
+            cursor.connection.autocommit = False
+            cursor.close()
+        except psycopg2.Error:
+            pass
+
+
+    def report(self):
+        '''
+        Formats the report of the statements run so far
+
+        Returns:
+            str: Status, timing, and results of each statement
+        '''
+        return '\n'.join(self._lines)
+
+
+    def _run_next(self):
+        ''' Runs the next statement, or the next batch of statements '''
+        cursor = self._cursor
+        connection = cursor.connection
+        statements = self._statements
+        i = self._completed
+
+        # Gather consecutive statements that can be batched; batches are not
+        # committed statement by statement.
+        stop = i + 1
+        if not self._autocommit and batch_pattern.match(statements[i][1]):
+            while (stop < len(statements) and stop - i < page_size
+                and batch_pattern.match(statements[stop][1])
+            ):
+                stop += 1
+
+        start_time = time.perf_counter()
+        try:
+            if stop - i > 1:
+                psycopg2.extras.execute_batch(
+                    cursor, '%s',
+                    [(psycopg2.extensions.AsIs(text),) for line, text in statements[i:stop]],
+                    page_size
+                )
+            else:
+                cursor.execute(statements[i][1])
+            if not self._autocommit and stop == len(statements):
+                connection.commit()
+        except psycopg2.Error as e:
+            connection.rollback()
+            self._fail(cursor, i, stop, e)
+            return
+        elapsed = time.perf_counter() - start_time
+        self._elapsed += elapsed
+
+        self._report(cursor, i, stop, elapsed)
+        self._completed = stop
+
+
+    def _finish(self):
+        ''' Restores the connection's transaction mode and summarizes the run '''
+        cursor = self._cursor
+        self._cursor = None
+        cursor.connection.autocommit = False
+        cursor.close()
+
+        if self._error is None:
+            self._lines.append('Ran {} statement(s) in {:.1f} ms'.format(
+                self._completed, 1000 * self._elapsed
+            ))
+        elif self._autocommit:
+            self._lines.append('Stopped; {} statement(s) committed'.format(self._completed))
+        else:
+            self._lines.append('Rolled back {} statement(s)'.format(self._completed))
+
+
+    def _report(self, cursor, start, stop, elapsed):
+        '''
+        Adds the status, timing, and any results of a run to the report
+
+        Parameters:
+            cursor (cursor): psycopg2 cursor object
+            start (int): Index of the first statement run
+            stop (int): Index following the last statement run
+            elapsed (float): Duration (sec) of the run
+        '''
+        if stop - start > 1:
+            self._lines.append('[{}-{}/{}] {} x INSERT ({:.1f} ms)'.format(
+                start + 1, stop, len(self), stop - start, 1000 * elapsed
+            ))
+            return
+
+        self._lines.append('[{}/{}] {} ({:.1f} ms)'.format(
+            stop, len(self), cursor.statusmessage, 1000 * elapsed
+        ))
+        if cursor.description:
+            self._lines.append(' | '.join(column[0] for column in cursor.description))
+            for record in cursor.fetchall():
+                self._lines.append(' | '.join(
+                    'NULL' if value is None else value for value in record
+                ))
+            self._lines.append('')
+
+
+    def _fail(self, cursor, start, stop, error):
+        '''
+        Adds the failure of a run to the report, naming the failed statement
+
+        Parameters:
+            cursor (cursor): psycopg2 cursor object
+            start (int): Index of the first statement run
+            stop (int): Index following the last statement run
+            error (psycopg2.Error): Error raised by the run
+        '''
+        message = (error.pgerror or str(error)).strip()
+
+        # A batch fails as a whole, so its statements are identified only by
+        # the lines they span.
+        first_line = self._statements[start][0]
+        last_line = self._statements[stop - 1][0]
+        if first_line == last_line:
+            where = 'line {}'.format(first_line)
+        else:
+            where = 'lines {}-{}'.format(first_line, last_line)
+        self._lines.append('[{}/{}] ERROR at {}: {}'.format(
+            start + 1 if stop - start == 1 else '{}-{}'.format(start + 1, stop),
+            len(self), where, message
+        ))
+        self._error = message
@@ -0,0 +1,326 @@
+# Filename: db_benchmark.py
+# Creation Date: Mon 19 Oct 2026
+# Last Modified: Mon 19 Oct 2026
+
+
+# Benchmarks the database manager against a throwaway local PostgreSQL cluster
+# loaded with the bundled "booktown" dump plus synthetic tables, and prints the
+# results as JSON. Requires the PostgreSQL server binaries (initdb, pg_ctl) and
+# client tools (pg_dump, pg_restore), run by a user other than root.
+#
+# Usage: python3 tests/db_benchmark.py [--rows N] [--tables N] [--repeat N]
+#                                      [--output FILE]
+
+
+import argparse
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import psycopg2
+from dbmanager import DatabaseManager
+from uiframework import signals
+
+
+repo_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+username = 'bench'
+
+
+def find_binary(name):
+    '''
+    Locates a PostgreSQL binary on the path or in the server's bin directory
+
+    Parameters:
+        name (str): Name of binary
+
+    Returns:
+        str: Path to binary
+    '''
+    path = shutil.which(name)
+    if path:
+        return path
+    try:
+        bindir = subprocess.check_output(['pg_config', '--bindir']).decode().strip()
+        path = os.path.join(bindir, name)
+        if os.path.exists(path):
+            return path
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    sys.exit('Could not find {}; install the PostgreSQL server'.format(name))
+
+
+def free_port():
+    '''
+    Finds an unused TCP port on the loopback interface
+
+    Returns:
+        int: Port number
+    '''
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+class Cluster():
+    '''
+    Throwaway PostgreSQL cluster in a temporary directory
+
+    Attributes:
+        directory (str): Temporary directory holding the cluster
+        port (int): Port number on which the server listens
+    '''
+    def __init__(self):
+        self.directory = tempfile.mkdtemp(prefix = 'db_benchmark_')
+        self.port = free_port()
+
+
+    def start(self):
+        ''' Initializes and starts the cluster '''
+        data = os.path.join(self.directory, 'data')
+        subprocess.check_call(
+            [find_binary('initdb'), '-D', data, '-U', username, '-A', 'trust',
+             '-E', 'UTF8', '--no-sync'],
+            stdout = subprocess.DEVNULL
+        )
+        options = "-p {} -k {} -c listen_addresses=127.0.0.1 -c fsync=off".format(
+            self.port, self.directory
+        )
+        subprocess.check_call(
+            [find_binary('pg_ctl'), '-D', data, '-o', options, '-w',
+             '-l', os.path.join(self.directory, 'server.log'), 'start'],
+            stdout = subprocess.DEVNULL
+        )
+
+
+    def stop(self):
+        ''' Stops the cluster and removes its directory '''
+        data = os.path.join(self.directory, 'data')
+        if os.path.isdir(data):
+            subprocess.call(
+                [find_binary('pg_ctl'), '-D', data, '-m', 'immediate', 'stop'],
+                stdout = subprocess.DEVNULL
+            )
+        shutil.rmtree(self.directory, ignore_errors = True)
+
+
+    def connect(self, database = 'postgres'):
+        '''
+        Opens an administrative connection
+
+        Parameters:
+            database (str): Database name (Optional)
+
+        Returns:
+            connection: psycopg2 connection in autocommit mode
+        '''
+        connection = psycopg2.connect(
+            dbname = database, user = username, host = '127.0.0.1', port = self.port
+        )
+        connection.autocommit = True
+        return connection
+
+
+def load_data(cluster, tables, rows):
+    '''
+    Loads the booktown dump and synthetic tables into the "booktown" database
+
+    Parameters:
+        cluster (Cluster): Running cluster
+        tables (int): Number of synthetic tables
+        rows (int): Number of rows per synthetic table
+    '''
+    connection = cluster.connect()
+    connection.cursor().execute('CREATE DATABASE booktown')
+    connection.close()
+
+    # Restore the bundled dump; objects the server cannot restore are skipped.
+    subprocess.call(
+        [find_binary('pg_restore'), '-h', '127.0.0.1', '-p', str(cluster.port),
+         '-U', username, '-O', '-d', 'booktown', os.path.join(repo_dir, 'booktown')],
+        stdout = subprocess.DEVNULL, stderr = subprocess.DEVNULL
+    )
+
+    # Generate synthetic tables of mixed column types.
+    connection = cluster.connect('booktown')
+    cursor = connection.cursor()
+    for i in range(tables):
+        cursor.execute("""CREATE TABLE synthetic_{0} (
+            id serial PRIMARY KEY, name text, amount numeric(12, 2),
+            created timestamp, active boolean)""".format(i))
+        cursor.execute("""INSERT INTO synthetic_{0} (name, amount, created, active)
+            SELECT md5(g::text), g * 0.01, now() - g * interval '1 minute', g %% 2 = 0
+            FROM generate_series(1, %s) g""".format(i), (rows,))
+    cursor.execute('ANALYZE')
+    connection.close()
+
+
+def time_calls(samples, function, *args, **kwargs):
+    '''
+    Times a call and records the elapsed time
+
+    Parameters:
+        samples (list<float>): Elapsed times (sec) to append to
+        function (function|method): Function to call
+        args, kwargs: Arguments to call the function with
+
+    Returns:
+        Result of the call
+    '''
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    samples.append(time.perf_counter() - start)
+    return result
+
+
+def run_raw(dbm, raw):
+    '''
+    Runs a raw query to completion, stepping through its statements as the
+    user interface would while idle
+
+    Parameters:
+        dbm (DatabaseManager): Database manager connected to the cluster
+        raw (str): Literal form of query
+
+    Returns:
+        str: Query result
+    '''
+    result = dbm.query_raw(raw)
+    while dbm._script:
+        result = dbm._step_script()
+    return result
+
+
+def run_benchmarks(cluster, dbm, tables, repeat):
+    '''
+    Times the database manager's operations
+
+    Parameters:
+        cluster (Cluster): Running cluster
+        dbm (DatabaseManager): Database manager connected to the cluster
+        tables (int): Number of synthetic tables
+        repeat (int): Number of samples per operation
+
+    Returns:
+        dict<str:list<float>>: Elapsed times (sec) keyed by operation
+    '''
+    results = {}
+    def samples(name):
+        return results.setdefault(name, [])
+
+    dbm.set_database('booktown')
+    for i in range(repeat):
+
+        # List tables; each raw query below discards the cached relation tree.
+        time_calls(samples('list_tables'), dbm.list_tables)
+
+        # List the contents and structure of each synthetic table.
+        for j in range(tables):
+            dbm.set_table('synthetic_{}'.format(j))
+            dbm.set_content_mode(False)
+            time_calls(samples('list_table_content'), dbm.list_table_content)
+            dbm.set_content_mode(True)
+            time_calls(samples('list_table_content_preview'), dbm.list_table_content)
+            time_calls(samples('list_table_structure'), dbm.list_table_structure)
+
+        # Run raw queries.
+        time_calls(samples('query_raw'), run_raw, dbm,
+                   'SELECT count(*), sum(amount) FROM synthetic_0;')
+
+        # Run a script of single-row inserts, batched within one transaction
+        # and then committed one at a time.
+        script = 'CREATE TABLE IF NOT EXISTS script_rows (i int, note text);\n' + ''.join(
+            "INSERT INTO script_rows VALUES ({0}, 'row {0}');\n".format(k) for k in range(1000)
+        )
+        for autocommit in (False, True):
+            dbm.set_script_mode(autocommit)
+            time_calls(
+                samples('query_raw_script_autocommit' if autocommit else 'query_raw_script'),
+                run_raw, dbm, script
+            )
+        dbm.set_script_mode(False)
+
+        # Export the database, waiting for pg_dump to finish.
+        start = time.perf_counter()
+        dbm.export_db(cluster.directory, 'export.dump', plain = False)
+        dbm._transfer_process.wait()
+        samples('export_db').append(time.perf_counter() - start)
+
+    # Import the exported database into fresh databases.
+    connection = cluster.connect()
+    for i in range(repeat):
+        database = 'import_{}'.format(i)
+        connection.cursor().execute('CREATE DATABASE {}'.format(database))
+        dbm.set_database(database)
+        start = time.perf_counter()
+        dbm.import_db(cluster.directory, 'export.dump')
+        dbm._transfer_process.wait()
+        samples('import_db').append(time.perf_counter() - start)
+    dbm.disconnect()
+    connection.close()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description = 'DatabaseManager benchmark')
+    parser.add_argument('--rows', type = int, default = 100000,
+                        help = 'rows per synthetic table')
+    parser.add_argument('--tables', type = int, default = 3,
+                        help = 'number of synthetic tables')
+    parser.add_argument('--repeat', type = int, default = 5,
+                        help = 'samples per operation')
+    parser.add_argument('--output', help = 'file to write JSON results to')
+    args = parser.parse_args()
+
+    # Collect error feedback from the database manager.
+    errors = []
+    def collect_feedback(message, error, **kwargs):
+        if error:
+            errors.append(message)
+    signal_router = signals.SignalRouter()
+    signal_router.register('UI_FEEDBACK', collect_feedback)
+
+    cluster = Cluster()
+    try:
+        cluster.start()
+        load_data(cluster, args.tables, args.rows)
+        dbm = DatabaseManager(signal_router)
+        dbm.connect('127.0.0.1', cluster.port, username, '')
+        server_version = dbm._database_state.server_version
+        results = run_benchmarks(cluster, dbm, args.tables, args.repeat)
+    finally:
+        cluster.stop()
+
+    # Summarize results.
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'server_version': server_version,
+        'rows': args.rows,
+        'tables': args.tables,
+        'repeat': args.repeat,
+        'errors': errors,
+        'results': {
+            name: {
+                'min': min(samples), 'max': max(samples),
+                'mean': sum(samples) / len(samples), 'samples': samples
+            }
+            for name, samples in results.items()
+        }
+    }
+    output = json.dumps(report, indent = 2, sort_keys = True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,7 +4,10 @@
 # Author: Brett Fedack
 
 
-from uiframework import signals
+import random
+import time
+import zlib
+from uiframework import signals, ResultBatch
 
 
 # NOTE: By convention, signals with "UI_" prefix are sent to the user
@@ -74,6 +77,217 @@ HAL: But you\'ll look sweet upon the seat of a bicycle built for two.\
 '''
 
 
+# Column types of synthetic tables, each mapped to its structure listing.
+synthetic_types = {
+    'int': ['integer', 'NO', '', 'NULL', ''],
+    'text': ['varchar({width})', 'YES', '', '', ''],
+    'numeric': ['numeric(12,2)', 'YES', '', 'NULL', ''],
+    'date': ['date', 'YES', '', 'NULL', ''],
+    'bool': ['boolean', 'YES', '', 'false', '']
+}
+
+# Type OIDs of the column types of synthetic tables.
+synthetic_type_codes = {'int': 23, 'text': 1043, 'numeric': 1700, 'date': 1082, 'bool': 16}
+
+
+class SyntheticDataset():
+    '''
+    Generated stand-in for a server's databases, scalable to production-size
+    volumes; table contents are generated lazily, a row at a time
+
+    Attributes:
+        _databases (dict<str:list<str>>): Table names keyed by database name
+        _rows (int): Number of rows per table
+        _columns (list<str>): Column types of each table, in
+            {'int', 'text', 'numeric', 'date', 'bool'}
+        _string_width (int): Width of generated text values
+        _latency (float): Artificial delay (sec) of each query
+        _pool (str): Random characters from which text values are sliced
+    '''
+    @property
+    def databases(self):
+        ''' Getter for "databases" property '''
+        return self._databases
+
+
+    def __init__(self, databases = 2, tables = 10, rows = 1000,
+                 columns = ['int', 'text', 'text', 'numeric', 'date', 'bool'],
+                 string_width = 16, latency = 0, seed = 0                    ):
+        '''
+        Parameters:
+            databases (int): Number of databases (Optional)
+            tables (int): Number of tables per database (Optional)
+            rows (int): Number of rows per table (Optional)
+            columns (list<str>): Column types of each table (Optional)
+            string_width (int): Width of generated text values (Optional)
+            latency (float): Artificial delay (sec) of each query (Optional)
+            seed (int): Seed for generated values (Optional)
+        '''
+        for column in columns:
+            if column not in synthetic_types:
+                raise ValueError('Unknown column type "{}"'.format(column))
+        self._databases = {
+            'database_{:04}'.format(i): [
+                'table_{:06}'.format(j) for j in range(tables)
+            ]
+            for i in range(databases)
+        }
+        self._rows = rows
+        self._columns = list(columns)
+        self._string_width = string_width
+        self._latency = latency
+        generator = random.Random(seed)
+        self._pool = ''.join(
+            generator.choice('abcdefghijklmnopqrstuvwxyz ') for i in range(4096)
+        )
+
+
+    def delay(self):
+        ''' Simulates the latency of a query '''
+        if self._latency > 0:
+            time.sleep(self._latency)
+
+
+    def table_content(self, database, table):
+        '''
+        Lists the contents of the given table
+
+        Parameters:
+            database (str): Database name
+            table (str): Table name
+
+        Returns:
+            SyntheticTable: Lazily generated rows (first is header)
+        '''
+        seed = zlib.crc32('{}.{}'.format(database, table).encode()) & 0xffff
+        return SyntheticTable(self, seed, self._rows)
+
+
+    def table_batch(self, database, table):
+        '''
+        Lists the contents of the given table as a typed result batch, as the
+        database manager transmits them
+
+        Parameters:
+            database (str): Database name
+            table (str): Table name
+
+        Returns:
+            ResultBatch: Typed columns of table rows
+        '''
+        rows = self.table_content(database, table)
+        return ResultBatch.from_rows(
+            rows[0], [synthetic_type_codes[column] for column in self._columns],
+            rows[1:]
+        )
+
+
+    def table_structure(self):
+        '''
+        Lists the structure shared by all tables
+
+        Returns:
+            list<list>: List of table structure (first is header)
+        '''
+        structure = [['Field', 'Type', 'Null', 'Key', 'Default', 'Extra']]
+        for i, column in enumerate(self._columns):
+            listing = [
+                item.format(width = self._string_width)
+                for item in synthetic_types[column]
+            ]
+            structure.append(['{}_{}'.format(column, i)] + listing)
+        return structure
+
+
+    def generate_row(self, table_seed, i):
+        '''
+        Generates a row of a table; the same row is generated every time
+
+        Parameters:
+            table_seed (int): Seed distinguishing the table
+            i (int): Row index
+
+        Returns:
+            list: Row of values
+        '''
+        pool = self._pool
+        width = self._string_width
+        row = []
+        for j, column in enumerate(self._columns):
+            mix = ((i + 1) * 2654435761 + j * 40503 + table_seed) & 0xffffffff
+            if column == 'int':
+                row.append(i + 1 if j == 0 else mix % 100000)
+            elif column == 'text':
+                offset = mix % (len(pool) - width)
+                row.append(pool[offset:offset + width])
+            elif column == 'numeric':
+                row.append('{:.2f}'.format(mix % 10000000 / 100))
+            elif column == 'date':
+                row.append('{:04}-{:02}-{:02}'.format(
+                    1970 + mix % 50, 1 + mix % 12, 1 + mix % 28
+                ))
+            else:
+                row.append('t' if mix & 1 else 'f')
+        return row
+
+
+class SyntheticTable():
+    '''
+    Lazily generated table contents, indexable like a list of rows whose first
+    row is the header
+
+    Attributes:
+        _dataset (SyntheticDataset): Dataset generating the rows
+        _seed (int): Seed distinguishing this table
+        _rows (int): Number of rows, excluding the header
+        _header (list<str>): Column names
+    '''
+    def __init__(self, dataset, seed, rows):
+        '''
+        Parameters:
+            dataset (SyntheticDataset): Dataset generating the rows
+            seed (int): Seed distinguishing this table
+            rows (int): Number of rows, excluding the header
+        '''
+        self._dataset = dataset
+        self._seed = seed
+        self._rows = rows
+        self._header = [row[0] for row in dataset.table_structure()[1:]]
+
+
+    def __len__(self):
+        return self._rows + 1
+
+
+    def __iter__(self):
+        return (self._get_row(i) for i in range(len(self)))
+
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get_row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('table row index out of range')
+        return self._get_row(index)
+
+
+    def _get_row(self, i):
+        '''
+        Generates a row
+
+        Parameters:
+            i (int): Row index (0 is header)
+
+        Returns:
+            list: Row of values
+        '''
+        if i == 0:
+            return list(self._header)
+        return self._dataset.generate_row(self._seed, i - 1)
+
+
 class DatabaseManager():
     '''
     Database manager class that exposes both method-based and signal-based
@@ -92,12 +306,16 @@ class DatabaseManager():
         _connected (bool): Flag indicating if component is connect to a server
         _database_curr (str): Name of currently selected database
         _table_curr (str): Name of currently selected table
+        _dataset (SyntheticDataset): Generated data to serve instead of the
+            fixed mock data, if any
     '''
-    def __init__(self, signal_router = None):
+    def __init__(self, signal_router = None, dataset = None):
         '''
         Parameters:
             signal_router (SignalRouter): Signal router to use for this
                 component (Optional)
+            dataset (SyntheticDataset): Generated data to serve instead of the
+                fixed mock data (Optional)
         '''
         # Associate a signal router with this component.
         self._signal_router = signal_router if signal_router else signals.SignalRouter()
@@ -112,6 +330,7 @@ class DatabaseManager():
         self._connected = False
         self._database_curr = ''
         self._table_curr = ''
+        self._dataset = dataset
 
         # Setup signal handling.
         self._add_signal_handler('DB_CONNECT', self.connect)
@@ -181,6 +400,19 @@ class DatabaseManager():
         self._emit('UI_FEEDBACK', message = success_message, error = False)
 
 
+    def _databases(self):
+        '''
+        Retrieves the served databases, simulating query latency
+
+        Returns:
+            dict<str:list<str>>: Table names keyed by database name
+        '''
+        if self._dataset:
+            self._dataset.delay()
+            return self._dataset.databases
+        return mock_databases
+
+
     def connect(self, hostname, port, username, password, **kwargs):
         '''
         Establishes a connection with the given server
@@ -330,7 +562,7 @@ class DatabaseManager():
         if not self._connected:
             self._emit_error('Not connected to a server')
             return False
-        if not database in mock_databases: # TODO: Peewee stuff
+        if not database in self._databases(): # TODO: Peewee stuff
             self._emit_error('"{}" database not found on server'.format(database))
             return False
 
@@ -369,7 +601,7 @@ class DatabaseManager():
         if not self._database_curr:
             self._emit_error('No database selected')
             return False
-        if not table in mock_databases[self._database_curr]: # TODO: Peewee stuff
+        if not table in self._databases()[self._database_curr]: # TODO: Peewee stuff
             self._emit_error('"{}" table not found in "{}" database'.format(
                 table, self._database_curr
             ))
@@ -401,7 +633,7 @@ class DatabaseManager():
 
         # Acquire a listing of databases on the server.
         # TODO: Peewee stuff
-        database_list = list(mock_databases.keys())
+        database_list = list(self._databases().keys())
 
         # Transmit database list.
         self._emit('UI_DATABASE_LIST', databases = database_list)
@@ -428,7 +660,7 @@ class DatabaseManager():
 
         # Acquire a listing of tables in the current database.
         # TODO: Peewee stuff
-        table_list = mock_databases[self._database_curr]
+        table_list = self._databases()[self._database_curr]
 
         # Transmit table list.
         self._emit('UI_TABLE_LIST', tables = table_list)
@@ -450,7 +682,7 @@ class DatabaseManager():
         if not self._table_curr:
             self._emit_error('No table selected')
             return []
-        if not self._table_curr in mock_databases[self._database_curr]: # TODO: Peewee stuff
+        if not self._table_curr in self._databases()[self._database_curr]: # TODO: Peewee stuff
             self._emit_error('"{}" table not found in "{}" database'.format(
                 self._table_curr, self._database_curr
             ))
@@ -459,6 +691,10 @@ class DatabaseManager():
         # Acquire a listing of the current table's contents.
         # TODO: Peewee stuff
         table_content = mock_table_content
+        if self._dataset:
+            table_content = self._dataset.table_batch(
+                self._database_curr, self._table_curr
+            )
 
         # Transmit table contents.
         self._emit('UI_TABLE_CONTENT', table_content = table_content)
@@ -480,7 +716,7 @@ class DatabaseManager():
         if not self._table_curr:
             self._emit_error('No table selected')
             return []
-        if not self._table_curr in mock_databases[self._database_curr]: # TODO: Peewee stuff
+        if not self._table_curr in self._databases()[self._database_curr]: # TODO: Peewee stuff
             self._emit_error('"{}" table not found in "{}" database'.format(
                 self._table_curr, self._database_curr
             ))
@@ -489,6 +725,8 @@ class DatabaseManager():
         # Acquire a listing of the current table's structure.
         # TODO: Peewee stuff
         table_structure = mock_table_structure
+        if self._dataset:
+            table_structure = self._dataset.table_structure()
 
         # Transmit table structure.
         self._emit('UI_TABLE_STRUCTURE', table_structure = table_structure)
@@ -0,0 +1,377 @@
+# Filename: ui_benchmark.py
+# Creation Date: Mon 19 Oct 2026
+# Last Modified: Mon 19 Oct 2026
+
+
+# Benchmarks the user interface headlessly, against the mock database manager.
+#
+# Usage: python3 tests/ui_benchmark.py [--repeat N] [--json]
+#            [--databases N] [--tables N] [--rows N] [--latency SEC]
+#            [--record FILE | --replay FILE [--realtime]] [--profile FILE]
+#            [--trace] [--width N] [--height N]
+
+
+import argparse
+import curses
+import curses.ascii as ascii
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import mock_dbmanager
+from ui import build_ui
+from uiframework import (
+    screen, ContentWidget, FakeCurses, Profiler, SessionRecorder, SessionReplayer, signals
+)
+from uiframework.core import key_from_char
+
+
+# Connects to the server, from the Home tab and back.
+connect = [
+    ascii.TAB, 'h', 'localhost', ascii.ESC, 'n', '5432', ascii.ESC,
+    'c', ascii.CR, ascii.CR, curses.KEY_BTAB
+]
+
+# Typical workflow: pick a database and its first table, browse content, and run
+# a query, from the Home tab and back; database changes are confirmed.
+def workflow(database):
+    '''
+    Scripts the typical workflow
+
+    Parameters:
+        database (int): Index of database to pick
+
+    Returns:
+        list<int|str>: Keys
+    '''
+    return [
+        ascii.TAB, ascii.TAB, 'd', curses.KEY_PPAGE,
+        *[curses.KEY_DOWN] * (database + 1), ascii.CR, ascii.CR,
+        ascii.TAB, 't', curses.KEY_PPAGE, curses.KEY_DOWN, ascii.CR, ascii.CR,
+        'c', 'i', curses.KEY_DOWN, curses.KEY_RIGHT, curses.KEY_NPAGE,
+        curses.KEY_PPAGE, ascii.ESC, ascii.ESC, 's', 'i', ascii.ESC, ascii.ESC,
+        ascii.TAB, 'q', 'i', 'SELECT 1;', ascii.ESC, ascii.ESC, ascii.ESC,
+        curses.KEY_BTAB, curses.KEY_BTAB, curses.KEY_BTAB, curses.KEY_BTAB
+    ]
+
+
+def walk(widget):
+    '''
+    Iterates over the tree of widgets rooted at the given widget
+
+    Parameters:
+        widget (Widget): Root of widget tree
+    '''
+    yield widget
+    for child in widget._children:
+        yield from walk(child)
+
+
+def instrument_draw(root, draw_times):
+    '''
+    Times the draw method of every widget in the given tree, including
+    deferred subtrees once built
+
+    Parameters:
+        root (Widget): Root of widget tree
+        draw_times (dict<str:list>): Accumulated time (sec) and number of
+            draws keyed by widget class and label
+    '''
+    for widget in walk(root):
+
+        # Skip widgets that are already timed.
+        if 'draw' in vars(widget):
+            continue
+
+        # Time deferred subtrees once they are built.
+        if widget._builder:
+            def build(widget = widget, build = widget._build):
+                build()
+                instrument_draw(widget, draw_times)
+            widget._build = build
+
+        key = '{}({})'.format(type(widget).__name__, widget._label)
+        draw = widget.draw
+
+        def timed_draw(draw = draw, stats = draw_times.setdefault(key, [0.0, 0])):
+            start = time.perf_counter()
+            draw()
+            stats[0] += time.perf_counter() - start
+            stats[1] += 1
+
+        widget.draw = timed_draw
+
+
+def run_workflow(repeat, dataset = None, record = None, replay = None,
+                 realtime = False, profile = None, trace = False,
+                 size = (80, 24)):
+    '''
+    Drives the user interface through the workflow, or a recorded session
+
+    Parameters:
+        repeat (int): Number of times to repeat the workflow
+        dataset (SyntheticDataset): Generated data to serve (Optional)
+        record (str): Path to which to record the workflow (Optional)
+        replay (str): Path to recorded session to replay instead of the
+            workflow (Optional)
+        realtime (bool): Flag controlling reproduction of recorded timing
+            (Optional)
+        profile (str): Path to which to write profiled timings (Optional)
+        trace (bool): Flag controlling tracing of forwarded signals (Optional)
+        size (2-tuple<int>): Width and height of the screen (Optional)
+
+    Returns:
+        dict: Benchmark results
+    '''
+    if trace:
+        signals.SignalRouter.start_tracing()
+    backend = FakeCurses(*size)
+    signal_router = signals.SignalRouter()
+    dbm = mock_dbmanager.DatabaseManager(signal_router, dataset)
+    start = time.perf_counter()
+    ui = build_ui(signal_router, backend)
+    startup = time.perf_counter() - start
+    startup_widgets = len(list(walk(ui.root)))
+    draw_times = {}
+    instrument_draw(ui.root, draw_times)
+
+    # Replay a recorded session, exiting at its end.
+    exit_ui = lambda: signal_router.forward(signals.Signal('UI_EXIT'))
+    replayer = None
+    if replay:
+        replayer = SessionReplayer.load(replay, realtime, exit_ui)
+        ui.set_input_source(replayer)
+
+    # Otherwise, script the workflow, recording it if requested.
+    else:
+        backend.feed(*connect)
+        for i in range(repeat):
+            backend.feed(*workflow(i % 2))
+        backend.feed(exit_ui)
+        keys = backend.pending() - 1
+        if record:
+            recorder = SessionRecorder()
+            ui.set_input_source(recorder)
+
+    # Profile the user interface, if requested.
+    profiler = None
+    if profile:
+        profiler = Profiler()
+        ui.set_profiler(profiler)
+
+    # Run the user interface until the script ends.
+    start = time.perf_counter()
+    ui.run()
+    elapsed = time.perf_counter() - start
+    for e in ui._error_log:
+        raise e
+    if replayer:
+        keys = len(replayer.latencies)
+    elif record:
+        recorder.save(record)
+    if profiler:
+        profiler.dump(profile)
+
+    results = {
+        'startup': startup,
+        'startup_widgets': startup_widgets,
+        'widgets': len(list(walk(ui.root))),
+        'windows': sum(
+            type(widget._win) is not screen.Region for widget in walk(ui.root)
+        ),
+        'keys': keys,
+        'frames': backend.frames,
+        'elapsed': elapsed,
+        'frames_per_sec': backend.frames / elapsed,
+        'widget_draw': {
+            key: {'total': stats[0], 'count': stats[1], 'mean': stats[0] / stats[1]}
+            for key, stats in draw_times.items() if stats[1]
+        }
+    }
+    if profiler:
+        results['profile'] = profiler.report(20)
+    if trace:
+        results['signals'] = signals.SignalRouter.stop_tracing().summary()
+    if replayer:
+        results['steps'] = [
+            {'key': key_from_char(c), 'latency': latency}
+            for c, latency in replayer.latencies
+        ]
+    return results
+
+
+def time_dispatch(iterations, dataset = None):
+    '''
+    Times the forwarding of signals through the user interface
+
+    Parameters:
+        iterations (int): Number of times to forward each signal
+        dataset (SyntheticDataset): Generated data to serve (Optional)
+
+    Returns:
+        dict<str:float>: Mean time (sec) per forwarded signal keyed by name
+    '''
+    backend = FakeCurses()
+    signal_router = signals.SignalRouter()
+    dbm = mock_dbmanager.DatabaseManager(signal_router, dataset)
+    ui = build_ui(signal_router, backend)
+
+    # Forward signals that are idle, routed to a handler, and flushed through
+    # the entire widget tree.
+    table = mock_dbmanager.mock_table_content
+    if dataset:
+        database, tables = next(iter(dataset.databases.items()))
+        table = dataset.table_batch(database, tables[0])
+    signals_list = [
+        signals.Signal('UI_IDLE'),
+        signals.Signal('UI_UPDATE_STATUS', {'status': 'benchmark'}),
+        signals.Signal('UI_TABLE_CONTENT', {'table_content': table})
+    ]
+    results = {}
+    for signal in signals_list:
+        start = time.perf_counter()
+        for i in range(iterations):
+            signal_router.forward(signal)
+        results[signal.data['_name']] = (time.perf_counter() - start) / iterations
+    return results
+
+
+def time_draw_text(iterations, size = (80, 24)):
+    '''
+    Times drawing a screenful of rows line by line through the generic text
+    path, and as a block through the bulk path
+
+    Parameters:
+        iterations (int): Number of times to draw the rows
+        size (2-tuple<int>): Width and height of the screen (Optional)
+
+    Returns:
+        dict<str:float>: Mean time (sec) per drawn block keyed by path
+    '''
+    backend = FakeCurses(*size)
+    ui = build_ui(signals.SignalRouter(), backend)
+    widget = ContentWidget('Benchmark', ui.root)
+    widget._win = widget._win.allocate()
+    width, height = widget.get_size()
+    margin = [2, 3, 1, 1]
+    lines = [
+        ''.join('{:<12}'.format('cell_{}_{}'.format(i, j)) for j in range(width // 10))
+        for i in range(height - margin[2] - margin[3])
+    ]
+
+    def draw_generic():
+        for i, line in enumerate(lines):
+            widget.draw_text(line, row = margin[2] + i, margin = margin, fit = 'NO_WRAP')
+
+    def draw_bulk():
+        widget.draw_rows(lines, row = margin[2], margin = margin)
+
+    results = {}
+    for name, draw in (('draw_text', draw_generic), ('draw_rows', draw_bulk)):
+        start = time.perf_counter()
+        for i in range(iterations):
+            draw()
+        results[name] = (time.perf_counter() - start) / iterations
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Headless UI benchmark')
+    parser.add_argument('--repeat', type = int, default = 10,
+                        help = 'number of workflow repetitions')
+    parser.add_argument('--json', action = 'store_true',
+                        help = 'print results as JSON')
+    parser.add_argument('--databases', type = int,
+                        help = 'serve this many synthetic databases')
+    parser.add_argument('--tables', type = int,
+                        help = 'serve this many synthetic tables per database')
+    parser.add_argument('--rows', type = int,
+                        help = 'serve this many rows per synthetic table')
+    parser.add_argument('--latency', type = float, default = 0,
+                        help = 'artificial delay (sec) of each synthetic query')
+    parser.add_argument('--record', metavar = 'FILE',
+                        help = 'record the scripted workflow to a session file')
+    parser.add_argument('--replay', metavar = 'FILE',
+                        help = 'replay a recorded session instead of the workflow')
+    parser.add_argument('--realtime', action = 'store_true',
+                        help = 'replay with recorded timing instead of full speed')
+    parser.add_argument('--profile', metavar = 'FILE',
+                        help = 'profile the user interface, writing timings '
+                               'readable by pstats to a file')
+    parser.add_argument('--trace', action = 'store_true',
+                        help = 'trace and summarize forwarded signals')
+    parser.add_argument('--width', type = int, default = 80,
+                        help = 'screen width in columns')
+    parser.add_argument('--height', type = int, default = 24,
+                        help = 'screen height in rows')
+    args = parser.parse_args()
+
+    # Serve synthetic data instead of the fixed mock data, if requested.
+    dataset = None
+    if args.databases or args.tables or args.rows or args.latency:
+        dataset = mock_dbmanager.SyntheticDataset(
+            databases = max(2, args.databases or 2),
+            tables = args.tables or 10,
+            rows = args.rows or 1000,
+            latency = args.latency
+        )
+
+    results = run_workflow(
+        args.repeat, dataset, args.record, args.replay, args.realtime, args.profile,
+        args.trace, (args.width, args.height)
+    )
+    results['signal_dispatch'] = time_dispatch(
+        1000 if not dataset else 10, dataset
+    )
+    results['text_drawing'] = time_draw_text(1000, (args.width, args.height))
+
+    # Report results.
+    if args.json:
+        print(json.dumps(results, indent = 2, sort_keys = True))
+        return
+    print('Startup: {:.1f} ms, Widgets: {} at startup, {} at exit, Windows: {}'.format(
+        results['startup'] * 1000, results['startup_widgets'], results['widgets'],
+        results['windows']
+    ))
+    print('Keys: {keys}, Frames: {frames}, Elapsed: {elapsed:.3f} s'.format(**results))
+    print('Frames/sec: {:.1f}'.format(results['frames_per_sec']))
+    if 'steps' in results:
+        print('\nSlowest replayed steps (msec):')
+        steps = sorted(
+            enumerate(results['steps']), key = lambda item: -item[1]['latency']
+        )
+        for i, step in steps[:10]:
+            print('  {:>6} {:<12} {:>10.2f}'.format(i + 1, step['key'], step['latency'] * 1000))
+    if 'profile' in results:
+        print('\n' + results['profile'])
+    if 'signals' in results:
+        print('\nSignals (slowest total first):')
+        print('  {:<24} {:>9} {:>8} {:>9} {:>10} {:>5}'.format(
+            'Signal', 'Forwards', 'Handled', 'Handlers', 'Total ms', 'Hops'
+        ))
+        summary = sorted(results['signals'].items(), key = lambda item: -item[1]['total'])
+        for name, stats in summary:
+            print('  {:<24} {:>9} {:>8} {:>9} {:>10.2f} {:>5}'.format(
+                name, stats['forwards'], stats['handled'], stats['handlers'],
+                stats['total'] * 1000, stats['max_hops']
+            ))
+    print('\nSignal dispatch (usec/signal):')
+    for name, mean in sorted(results['signal_dispatch'].items()):
+        print('  {:<24} {:>10.1f}'.format(name, mean * 1e6))
+    print('\nText drawing (usec/screenful of rows):')
+    for name, mean in sorted(results['text_drawing'].items()):
+        print('  {:<24} {:>10.1f}'.format(name, mean * 1e6))
+    print('\nWidget draw (usec/draw, slowest first):')
+    widget_draw = sorted(
+        results['widget_draw'].items(), key = lambda item: -item[1]['mean']
+    )
+    for key, stats in widget_draw[:20]:
+        print('  {:<40} {:>10.1f} x {}'.format(key, stats['mean'] * 1e6, stats['count']))
+
+
+if __name__ == '__main__':
+    main()
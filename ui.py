@@ -4,6 +4,7 @@
 # Author: Brett Fedack
 
 
+import curses.ascii as ascii
 from uiframework import (
     signals,
 
@@ -99,42 +100,50 @@ theme = {
 }
 
 
-def build_ui(signal_router = None):
+def build_ui(signal_router = None, backend = None):
     '''
     Builds the user interface
 
     Parameters:
         signal_router (SignalRouter): Communication hub for the user interface
             (Optional)
+        backend (module|FakeCurses): Screen backend standing in for the curses
+            library, e.g. for running headless (Optional)
 
     Returns:
         UI: User interface object
     '''
-    ui = UI(signal_router)
+    ui = UI(signal_router, backend)
     Widget.theme.load(theme)
 
     root = ui.root
-    root.resize(80, 24)
     root.add_signal_handler('UI_UPDATE_STATUS', root.flush)
     root.add_signal_handler('UI_PROMPT_CONFIRM', root.flush)
     root.add_signal_handler('UI_FEEDBACK', root.flush)
     root.add_signal_handler('UI_DATABASE_LIST', root.flush)
+    root.add_signal_handler('UI_SCHEMA_LIST', root.flush)
     root.add_signal_handler('UI_TABLE_LIST', root.flush)
     root.add_signal_handler('UI_SET_DATABASE', root.flush)
+    root.add_signal_handler('UI_SET_SCHEMA', root.flush)
     root.add_signal_handler('UI_SET_TABLE', root.flush)
     root.add_signal_handler('UI_TABLE_CONTENT', root.flush)
     root.add_signal_handler('UI_TABLE_STRUCTURE', root.flush)
+    root.add_signal_handler('UI_TABLE_STATS', root.flush)
     root.add_signal_handler('UI_RAW_QUERY', root.flush)
+    root.add_signal_handler('UI_MONITOR_ACTIVITY', root.flush)
+    root.add_signal_handler('UI_MONITOR_LOCKS', root.flush)
+    root.add_signal_handler('UI_MONITOR_DATABASES', root.flush)
 
     home = build_home_tab(root)
     server = build_server_tab(root)
     database = build_database_tab(root)
     table = build_table_tab(root)
     sql = build_sql_tab(root)
+    monitor = build_monitor_tab(root)
 
     status = StatusLine('Status', root)
-    status.resize(80, 3)
-    status.move(0, 21)
+    status.resize(height = 3)
+    status.align('END', cross = True)
 
     return ui
 
@@ -150,7 +159,7 @@ def build_home_tab(parent):
         Widget: Subtree of widgets
     '''
     home = Tab('Home', parent, ord('h'))
-    home.resize(height = 22)
+    home.scale(height = -2)
 
     title = Text('Title', home, style = 'title')
     title.add_raw(title_string)
@@ -179,7 +188,8 @@ def build_home_tab(parent):
 
 def build_server_tab(parent):
     '''
-    Builds "Server" tab subtree of widgets
+    Builds "Server" tab, deferring its subtree of widgets until it is first
+    shown
 
     Parameters:
         parent (Widget): Parent widget of tab subtree
@@ -187,13 +197,24 @@ def build_server_tab(parent):
     Returns:
         Widget: Subtree of widgets
     '''
+    server = Tab('Server', parent, ord('s'))
+    server.scale(height = -2)
+    server.defer(build_server_content)
+
+    return server
+
+
+def build_server_content(server):
+    '''
+    Builds subtree of widgets within the "Server" tab
+
+    Parameters:
+        server (Tab): Parent tab of subtree
+    '''
     offset = [0, 3]
     input_field_size = 30
     button_offset = 25
 
-    server = Tab('Server', parent, ord('s'))
-    server.resize(height = 22)
-
     translator = DatasigTranslator(server)
     translator.map_output('DB_CONNECT')
 
@@ -258,12 +279,11 @@ def build_server_tab(parent):
     disconnect.move(y = 13)
     disconnect.offset(*offset)
 
-    return server
-
 
 def build_database_tab(parent):
     '''
-    Builds "Database" tab subtree of widgets
+    Builds "Database" tab, deferring its subtree of widgets until it is first
+    shown
 
     Parameters:
         parent (Widget): Parent widget of tab subtree
@@ -272,7 +292,19 @@ def build_database_tab(parent):
         Widget: Subtree of widgets
     '''
     database = Tab('Database', parent, ord('d'))
-    database.resize(height = 22)
+    database.scale(height = -2)
+    database.defer(build_database_content)
+
+    return database
+
+
+def build_database_content(database):
+    '''
+    Builds subtree of widgets within the "Database" tab
+
+    Parameters:
+        database (Tab): Parent tab of subtree
+    '''
     database_group = database.content_region
 
     translator = DatasigTranslator(database_group)
@@ -289,10 +321,20 @@ def build_database_tab(parent):
     tab_group = database.content_region.scale(height = -3).offset(y = 3)
 
     import_tab = VertTab('Import', tab_group, ord('i'))
+    import_tab.defer(build_import_content)
+
     export_tab = VertTab('Export', tab_group, ord('e'))
+    export_tab.defer(build_export_content)
+
+
+def build_import_content(import_tab):
+    '''
+    Builds subtree of widgets within the "Import" tab
 
+    Parameters:
+        import_tab (VertTab): Parent tab of subtree
+    '''
     import_tab_group = import_tab.content_region
-    export_tab_group = export_tab.content_region
 
     translator = DatasigTranslator(import_tab_group)
     translator.map_output('DB_IMPORT_DATABASE')
@@ -329,6 +371,16 @@ def build_database_tab(parent):
     import_button = Button('Import', translator, ord('i'))
     import_button.offset(12, 10)
 
+
+def build_export_content(export_tab):
+    '''
+    Builds subtree of widgets within the "Export" tab
+
+    Parameters:
+        export_tab (VertTab): Parent tab of subtree
+    '''
+    export_tab_group = export_tab.content_region
+
     translator = DatasigTranslator(export_tab_group)
     translator.map_output('DB_EXPORT_DATABASE')
 
@@ -371,12 +423,11 @@ def build_database_tab(parent):
     export_button = Button('Export', translator, ord('e'))
     export_button.offset(12, 10)
 
-    return database
-
 
 def build_table_tab(parent):
     '''
-    Builds "Table" tab subtree of widgets
+    Builds "Table" tab, deferring its subtree of widgets until it is first
+    shown
 
     Parameters:
         parent (Widget): Parent widget of tab subtree
@@ -385,25 +436,58 @@ def build_table_tab(parent):
         Widget: Subtree of widgets
     '''
     table = Tab('Table', parent, ord('t'))
-    table.resize(height = 22)
+    table.scale(height = -2)
+    table.defer(build_table_content)
+
+    return table
+
+
+def build_table_content(table):
+    '''
+    Builds subtree of widgets within the "Table" tab
+
+    Parameters:
+        table (Tab): Parent tab of subtree
+    '''
     table_group = table.content_region
 
+    translator = DatasigTranslator(table_group)
+    translator.map_input('UI_SCHEMA_LIST', schemas = 'options')
+    translator.map_output('DB_SET_SCHEMA', option = 'schema')
+    translator.map_request('DB_LIST_SCHEMAS')
+
+    schema_list = SelectField('Schema', translator, ord('h'))
+    schema_list.auto_expand()
+    schema_list.limit_options(5)
+    schema_list.resize(width = 20)
+    schema_list.offset(x = 8)
+    schema_list.linked_label.embellish(suffix = ': ').to_center(cross = True).shift(-1)
+
     translator = DatasigTranslator(table_group)
     translator.map_input('UI_TABLE_LIST', tables = 'options')
     translator.map_output('DB_SET_TABLE', option = 'table')
     translator.map_request('DB_LIST_TABLES')
 
-    table_list = SelectField('Table List', translator, ord('t'))
+    table_list = SelectField('Table', translator, ord('t'))
     table_list.auto_expand()
     table_list.limit_options(5)
-    table_list.resize(width = 30)
-    table_list.align('CENTER')
+    table_list.resize(width = 20)
+    table_list.offset(x = 36)
     table_list.linked_label.embellish(suffix = ': ').to_center(cross = True).shift(-1)
+    table_list.add_signal_handler('UI_SET_SCHEMA', table_list.request)
+
+    translator = DatasigTranslator(table_group)
+    translator.map_output('DB_CONTENT_MODE', enabled = 'preview')
+
+    preview = FlipSwitch('Preview', translator, ord('p'))
+    preview.align('END')
+    preview.linked_label.embellish(suffix = ': ').to_center(cross = True).shift(-1)
 
     tab_group = table.content_region.scale(height = -3).offset(y = 3)
 
     content_tab = VertTab('Content', tab_group, ord('c'))
     structure_tab = VertTab('Structure', tab_group, ord('s'))
+    stats_tab = VertTab('Stats', tab_group, ord('a'))
 
     content_tab_group = content_tab.content_region
     content_tab_group.outset(1).scale(width = -2).offset(x = 2)
@@ -411,12 +495,28 @@ def build_table_tab(parent):
     structure_tab_group = structure_tab.content_region
     structure_tab_group.outset(1).scale(width = -2).offset(x = 2)
 
+    stats_tab_group = stats_tab.content_region
+    stats_tab_group.outset(1).scale(width = -2).offset(x = 2)
+
     translator = DatasigTranslator(content_tab_group)
-    translator.map_input('UI_TABLE_CONTENT', table_content = 'table')
+    translator.map_output('DB_CONTENT_FILTER', text = 'expression')
+
+    content_filter = TextField('Filter', translator, ord('f'))
+    content_filter.scale(width = -9).offset(x = 9)
+    content_filter.linked_label.embellish(suffix = ': ').to_center(cross = True).shift(-1)
+    content_filter.add_signal_handler('UI_SET_TABLE', content_filter.clear)
+
+    translator = DatasigTranslator(content_tab_group)
+    translator.map_input('UI_TABLE_CONTENT', table_content = 'table', caption = 'caption')
+    translator.map_output('DB_CONTENT_SORT')
     translator.map_request('DB_TABLE_CONTENT')
 
     table_content = Table('Inspect Table', translator, ord('i'))
+    table_content.scale(height = -3).offset(y = 3)
     table_content.linked_label.hide()
+    table_content.allow_sort()
+    table_content.allow_search()
+    table_content.prerender()
     table_content.add_signal_handler('UI_SET_TABLE', table_content.request)
 
     translator = DatasigTranslator(structure_tab_group)
@@ -425,14 +525,24 @@ def build_table_tab(parent):
 
     table_structure = Table('Inspect Table', translator, ord('i'))
     table_structure.linked_label.hide()
+    table_structure.allow_search()
     table_structure.add_signal_handler('UI_SET_TABLE', table_structure.request)
 
-    return table
+    translator = DatasigTranslator(stats_tab_group)
+    translator.map_input('UI_TABLE_STATS', table_stats = 'table')
+    translator.map_request('DB_TABLE_STATS')
+
+    table_stats = Table('Inspect Table', translator, ord('i'))
+    table_stats.linked_label.hide()
+    table_stats.allow_refresh()
+    table_stats.allow_search()
+    table_stats.add_signal_handler('UI_SET_TABLE', table_stats.request)
 
 
 def build_sql_tab(parent):
     '''
-    Builds "SQL" tab subtree of widgets
+    Builds "SQL" tab, deferring its subtree of widgets until it is first
+    shown
 
     Parameters:
         parent (Widget): Parent widget of tab subtree
@@ -441,10 +551,22 @@ def build_sql_tab(parent):
         Widget: Subtree of widgets
     '''
     sql = Tab('SQL', parent, ord('q'))
-    sql.resize(height = 22)
+    sql.scale(height = -2)
+    sql.defer(build_sql_content)
+
+    return sql
+
+
+def build_sql_content(sql):
+    '''
+    Builds subtree of widgets within the "SQL" tab
+
+    Parameters:
+        sql (Tab): Parent tab of subtree
+    '''
 
     input_group = sql.content_region
-    input_group.scale(width = -38)
+    input_group.resize(width = 38)
 
     translator = DatasigTranslator(input_group)
     translator.map_output('DB_RAW_QUERY', text = 'raw')
@@ -452,20 +574,21 @@ def build_sql_tab(parent):
     form = Form(translator, text = '')
 
     text_in = TextBox('Input', form, ord('i'))
-    text_in.scale(height = -2)
+    text_in.scale(height = -3)
+    text_in.allow_search(ascii.ctrl(ord('f')), ascii.ctrl(ord('n')), ascii.ctrl(ord('p')))
     text_in.linked_label.embellish(' ', ' ').offset(x = 2)
 
     translator = DatasigTranslator(form)
     translator.map_output('UI_SUBMIT')
 
     submit = Button('Submit', translator, ord('s'))
-    submit.move(y = 16)
+    submit.align('END', cross = True).offset(y = -1)
 
     translator = DatasigTranslator(form)
     translator.map_output('UI_CLEAR_FORM')
 
     reset = Button('Reset', translator, ord('r'))
-    reset.move(x = 12, y = 16)
+    reset.align('END', cross = True).offset(12, -1)
 
     output_group = sql.content_region
     output_group.scale(width = -38).offset(x = 38)
@@ -478,13 +601,105 @@ def build_sql_tab(parent):
 
     text_out = TextBox('Output', translator, ord('o'))
     text_out.read_only()
-    text_out.scale(height = -2)
+    text_out.allow_search()
+    text_out.prerender()
+    text_out.scale(height = -3)
     text_out.linked_label.embellish(' ', ' ').offset(x = 2)
 
     translator = DatasigTranslator(form)
     translator.map_output('UI_CLEAR_FORM')
 
     clear = Button('Clear', translator, ord('c'))
-    clear.move(y = 16)
+    clear.align('END', cross = True).offset(y = -1)
 
-    return sql
+    translator = DatasigTranslator(output_group)
+    translator.map_output('DB_SCRIPT_MODE', enabled = 'autocommit')
+
+    autocommit = FlipSwitch('Autocommit', translator, ord('a'))
+    autocommit.align('END', cross = True).offset(x = 26)
+    autocommit.linked_label.embellish(suffix = ': ').to_center(cross = True).shift(-1)
+
+
+def build_monitor_tab(parent):
+    '''
+    Builds "Monitor" tab, deferring its subtree of widgets until it is first
+    shown
+
+    Parameters:
+        parent (Widget): Parent widget of tab subtree
+
+    Returns:
+        Widget: Subtree of widgets
+    '''
+    monitor = Tab('Monitor', parent, ord('m'))
+    monitor.scale(height = -2)
+    monitor.defer(build_monitor_content)
+
+    return monitor
+
+
+def build_monitor_content(monitor):
+    '''
+    Builds subtree of widgets within the "Monitor" tab
+
+    Parameters:
+        monitor (Tab): Parent tab of subtree
+    '''
+    monitor_group = monitor.content_region
+
+    translator = DatasigTranslator(monitor_group)
+    translator.map_output('DB_MONITOR', enabled = 'enabled')
+
+    polling = FlipSwitch('Poll', translator, ord('o'))
+    polling.offset(x = 6)
+    polling.linked_label.embellish(suffix = ': ').to_center(cross = True).shift(-1)
+
+    translator = DatasigTranslator(monitor_group)
+    translator.map_output('DB_MONITOR_INTERVAL', number = 'interval')
+
+    interval = NumericField('Interval', translator, ord('n'))
+    interval.resize(width = 7)
+    interval.offset(x = 28)
+    interval.linked_label.embellish(suffix = ': ').to_center(cross = True).shift(-1)
+
+    translator = DatasigTranslator(monitor_group)
+    translator.map_output('DB_SET_BACKEND', number = 'pid')
+
+    pid = NumericField('PID', translator, ord('p'))
+    pid.resize(width = 10)
+    pid.offset(x = 41)
+    pid.linked_label.embellish(suffix = ': ').to_center(cross = True).shift(-1)
+
+    translator = DatasigTranslator(monitor_group)
+    translator.map_output('DB_CANCEL_BACKEND')
+
+    cancel = Button('Cancel', translator, ord('c'))
+    cancel.move(52, 1)
+
+    translator = DatasigTranslator(monitor_group)
+    translator.map_output('DB_TERMINATE_BACKEND')
+
+    terminate = Button('Kill', translator, ord('k'))
+    terminate.move(64, 1)
+
+    tab_group = monitor.content_region.scale(height = -3).offset(y = 3)
+
+    activity_tab = VertTab('Activity', tab_group, ord('a'))
+    locks_tab = VertTab('Locks', tab_group, ord('l'))
+    databases_tab = VertTab('Databases', tab_group, ord('d'))
+
+    for tab, signame in (
+        (activity_tab, 'UI_MONITOR_ACTIVITY'),
+        (locks_tab, 'UI_MONITOR_LOCKS'),
+        (databases_tab, 'UI_MONITOR_DATABASES')
+    ):
+        tab_group = tab.content_region
+        tab_group.outset(1).scale(width = -2).offset(x = 2)
+
+        translator = DatasigTranslator(tab_group)
+        translator.map_input(signame, snapshot = 'table')
+
+        snapshot = Table('Inspect Table', translator, ord('i'))
+        snapshot.allow_search()
+        snapshot.linked_label.hide()
+        snapshot.track_changes()
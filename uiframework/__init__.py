@@ -5,7 +5,11 @@
 
 
 from .core import UI, Widget, ContentWidget, DatasigTranslator, Form, Group
-from .signals import Signal, SignalRouter
+from .profiler import Profiler
+from .results import ResultBatch
+from .screen import FakeCurses
+from .session import KeyboardInput, SessionRecorder, SessionReplayer
+from .signals import Signal, SignalRouter, SignalTrace
 from .widgets import (
     Button, FlipSwitch, NavList, NumericField, SelectField, StatusLine, Tab,
     Table, Text, TextBox, TextField, VertTab
@@ -6,12 +6,13 @@
 
 import curses
 import curses.ascii as ascii
-import math
+import functools
 import os
 import re
 import weakref
 from datetime import datetime
-from . import signals
+from . import screen, signals, textwidth
+from .session import KeyboardInput
 from .theme import Theme
 
 
@@ -29,7 +30,7 @@ def key_from_char(n):
         str: String representation of keyboard key
     '''
     # Get the keyname.
-    key = curses.keyname(n).decode('utf-8')
+    key = screen.backend.keyname(n).decode('utf-8')
 
     # Remove 'KEY_' prefix.
     key = re.sub(r'^KEY_', '',  key)
@@ -40,6 +41,78 @@ def key_from_char(n):
     return key
 
 
+def layout_operation(function):
+    '''
+    Decorates a widget method that changes layout, such as resize or offset,
+    so that calls made while building the tree of widgets are recorded for
+    replay; calls made from within another layout operation are not recorded
+
+    Parameters:
+        function (function): Layout method
+
+    Returns:
+        function: Recorded layout method
+    '''
+    @functools.wraps(function)
+    def record(self, *args, **kwargs):
+        log = self._layout_log
+        if log._is_recording and not log._depth:
+            log._entries.append((self, function, args, kwargs))
+        log._depth += 1
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            log._depth -= 1
+
+    return record
+
+
+class LayoutLog():
+    '''
+    Record of the layout operations that build a tree of widgets, replayed to
+    reflow the tree, e.g. when the terminal is resized
+
+    Attributes:
+        _entries (list<4-tuple>): Widget, layout function (None for creation
+            of the widget), and positional and keyword arguments of each
+            recorded operation
+        _depth (int): Number of layout operations in progress
+        _is_recording (bool): Flag controlling recording of layout operations
+    '''
+    def __init__(self):
+        self._entries = []
+        self._depth = 0
+        self._is_recording = True
+
+
+    def record_creation(self, widget):
+        '''
+        Records the creation of a widget, which reserves its parent's region
+
+        Parameters:
+            widget (Widget): Created widget
+        '''
+        if self._is_recording:
+            self._entries.append((widget, None, (), {}))
+
+
+    def replay(self):
+        '''
+        Lays out the tree of widgets again, starting from the current extents
+        of the screen; widgets release their windows, and allocate windows of
+        their new extents upon their next draw
+        '''
+        self._depth += 1
+        try:
+            for widget, function, args, kwargs in self._entries:
+                if function:
+                    function(widget, *args, **kwargs)
+                else:
+                    widget._reserve_region()
+        finally:
+            self._depth -= 1
+
+
 class UI():
     '''
     Curses-based user interface framework class
@@ -47,7 +120,11 @@ class UI():
     Attributes:
         _error_log (list<Exception>): History of runtime errors
         _focus_trace (list<weakref<Widget>>): Trace of input focus
+        _input_source (KeyboardInput): Source of user input, such as the
+            keyboard or a recorded session
         _is_running (bool): Flag controlling run state of this UI
+        _profiler (Profiler): Profiler timing the event loop; None unless
+            profiling is enabled
         _root (Widget): Root node of widget tree
     '''
     @property
@@ -56,19 +133,25 @@ class UI():
         return self._root
 
 
-    def __init__(self, signal_router = None):
+    def __init__(self, signal_router = None, backend = None):
         '''
         Parameters:
             signal_router (SignalRouter): Communication hub for this component
                 (Optional)
+            backend (module|FakeCurses): Screen backend standing in for the
+                curses library (Optional)
         '''
+        # Select the screen backend.
+        if backend:
+            screen.set_backend(backend)
+
         # Initialize curses library.
-        curses.initscr()
-        curses.noecho()          # Hidden input
-        curses.curs_set(0)       # Hidden cursor
-        curses.cbreak()          # Non-buffered input
-        if curses.has_colors():  # Color enabled
-            curses.start_color()
+        screen.backend.initscr()
+        screen.backend.noecho()          # Hidden input
+        screen.backend.curs_set(0)       # Hidden cursor
+        screen.backend.cbreak()          # Non-buffered input
+        if screen.backend.has_colors():  # Color enabled
+            screen.backend.start_color()
 
         # Setup signal handling.
         signal_router.register('UI_EXIT', self._exit)
@@ -76,14 +159,16 @@ class UI():
         # Initialize attributes.
         self._error_log = []
         self._focus_trace = []
+        self._input_source = KeyboardInput()
         self._is_running = True
+        self._profiler = None
         self._root = Widget(label = 'root', signal_router = signal_router)
 
 
     def __del__(self):
         # Deinitialize curses library, and display any errors.
-        if not curses.isendwin():
-            curses.endwin()
+        if not screen.backend.isendwin():
+            screen.backend.endwin()
         for e in self._error_log:
             raise e
 
@@ -96,6 +181,27 @@ class UI():
             self._error_log.append(e)
 
 
+    def set_input_source(self, input_source):
+        '''
+        Replaces the source of user input
+
+        Parameters:
+            input_source (KeyboardInput|SessionRecorder|SessionReplayer): Source
+                of user input
+        '''
+        self._input_source = input_source
+
+
+    def set_profiler(self, profiler):
+        '''
+        Enables profiling of the event loop and widgets
+
+        Parameters:
+            profiler (Profiler): Profiler timing the event loop
+        '''
+        self._profiler = profiler
+
+
     def _backtrace(self):
         ''' Transfers input focus to the previously focused widget '''
         focus_trace = self._focus_trace
@@ -124,6 +230,22 @@ class UI():
             focus_trace[-1] = weakref.ref(actual_focus)
 
 
+    def _reflow(self):
+        ''' Lays out the tree of widgets again to fit the screen '''
+        root = self.root
+        height, width = screen.backend.newwin(0, 0).getmaxyx()
+        if root._win.getmaxyx() == (height, width):
+            return
+
+        # Replay the recorded layout, and redraw everything.
+        root._layout_log.replay()
+        root.tag_redraw()
+
+        # Let widgets adapt to their new extents.
+        signal = signals.Signal('UI_RESIZE', {'width': width, 'height': height})
+        root.flush(**signal.data)
+
+
     def _exit(self, **kwargs):
         ''' Terminates this user interface '''
         self._is_running = False
@@ -140,15 +262,34 @@ class UI():
         # Set input focus.
         Widget.input_focus = entry_point
 
+        # Stop recording layout; layout changed at runtime is not replayed.
+        self.root._layout_log._is_recording = False
+
         # Reset focus trace.
         focus_trace = self._focus_trace
         focus_trace.clear()
 
+        # Build the signal that is emitted while waiting for user input.
+        idle_signal = signals.Signal('UI_IDLE')
+        signal_router = self.root._signal_router
+
+        # Reference each phase of the event loop, timing them if profiling.
+        draw = self.root._draw
+        read_key = self._input_source.read
+        dispatch = signal_router.forward
+        handle_input = self._handle_input
+        if self._profiler:
+            self._profiler.instrument(self.root)
+            draw, read_key, dispatch, handle_input = self._profiler.instrument_loop(
+                self.root, self.root._draw_tagged, read_key,
+                signal_router.forward, handle_input
+            )
+
         # Run until an exit signal is received.
         while self._is_running:
 
             # Redraw user interface.
-            self.root._draw()
+            draw()
 
             # Synchronize input focus with the focus trace.
             if not focus_trace or focus_trace[-1]() is not Widget.input_focus:
@@ -158,65 +299,89 @@ class UI():
             input_focus = Widget.input_focus
 
             # Get user input.
-            c = input_focus._win.getch()
+            c = read_key(input_focus._win)
 
-            # Find neighboring, focusable widgets.
-            ancestor = input_focus._ancestor
-            siblings = ancestor._descendants if ancestor else None
-            descendants = input_focus._descendants
+            # Give other components a chance to run while no input is pending.
+            if c == -1:
+                dispatch(idle_signal)
 
-            # Transfer input focus upward.
-            if (c == ascii.ESC
-                and not input_focus._overrides_esc
-                and len(focus_trace) > 1
-            ):
-                self._backtrace()
+            # Respond to user input.
+            handle_input(input_focus, c)
 
-            # Transfer input focus laterally.
-            elif (c in {ascii.TAB, curses.KEY_BTAB}
-                  and not input_focus._overrides_tab
-                  and len(siblings) > 1
-            ):
 
-                # Determine if lateral navigation is possible.
-                if siblings and input_focus in siblings:
+    def _handle_input(self, input_focus, c):
+        '''
+        Transfers input focus or operates the focused widget in response to
+        user input
 
-                    # Reference previous and next focusable siblings.
-                    curr_idx = siblings.index(input_focus)
-                    prev = siblings[(curr_idx - 1) % (len(siblings))]
-                    next = siblings[(curr_idx + 1) % (len(siblings))]
+        Parameters:
+            input_focus (Widget): Subject of input focus
+            c (int): Character code for user input; -1 if no input is pending
+        '''
+        focus_trace = self._focus_trace
 
-                    # Transfer input focus to a focusable siblings.
-                    new_focus = prev if c == curses.KEY_BTAB else next
-                    Widget.input_focus = new_focus
-                    focus_trace[-1] = weakref.ref(Widget.input_focus)
+        # Reflow the tree of widgets to fit a resized terminal.
+        if c == curses.KEY_RESIZE:
+            self._reflow()
+            return
 
-            # Transfer input focus downward.
-            elif (c in {curses.KEY_ENTER, ascii.LF, ascii.CR}
-                  and not input_focus._overrides_enter
-                  and descendants
-            ):
-                self._transfer_down(descendants[0])
+        # Find neighboring, focusable widgets.
+        ancestor = input_focus._ancestor
+        siblings = ancestor._descendants if ancestor else None
+        descendants = input_focus._descendants
 
-            # Transfer input focus directly to a descendant.
-            elif (c in input_focus._focus_map
-                  and descendants[input_focus._focus_map[c]].audit()
-            ):
-                self._transfer_down(descendants[input_focus._focus_map[c]])
+        # Transfer input focus upward.
+        if (c == ascii.ESC
+            and not input_focus._overrides_esc
+            and len(focus_trace) > 1
+        ):
+            self._backtrace()
 
-            # Otherwise, pass user input to the focused widget.
-            else:
-                ret = input_focus.operate(c)
+        # Transfer input focus laterally.
+        elif (c in {ascii.TAB, curses.KEY_BTAB}
+              and not input_focus._overrides_tab
+              and len(siblings) > 1
+        ):
 
-                # The response should be to continue or end operation.
-                if ret not in {'CONTINUE', 'END'}:
-                    raise RuntimeError(
-                        'Returned {}; expected value in {"CONTINUE", "END"}'.format(ret)
-                    )
+            # Determine if lateral navigation is possible.
+            if siblings and input_focus in siblings:
 
-                # Backtrace input focus if operation has come to an end.
-                elif ret == 'END':
-                    self._backtrace()
+                # Reference previous and next focusable siblings.
+                curr_idx = siblings.index(input_focus)
+                prev = siblings[(curr_idx - 1) % (len(siblings))]
+                next = siblings[(curr_idx + 1) % (len(siblings))]
+
+                # Transfer input focus to a focusable siblings.
+                new_focus = prev if c == curses.KEY_BTAB else next
+                Widget.input_focus = new_focus
+                focus_trace[-1] = weakref.ref(Widget.input_focus)
+
+        # Transfer input focus downward.
+        elif (c in {curses.KEY_ENTER, ascii.LF, ascii.CR}
+              and not input_focus._overrides_enter
+              and descendants
+        ):
+            self._transfer_down(descendants[0])
+
+        # Transfer input focus directly to a descendant.
+        elif (c in input_focus._focus_map
+              and descendants[input_focus._focus_map[c]].audit()
+        ):
+            self._transfer_down(descendants[input_focus._focus_map[c]])
+
+        # Otherwise, pass user input to the focused widget.
+        else:
+            ret = input_focus.operate(c)
+
+            # The response should be to continue or end operation.
+            if ret not in {'CONTINUE', 'END'}:
+                raise RuntimeError(
+                    'Returned {}; expected value in {"CONTINUE", "END"}'.format(ret)
+                )
+
+            # Backtrace input focus if operation has come to an end.
+            elif ret == 'END':
+                self._backtrace()
 
 
 class MetaWidget(type):
@@ -241,6 +406,10 @@ class MetaWidget(type):
         # Retrieve previous input focus.
         previous_focus = Widget.input_focus
 
+        # Build the new input focus's deferred subtree.
+        if new_focus._builder:
+            new_focus._build()
+
         # Report status of the new input focus.
         new_focus._send_status()
 
@@ -300,7 +469,8 @@ class Widget(metaclass = MetaWidget):
         _theme (Theme):
 
         _label (str): Identifier for this widget
-        _win (curses.window): Encapsulated curses window
+        _win (curses.window|Region): Encapsulated curses window, or the
+            screen region it will occupy until this widget is first drawn
         _signal_router (SignalRouter): Communication hub for this widget
         _parent (Widget): Parent node in tree of widgets
         _children (list<window>): Child nodes in tree of widgets
@@ -314,6 +484,7 @@ class Widget(metaclass = MetaWidget):
             focus
         _is_drawable (bool): Flag indicating if this widget can be drawn
         _is_tagged (bool): Flag indicating a pending draw operation
+        _has_patch (bool): Flag indicating a pending partial draw operation
         _is_visible (bool): Flag indicating if the subtree rooted at this
             widget is visible
         _timestamp (datetime): Reference date & time for animation purposes;
@@ -324,6 +495,15 @@ class Widget(metaclass = MetaWidget):
             default backtrace navigation key
         _overrides_tab (bool): Flag indicating if this widget overrides the
             default lateral navigation key
+        _layout_log (LayoutLog): Layout operations that build this widget's
+            tree, shared by all widgets of the tree
+        _builder (function): Builds the subtree rooted at this widget when it
+            first gains input focus or is drawn; None if construction is not
+            deferred
+        _styles (dict<str:int>): Curses style attributes of this widget's
+            state keyed by name, resolved from the color theme
+        _style_key (tuple): Theme, theme version, and state the style
+            attributes were resolved for; None if unresolved
 
     Preconditions:
         Curses library shall be intialized.
@@ -407,20 +587,19 @@ class Widget(metaclass = MetaWidget):
         # Setup signal handlers.
         self.add_signal_handler('DATASIG_IN', self.decompose)
         self.add_signal_handler('DATASIG_FOCUS', self._focus)
+        self.add_signal_handler('UI_RESIZE', self.reflow)
 
-        # Encapsulate a curses window in this widget.
-        pwin = self._parent._win if parent else curses.newwin(0, 0)
-        ph, pw = pwin.getmaxyx()
-        py, px = pwin.getbegyx()
-        win = curses.newwin(ph, pw, py, px)
-        win.keypad(1)
-        win.nodelay(1)
-        self._win = win
+        # Reserve a screen region for this widget; a curses window of the
+        # region's final extents replaces it when this widget is first drawn.
+        self._layout_log = parent._layout_log if parent else LayoutLog()
+        self._layout_log.record_creation(self)
+        self._reserve_region()
 
         # Enable rendering of the subtree rooted at this widget.
         self._links = []
         self._is_drawable = True
         self._is_tagged = True
+        self._has_patch = False
         self._is_visible = True
 
         # Initialize timestamp
@@ -431,6 +610,13 @@ class Widget(metaclass = MetaWidget):
         self._overrides_esc = False
         self._overrides_tab = False
 
+        # Build the subtree rooted at this widget eagerly by default.
+        self._builder = None
+
+        # Resolve style attributes upon the first draw.
+        self._styles = {}
+        self._style_key = None
+
 
     def override(enter = False, esc = False, tab = False):
         '''
@@ -482,6 +668,7 @@ class Widget(metaclass = MetaWidget):
         return width, height
 
 
+    @layout_operation
     def offset(self, x = 0, y = 0):
         '''
         Moves this widget relative to its current position
@@ -494,7 +681,7 @@ class Widget(metaclass = MetaWidget):
             Widget: Alias to this widget
         '''
         # Determine the bounds of both this widget and its parent.
-        p = self._parent._win if self._parent else curses.newwin(0, 0)
+        p = self._parent._win if self._parent else screen.backend.newwin(0, 0)
         py, px = p.getbegyx()
         ph, pw = p.getmaxyx()
         s = self._win
@@ -515,6 +702,7 @@ class Widget(metaclass = MetaWidget):
         return self
 
 
+    @layout_operation
     def move(self, x = None, y = None):
         '''
         Moves this widget within the bounds of its parent/screen
@@ -527,7 +715,7 @@ class Widget(metaclass = MetaWidget):
             Widget: Alias to this widget
         '''
         # Determine the coordinates of this widget and its parent.
-        p = self._parent._win if self._parent else curses.newwin(0, 0)
+        p = self._parent._win if self._parent else screen.backend.newwin(0, 0)
         py, px = p.getbegyx()
         s = self._win
         sy, sx = s.getbegyx()
@@ -542,6 +730,7 @@ class Widget(metaclass = MetaWidget):
         return self
 
 
+    @layout_operation
     def resize(self, width = None, height = None):
         '''
         Resizes this widget within the bounds of its parent/screen
@@ -554,7 +743,7 @@ class Widget(metaclass = MetaWidget):
             Widget: Alias to this widget
         '''
         # Determine the bounds of both this widget and its parent.
-        p = self._parent._win if self._parent else curses.newwin(0, 0)
+        p = self._parent._win if self._parent else screen.backend.newwin(0, 0)
         py, px = p.getbegyx()
         ph, pw = p.getmaxyx()
         s = self._win
@@ -578,6 +767,7 @@ class Widget(metaclass = MetaWidget):
         return self
 
 
+    @layout_operation
     def scale(self, width = 0, height = 0):
         '''
         Resizes this widget relative to its current dimensions
@@ -594,6 +784,7 @@ class Widget(metaclass = MetaWidget):
         return self
 
 
+    @layout_operation
     def inset(self, factor):
         '''
         Scales this widget inward from its current bounds
@@ -609,6 +800,7 @@ class Widget(metaclass = MetaWidget):
         return self
 
 
+    @layout_operation
     def outset(self, factor):
         '''
         Scales this widget outward from its current bounds
@@ -624,6 +816,7 @@ class Widget(metaclass = MetaWidget):
         return self
 
 
+    @layout_operation
     def align(self, mode = 'LEFT', cross = False):
         '''
         Aligns this widget with respect to the width or height of its parent
@@ -641,7 +834,7 @@ class Widget(metaclass = MetaWidget):
         span_inner = sh if cross else sw
 
         # Get length along parent's alignment axis.
-        p = self._parent._win if self._parent else curses.newwin(0, 0)
+        p = self._parent._win if self._parent else screen.backend.newwin(0, 0)
         ph, pw = p.getmaxyx()
         span_outer = ph if cross else pw
 
@@ -685,13 +878,7 @@ class Widget(metaclass = MetaWidget):
         Returns:
             curses.attr: Curses style attribute
         '''
-        if not self.audit():
-            state = 'disabled'
-        elif self.input_focus == self:
-            state = 'focused'
-        else:
-            state = 'default'
-        return self.theme.query(state, name)
+        return self._styles.get(name, 0)
 
 
     def add_signal_handler(self, signame, handler):
@@ -705,6 +892,17 @@ class Widget(metaclass = MetaWidget):
         self._signal_router.register(signame, handler)
 
 
+    def defer(self, builder):
+        '''
+        Defers construction of the subtree rooted at this widget until this
+        widget first gains input focus or is drawn
+
+        Parameters:
+            builder (function): Builds the subtree given this widget
+        '''
+        self._builder = builder
+
+
     def bubble(self, **kwargs):
         '''
         Builds signal from given data and emits it to all ancestor widgets.
@@ -778,6 +976,13 @@ class Widget(metaclass = MetaWidget):
             ref().tag_redraw()
 
 
+    def tag_patch(self):
+        '''
+        Marks this widget to be partially redrawn during the next draw call
+        '''
+        self._has_patch = True
+
+
     def audit(self):
         '''
         * Abstract method for inserting user-defined code into UI framework *
@@ -841,6 +1046,17 @@ class Widget(metaclass = MetaWidget):
         return
 
 
+    def reflow(self, **kwargs):
+        '''
+        * Abstract method for inserting user-defined code into UI framework *
+
+        Executes after the tree of widgets is laid out again to fit a resized
+        screen, e.g. to restore layout changed at runtime or to keep scroll
+        positions within bounds; receives the screen's width and height
+        '''
+        return
+
+
     def draw(self):
         '''
         * Abstract method for inserting user-defined code into UI framework *
@@ -850,6 +1066,25 @@ class Widget(metaclass = MetaWidget):
         return
 
 
+    def patch(self):
+        '''
+        * Abstract method for inserting user-defined code into UI framework *
+
+        Defines how to update part of this widget without redrawing all of it
+        '''
+        return
+
+
+    def composite(self):
+        '''
+        * Abstract method for inserting user-defined code into UI framework *
+
+        Copies offscreen content, e.g. a curses pad, onto the virtual screen
+        after this widget's window is refreshed
+        '''
+        return
+
+
     def operate(self, c = None):
         '''
         * Abstract method for inserting user-defined code into UI framework *
@@ -867,10 +1102,52 @@ class Widget(metaclass = MetaWidget):
         Widget.set_input_focus(self, **kwargs)
 
 
+    def _build(self):
+        ''' Builds the deferred subtree rooted at this widget '''
+        builder, self._builder = self._builder, None
+
+        # Record the layout of the subtree, so that it reflows with the rest.
+        log = self._layout_log
+        is_recording, log._is_recording = log._is_recording, True
+        try:
+            builder(self)
+        finally:
+            log._is_recording = is_recording
+
+
+    def _resolve_style(self):
+        '''
+        Resolves the style attributes of this widget's state from the color
+        theme, unless neither the state nor the theme has changed since
+        '''
+        if not self.audit():
+            state = 'disabled'
+        elif Widget.input_focus is self:
+            state = 'focused'
+        else:
+            state = 'default'
+        theme = Widget._theme
+        key = (theme, theme.version, state)
+        if key != self._style_key:
+            self._style_key = key
+            self._styles = theme.resolve(state)
+
+
+    def _reserve_region(self):
+        '''
+        Reserves the region of this widget's parent, or of the screen, for this
+        widget, releasing any window it has
+        '''
+        pwin = self._parent._win if self._parent else screen.backend.newwin(0, 0)
+        ph, pw = pwin.getmaxyx()
+        py, px = pwin.getbegyx()
+        self._win = screen.Region(ph, pw, py, px)
+
+
     def _draw(self):
         ''' Draws this widget '''
         self._draw_tagged()
-        curses.doupdate()
+        screen.backend.doupdate()
 
 
     def _draw_tagged(self):
@@ -884,24 +1161,43 @@ class Widget(metaclass = MetaWidget):
 
             # Otherwise, continue search for tagged trees.
             else:
+
+                # Apply any pending partial redraw to this widget.
+                if self._has_patch:
+                    self._has_patch = False
+                    if self._is_drawable and type(self._win) is not screen.Region:
+                        self._resolve_style()
+                        self.patch()
+                        self._win.noutrefresh()
+                        self.composite()
+
                 for child in self._children:
                     child._draw_tagged()
 
 
     def _draw_tree(self):
         ''' Draws the tree of widgets rooted at this node '''
-        # Preemptively remove draw tag.
+        # Preemptively remove draw tags.
         self._is_tagged = False
+        self._has_patch = False
 
         # Skip hidden trees.
         if self._is_visible:
 
-            # Draw this widget.
+            # Build this widget's deferred subtree once it becomes visible.
+            if self._builder:
+                self._build()
+
+            # Draw this widget, allocating its window upon the first draw.
             if self._is_drawable:
+                if type(self._win) is screen.Region:
+                    self._win = self._win.allocate()
+                self._resolve_style()
                 self._win.bkgdset(self.style('fill'));
                 self._win.erase()
                 self.draw()
                 self._win.noutrefresh()
+                self.composite()
 
             # Recursively draw each child subtree.
             for child in self._children:
@@ -1150,48 +1446,53 @@ class ContentWidget(Widget):
 
         # Clip text to be left-aligned on a single line.
         elif fit in {'CLIP_RIGHT', 'NO_WRAP'}:
-            line_list = [text[:effective_width]]
+            line_list = [textwidth.clip(text, effective_width)]
 
             # Indicate clipping with an ellipsis.
             if fit == 'CLIP_RIGHT':
                 line = line_list[0]
                 if len(text) > len(line_list[0]):
-                    line_list = [(line[:-3] + '...')[:len(line)]]
+                    line_width = textwidth.width(line)
+                    line_list = [textwidth.clip(
+                        textwidth.clip(line, line_width - 3) + '...', line_width
+                    )]
 
         # Shift text to be right-aligned on a single line.
         elif fit == 'CLIP_LEFT':
-            line_list = [text[max(0, len(text) - effective_width):]]
+            line_list = [textwidth.clip_left(text, effective_width)]
 
             # Indicate shift with an ellipsis.
             line = line_list[0]
             if len(text) > len(line_list[0]):
-                line_list = [('...' + line[3:])[:len(line)]]
+                line_width = textwidth.width(line)
+                line_list = [textwidth.clip(
+                    '...' + textwidth.skip(line, 3), line_width
+                )]
 
         # Break text into multiple lines.
         elif fit == 'WRAP':
-            line_num = math.ceil(len(text) / effective_width)
-            line_list = [text[i * effective_width:(i + 1) * effective_width] for i in range(0, line_num)]
+            line_list = textwidth.wrap(text, effective_width)
 
             # Discard out-of-bound lines.
             line_list = line_list[:height - margin[3] - row]
 
         # Pad line(s) of text.
-        line_list = [
-            ' ' * padding[0] + line + ' ' * padding[1]
-            for line in line_list
-        ]
+        if padding[0] or padding[1]:
+            line_list = [
+                ' ' * padding[0] + line + ' ' * padding[1]
+                for line in line_list
+            ]
 
         # Expand line(s) of text.
         if expand in {'LEFT', 'RIGHT', 'AROUND'}:
-            template = ""
             if expand == 'LEFT':
-                template = '{:>{}}'
+                expand_align = 'RIGHT'
             elif expand == 'RIGHT':
-                template = '{:<{}}'
+                expand_align = 'LEFT'
             else:
-                template = '{:^{}}'
+                expand_align = 'CENTER'
             line_list = [
-                template.format(line, width - margin[0] - margin[1])
+                textwidth.pad(line, width - margin[0] - margin[1], expand_align)
                 for line in line_list
             ]
 
@@ -1202,17 +1503,18 @@ class ContentWidget(Widget):
         win.attron(attr)
         for i in range(len(line_list)):
             line = line_list[i]
+            line_width = textwidth.width(line)
 
             # Determine offset from left edge of this widget.
             if align == 'CENTER':
-                offset = int((width - margin[0] - margin[1] - len(line)) / 2) + margin[0]
+                offset = int((width - margin[0] - margin[1] - line_width) / 2) + margin[0]
             elif align == 'RIGHT':
-                offset = width - margin[1] - len(line)
+                offset = width - margin[1] - line_width
             else:
                 offset = margin[0]
 
             # Add offset line of text.
-            if offset + len(line) < width:
+            if offset + line_width < width:
                 win.addstr(row + i, offset, line)
             else:
                 win.addstr(row + i, offset, line[:-1])
@@ -1220,11 +1522,12 @@ class ContentWidget(Widget):
 
             # Emphasize first occurrence of given character, provided that this
             # has an ancestor that can receive focus.
-            if (self._ancestor is Widget.input_focus
-                and hint and not hinted
+            if (hint and not hinted
+                and self._ancestor is Widget.input_focus
                 and chr(hint) in line.lower()
             ):
                 idx = line.lower().find(chr(hint))
+                idx = textwidth.width(line.lower()[:idx])
                 win.chgat(row + i, offset + idx, 1, attr | curses.A_UNDERLINE)
                 hinted = True
         win.attroff(attr)
@@ -1232,6 +1535,51 @@ class ContentWidget(Widget):
         return len(line_list)
 
 
+    def draw_rows(self, lines, row = 0, margin = (0, 0, 0, 0), attr = None):
+        '''
+        Adds lines of text to consecutive rows of this widget, with a single
+        style attribute; equivalent to calling draw_text for each line without
+        padding, alignment, expansion, or hints, and with the "NO_WRAP" fit
+
+        Parameters:
+            lines (sequence<str>): Lines of text, one per row
+            row (int): Row in which to start text (Optional)
+            margin (sequence<int>): Left, right, top, and bottom widget margins
+                (Optional)
+            attr (int): Curses style attribute (Optional)
+
+        Returns:
+            int: Number of lines of text added
+        '''
+        width, height = self.get_size()
+        offset = margin[0]
+        effective_width = width - offset - margin[1]
+
+        # Return early if the given row is not between the vertical margins or
+        # no character fits between the horizontal margins.
+        count = min(len(lines), height - margin[3] - row)
+        if row < margin[2] or count < 1 or effective_width < 1:
+            return 0
+
+        # Add clipped lines of text to this widget.
+        win = self._win
+        addstr = win.addstr
+        attr = self.style('text') if not attr else attr
+        win.attron(attr)
+        for i in range(count):
+            line = textwidth.clip(lines[i], effective_width)
+            if not line:
+                continue
+            if offset + textwidth.width(line) < width:
+                addstr(row + i, offset, line)
+            else:
+                addstr(row + i, offset, line[:-1])
+                win.insch(row + i, width - 1, ord(line[-1]))
+        win.attroff(attr)
+
+        return count
+
+
     def _auto_scroll(self, text, width, gap = 8, rate = 5, delay = 0.67):
         '''
         Scrolls text on a single line over time
@@ -1247,7 +1595,7 @@ class ContentWidget(Widget):
             str: Scrolled string of text
         '''
         # Return early if text does not exceed scroll bounds.
-        if len(text) < width:
+        if textwidth.width(text) < width:
             return text
 
         # Pad text with given number of spaces.
@@ -1264,7 +1612,7 @@ class ContentWidget(Widget):
             start = int(rate * (period_time - delay))
 
         # Scroll text to calculated start position.
-        text = (text[start:] + text[:start])[:width]
+        text = textwidth.clip(text[start:] + text[:start], width)
 
         return text
 
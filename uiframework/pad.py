@@ -0,0 +1,158 @@
+# Filename: pad.py
+# Creation Date: Mon 19 Oct 2026
+# Last Modified: Mon 19 Oct 2026
+
+
+from . import screen, textwidth
+
+
+# Maximum width of a curses pad in columns.
+max_width = 32767
+
+
+class RowPad():
+    '''
+    Offscreen curses pad holding a block of rendered rows larger than a
+    widget's viewport, so that scrolling within the block only changes the
+    origin from which the pad is copied to the screen
+
+    Attributes:
+        _capacity (int): Number of rows rendered into each block
+        _pad (window): Curses pad; None until the first block is rendered
+        _start (int): Index of the first row held
+        _stop (int): Index following the last row held
+        _key (tuple): Source, width, and style attributes the held rows were
+            rendered with; None if the held rows are invalid
+        _view (tuple): Pad origin and screen region of the pending copy; None
+            if the pad is not shown
+    '''
+    def __init__(self, capacity = 256):
+        '''
+        Parameters:
+            capacity (int): _capacity attribute initializer (Optional)
+        '''
+        self._capacity = capacity
+        self._pad = None
+        self._start = 0
+        self._stop = 0
+        self._key = None
+        self._view = None
+
+
+    def invalidate(self):
+        ''' Discards the held rows, so that the next block is rendered afresh '''
+        self._key = None
+
+
+    def hold(self, render, row, height, total, width, attr, fill_attr, source = None):
+        '''
+        Ensures that the pad holds the given rows, rendering a block of rows
+        around them if it does not
+
+        Parameters:
+            render (function): Renders the rows from a start index up to a stop
+                index as lines of text
+            row (int): Index of the first row needed
+            height (int): Number of rows needed
+            total (int): Number of rows available
+            width (int): Span of the widest row in terminal columns
+            attr (int): Curses style attribute of text
+            fill_attr (int): Curses style attribute of the background
+            source (object): Content the rows are rendered from; rows rendered
+                from other content are not held (Optional)
+        '''
+        key = (source, width, attr, fill_attr)
+        stop = min(row + height, total)
+        if key == self._key and self._start <= row and stop <= self._stop:
+            return
+
+        # Center the block on the needed rows.
+        capacity = max(self._capacity, height)
+        start = max(0, min(row - (capacity - height) // 2, total - capacity))
+        stop = min(total, start + capacity)
+        lines = render(start, stop)
+
+        # Resize the pad to fit the block, leaving its last column blank, since
+        # curses cannot add a character to the last cell of a pad.
+        pad_size = (max(1, stop - start), min(max(1, width) + 1, max_width))
+        if not self._pad or self._pad.getmaxyx() != pad_size:
+            self._pad = screen.backend.newpad(*pad_size)
+        pad = self._pad
+        pad.bkgdset(fill_attr)
+        pad.erase()
+        for i, line in enumerate(lines):
+            if line:
+                pad.addstr(i, 0, textwidth.clip(line, pad_size[1] - 1), attr)
+
+        self._start = start
+        self._stop = stop
+        self._key = key
+
+
+    def update(self, row, line):
+        '''
+        Renders a row again, if it is held
+
+        Parameters:
+            row (int): Index of the row
+            line (str): Line of text
+        '''
+        if self._key is None or not self._start <= row < self._stop:
+            return
+        pad = self._pad
+        width = pad.getmaxyx()[1] - 1
+        line = textwidth.pad(textwidth.clip(line, width), width)
+        pad.addstr(row - self._start, 0, line, self._key[2])
+
+
+    def show(self, win, y, x, row, col, height, width):
+        '''
+        Positions the held rows within a curses window, to be copied onto the
+        screen upon the next refresh
+
+        Parameters:
+            win (window): Curses window over which the rows are shown
+            y (int): Row of the window at which to show the rows
+            x (int): Column of the window at which to show the rows
+            row (int): Index of the first row to show
+            col (int): Column of the rows at which to start showing them
+            height (int): Number of rows to show
+            width (int): Number of columns to show
+        '''
+        self._view = None
+        if self._key is None or not self._start <= row < self._stop:
+            return
+
+        # Clip the region to the held rows.
+        pad_height, pad_width = self._pad.getmaxyx()
+        height = min(height, self._stop - row)
+        width = min(width, pad_width - col)
+        if height < 1 or width < 1:
+            return
+
+        win_y, win_x = win.getbegyx()
+        self._view = (
+            row - self._start, col, win_y + y, win_x + x,
+            win_y + y + height - 1, win_x + x + width - 1
+        )
+
+
+    def hide(self):
+        ''' Stops showing the held rows '''
+        self._view = None
+
+
+    def is_shown(self):
+        '''
+        Checks if the held rows are shown
+
+        Returns:
+            bool: True if the held rows are copied onto the screen upon refresh
+        '''
+        return self._view is not None
+
+
+    def refresh(self):
+        ''' Copies the shown rows onto the virtual screen, without updating it '''
+        if self._view:
+            self._pad.noutrefresh(*self._view)
@@ -0,0 +1,389 @@
+# Filename: profiler.py
+# Creation Date: Mon 19 Oct 2026
+# Last Modified: Mon 19 Oct 2026
+
+
+import curses
+import marshal
+import math
+import time
+import weakref
+from . import screen
+
+
+# Upper bounds (sec) of the duration buckets of each histogram; 1 usec doubling
+# up to about 8 sec, with a final bucket for anything slower.
+bucket_bounds = [1e-6 * 2 ** i for i in range(24)]
+
+# Characters used to draw histograms in the overlay, from emptiest to fullest.
+histogram_chars = ' .:-=+*#'
+
+
+class Profiler():
+    '''
+    Opt-in profiler for the user interface event loop, which times wrapped
+    functions, aggregates their durations into histograms, and accumulates
+    statistics in the format read by the "pstats" module
+
+    Attributes:
+        _labels (dict<str:list>): Number of calls, total time (sec), maximum
+            time (sec), and histogram of each timed function keyed by label
+        _stats (dict<tuple:list>): Primitive calls, total calls, internal time,
+            cumulative time, and callers of each timed function keyed by
+            "pstats" function identifier
+        _stack (list<list>): Function identifier and time spent in timed
+            callees of each timed call in progress
+        _depth (dict<tuple:int>): Recursion depth of each timed function keyed
+            by function identifier
+        _instrumented (WeakSet<Widget>): Widgets whose methods are timed
+        _overlay (window): Curses window of the live overlay; None until drawn
+        _show_overlay (bool): Flag controlling visibility of the live overlay
+        _toggle_key (int): Key that toggles the live overlay
+    '''
+    @property
+    def show_overlay(self):
+        ''' Getter for "show_overlay" property '''
+        return self._show_overlay
+
+
+    def __init__(self, show_overlay = False, toggle_key = curses.KEY_F12):
+        '''
+        Parameters:
+            show_overlay (bool): _show_overlay attribute initializer (Optional)
+            toggle_key (int): _toggle_key attribute initializer (Optional)
+        '''
+        self._labels = {}
+        self._stats = {}
+        self._stack = []
+        self._depth = {}
+        self._instrumented = weakref.WeakSet()
+        self._overlay = None
+        self._show_overlay = show_overlay
+        self._toggle_key = toggle_key
+
+
+    def time(self, label, function):
+        '''
+        Wraps the given function to time each of its calls
+
+        Parameters:
+            label (str): Name under which to aggregate timings
+            function (function|method): Function to time
+
+        Returns:
+            function: Timed function
+        '''
+        code = getattr(getattr(function, '__func__', function), '__code__', None)
+        key = (code.co_filename, code.co_firstlineno, label) if code else ('~', 0, label)
+        clock = time.perf_counter
+        stack = self._stack
+        depth = self._depth
+
+        def timed(*args, **kwargs):
+            frame = [key, 0.0]
+            stack.append(frame)
+            depth[key] = depth.get(key, 0) + 1
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                stack.pop()
+                depth[key] -= 1
+                caller = stack[-1] if stack else None
+                if caller:
+                    caller[1] += elapsed
+                self._record(
+                    label, key, elapsed, frame[1],
+                    caller[0] if caller else None, not depth[key]
+                )
+
+        return timed
+
+
+    def instrument(self, root):
+        '''
+        Times the draw, patch, and operate methods and the signal handlers of
+        every widget in the given tree, including deferred subtrees once built
+
+        Parameters:
+            root (Widget): Root of widget tree
+        '''
+        widgets = [root]
+        while widgets:
+            widget = widgets.pop()
+            widgets.extend(widget._children)
+
+            # Skip widgets that are already timed.
+            if widget in self._instrumented:
+                continue
+            self._instrumented.add(widget)
+
+            name = '{}({})'.format(type(widget).__name__, widget._label)
+            for method in ('draw', 'patch', 'operate'):
+                setattr(widget, method, self.time(
+                    '{}.{}'.format(name, method), getattr(widget, method)
+                ))
+
+            # Time deferred subtrees once they are built.
+            if widget._builder:
+                widget._build = self._time_build(name, widget)
+
+            # Time the handlers registered with the widget's signal router,
+            # aggregated by signal name.
+            router = widget._signal_router
+            if 'forward' not in vars(router):
+                router.forward = self._time_forward(name, router.forward)
+
+
+    def instrument_loop(self, root, draw, read_key, dispatch, handle_input):
+        '''
+        Times each phase of the event loop, and adds the live overlay to the
+        draw phase
+
+        Parameters:
+            root (Widget): Root of widget tree
+            draw (function): Draws tagged widgets without updating the screen
+            read_key (function): Reads user input
+            dispatch (function): Forwards the signal emitted while idle
+            handle_input (function): Transfers focus or operates the focused
+                widget in response to user input
+
+        Returns:
+            4-tuple: Timed draw, read_key, dispatch, and handle_input functions
+        '''
+        timed_draw = self.time('UI.draw', draw)
+        timed_update = self.time('UI.update', screen.backend.doupdate)
+        timed_read_key = self.time('UI.getch', read_key)
+
+        def draw_frame():
+            timed_draw()
+            self.draw_overlay(root)
+            timed_update()
+
+        def read_key_or_toggle(win):
+            c = timed_read_key(win)
+            if c == self._toggle_key:
+                self._show_overlay = not self._show_overlay
+                root.tag_redraw()
+                return -1
+            return c
+
+        return (
+            draw_frame, read_key_or_toggle,
+            self.time('UI.dispatch', dispatch),
+            self.time('UI.operate', handle_input)
+        )
+
+
+    def summary(self, limit = None):
+        '''
+        Summarizes timings, slowest total first
+
+        Parameters:
+            limit (int): Maximum number of labels to summarize (Optional)
+
+        Returns:
+            list<tuple>: Label, number of calls, total time (sec), mean time
+                (sec), 95th percentile bucket bound (sec), maximum time (sec),
+                and histogram of each timed function
+        '''
+        rows = []
+        for label, (count, total, maximum, histogram) in self._labels.items():
+            rows.append((
+                label, count, total, total / count,
+                self._percentile(histogram, count, 0.95), maximum, histogram
+            ))
+        rows.sort(key = lambda row: -row[2])
+        return rows[:limit] if limit else rows
+
+
+    def report(self, limit = None):
+        '''
+        Formats the summary of timings as text
+
+        Parameters:
+            limit (int): Maximum number of labels to report (Optional)
+
+        Returns:
+            str: Report with one line per label
+        '''
+        lines = ['{:<44} {:>8} {:>10} {:>10} {:>10}  {}'.format(
+            'Label', 'Calls', 'Total ms', 'Mean ms', 'p95 ms', 'Histogram (1us..8s)'
+        )]
+        for label, count, total, mean, p95, maximum, histogram in self.summary(limit):
+            lines.append('{:<44} {:>8} {:>10.2f} {:>10.3f} {:>10.3f}  {}'.format(
+                label[:44], count, total * 1000, mean * 1000, p95 * 1000,
+                self._draw_histogram(histogram)
+            ))
+        return '\n'.join(lines)
+
+
+    def dump(self, path):
+        '''
+        Writes timings to a file readable by "pstats.Stats" and the tools built
+        on it, such as flame graph generators
+
+        Parameters:
+            path (str): Path to profile file
+        '''
+        stats = {
+            key: (cc, nc, tt, ct, {caller: tuple(c) for caller, c in callers.items()})
+            for key, (cc, nc, tt, ct, callers) in self._stats.items()
+        }
+        with open(path, 'wb') as f:
+            marshal.dump(stats, f)
+
+
+    def draw_overlay(self, root):
+        '''
+        Draws the slowest timed functions over the given tree of widgets, if the
+        live overlay is shown
+
+        Parameters:
+            root (Widget): Root of widget tree
+        '''
+        if not self._show_overlay:
+            return
+
+        # Fit the overlay to the top right corner of the screen.
+        screen_height, screen_width = root._win.getmaxyx()
+        width = min(screen_width, 78)
+        height = min(screen_height, 12)
+        if (not self._overlay
+            or self._overlay.getmaxyx() != (height, width)
+            or self._overlay.getbegyx() != (0, screen_width - width)
+        ):
+            self._overlay = screen.backend.newwin(height, width, 0, screen_width - width)
+        win = self._overlay
+        win.erase()
+
+        # Show the slowest timed functions by total time.
+        win.addstr(0, 0, ' {:<30}{:>9}{:>9}  {}'.format(
+            'Profile (F12 hides)', 'Calls', 'Mean ms', 'Histogram'
+        )[:width], curses.A_REVERSE)
+        rows = self.summary(height - 1)
+        for row, (label, count, total, mean, p95, maximum, histogram) in enumerate(rows):
+            win.addstr(row + 1, 0, ' {:<30}{:>9}{:>9.3f}  {}'.format(
+                label[:29], count, mean * 1000, self._draw_histogram(histogram)
+            )[:width - 1])
+        win.noutrefresh()
+
+
+    def _record(self, label, key, elapsed, callee_time, caller, is_outermost):
+        '''
+        Accumulates the timing of a call
+
+        Parameters:
+            label (str): Name under which timings are aggregated
+            key (tuple): "pstats" function identifier
+            elapsed (float): Duration (sec) of the call
+            callee_time (float): Time (sec) spent in timed callees
+            caller (tuple): Function identifier of the timed caller, if any
+            is_outermost (bool): Flag indicating that the call is not recursive
+        '''
+        # Add the call to its histogram.
+        if label not in self._labels:
+            self._labels[label] = [0, 0.0, 0.0, [0] * (len(bucket_bounds) + 1)]
+        stats = self._labels[label]
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] = max(stats[2], elapsed)
+        bucket = math.frexp(elapsed / bucket_bounds[0])[1] if elapsed > bucket_bounds[0] else 0
+        stats[3][min(bucket, len(bucket_bounds))] += 1
+
+        # Accumulate statistics of the function and of its caller's calls.
+        if key not in self._stats:
+            self._stats[key] = [0, 0, 0.0, 0.0, {}]
+        entries = [self._stats[key]]
+        if caller:
+            entries.append(self._stats[key][4].setdefault(caller, [0, 0, 0.0, 0.0]))
+        for entry in entries:
+            entry[1] += 1
+            entry[2] += elapsed - callee_time
+            if is_outermost:
+                entry[0] += 1
+                entry[3] += elapsed
+
+
+    def _time_build(self, name, widget):
+        '''
+        Wraps a widget's build method to time construction of its deferred
+        subtree, and then the subtree itself
+
+        Parameters:
+            name (str): Name of the widget
+            widget (Widget): Widget whose construction is deferred
+
+        Returns:
+            function: Timed build method
+        '''
+        build = self.time('{}.build'.format(name), widget._build)
+
+        def timed_build():
+            build()
+            self.instrument(widget)
+
+        return timed_build
+
+
+    def _time_forward(self, name, forward):
+        '''
+        Wraps a signal router's forward method to time handling of each signal
+
+        Parameters:
+            name (str): Name of the widget owning the signal router
+            forward (method): Forward method of the signal router
+
+        Returns:
+            function: Timed forward method
+        '''
+        timed_forwards = {}
+
+        def timed_forward(signal, reverse = False):
+            signame = signal.data['_name']
+            if signame not in timed_forwards:
+                timed_forwards[signame] = self.time(
+                    '{}:{}'.format(name, signame), forward
+                )
+            return timed_forwards[signame](signal, reverse)
+
+        return timed_forward
+
+
+    def _percentile(self, histogram, count, fraction):
+        '''
+        Estimates a percentile from a histogram
+
+        Parameters:
+            histogram (list<int>): Number of calls in each duration bucket
+            count (int): Total number of calls
+            fraction (float): Percentile as a fraction
+
+        Returns:
+            float: Upper bound (sec) of the bucket containing the percentile
+        '''
+        seen = 0
+        for i, n in enumerate(histogram):
+            seen += n
+            if seen >= fraction * count:
+                return bucket_bounds[min(i, len(bucket_bounds) - 1)]
+        return bucket_bounds[-1]
+
+
+    def _draw_histogram(self, histogram):
+        '''
+        Renders a histogram as a row of characters, one per duration bucket
+
+        Parameters:
+            histogram (list<int>): Number of calls in each duration bucket
+
+        Returns:
+            str: Histogram of call durations
+        '''
+        peak = max(histogram)
+        scale = len(histogram_chars) - 1
+        return ''.join(
+            histogram_chars[math.ceil(scale * n / peak) if peak else 0]
+            for n in histogram
+        ).rstrip()
@@ -0,0 +1,155 @@
+# Filename: results.py
+# Creation Date: Mon 19 Oct 2026
+# Last Modified: Mon 19 Oct 2026
+
+
+# Type OIDs of PostgreSQL's numeric types, whose values are right-aligned.
+numeric_types = {20, 21, 23, 26, 700, 701, 790, 1700}
+
+# Type OIDs of types whose equal values always format identically, so that
+# formatted values can be memoized: integers, dates, and times & timestamps
+# without time zones.
+cached_types = {20, 21, 23, 26, 1082, 1083, 1114}
+
+# Maximum number of formatted values memoized per type.
+cache_size = 4096
+
+# Memoized formatted values keyed by type OID, then by value.
+_formatted = {}
+
+
+class ResultBatch():
+    '''
+    Column-oriented batch of typed query results, carrying the column names
+    and PostgreSQL type OIDs reported by the database driver
+
+    Attributes:
+        _names (list<str>): Column names
+        _type_codes (list<int>): Type OID of each column
+        _columns (list<sequence>): Values of each column, in row order
+        _is_text (bool): Flag indicating that values are already formatted as
+            PostgreSQL's text representation, rather than parsed by the driver
+    '''
+    @property
+    def names(self):
+        ''' Getter for "names" property '''
+        return self._names
+
+
+    @property
+    def type_codes(self):
+        ''' Getter for "type_codes" property '''
+        return self._type_codes
+
+
+    @property
+    def columns(self):
+        ''' Getter for "columns" property '''
+        return self._columns
+
+
+    @property
+    def is_text(self):
+        ''' Getter for "is_text" property '''
+        return self._is_text
+
+
+    def __init__(self, names, type_codes, columns, is_text = False):
+        '''
+        Parameters:
+            names (list<str>): _names attribute initializer
+            type_codes (list<int>): _type_codes attribute initializer
+            columns (list<sequence>): _columns attribute initializer
+            is_text (bool): _is_text attribute initializer (Optional)
+        '''
+        self._names = list(names)
+        self._type_codes = list(type_codes)
+        self._columns = list(columns)
+        self._is_text = is_text
+
+
+    def __len__(self):
+        return len(self._columns[0]) if self._columns else 0
+
+
+    @classmethod
+    def from_rows(cls, names, type_codes, rows, is_text = False):
+        '''
+        Builds a batch from rows of values, e.g. as fetched from a cursor
+
+        Parameters:
+            names (list<str>): Column names
+            type_codes (list<int>): Type OID of each column
+            rows (sequence<sequence>): Rows of values
+            is_text (bool): Flag indicating that values are already formatted
+                as text (Optional)
+
+        Returns:
+            ResultBatch: Batch of the given rows
+        '''
+        columns = list(zip(*rows)) if rows else [() for name in names]
+        return cls(names, type_codes, columns, is_text)
+
+
+    def is_numeric(self, i):
+        '''
+        Checks if a column holds numbers
+
+        Parameters:
+            i (int): Column index
+
+        Returns:
+            bool: True if the column's type is numeric
+        '''
+        return self._type_codes[i] in numeric_types
+
+
+    def format_column(self, i):
+        '''
+        Formats the values of a column as text; null values are blank
+
+        Parameters:
+            i (int): Column index
+
+        Returns:
+            list<str>: Formatted values, in row order
+        '''
+        values = self._columns[i]
+        if self._is_text:
+            return ['' if value is None else value for value in values]
+
+        type_code = self._type_codes[i]
+        if type_code not in cached_types:
+            return ['' if value is None else str(value) for value in values]
+
+        # Reuse values formatted for earlier batches.
+        cache = _formatted.setdefault(type_code, {})
+        if len(cache) >= cache_size:
+            cache.clear()
+        column = []
+        for j, value in enumerate(values):
+            text = cache.get(value)
+            if text is None:
+                text = cache[value] = '' if value is None else str(value)
+
+                # Values too distinct to memoize, e.g. keys, are formatted
+                # directly once the cache fills.
+                if len(cache) >= cache_size:
+                    column.append(text)
+                    column.extend(
+                        '' if rest is None else str(rest) for rest in values[j + 1:]
+                    )
+                    return column
+            column.append(text)
+        return column
+
+
+    def format_rows(self):
+        '''
+        Formats the values of every column as text
+
+        Returns:
+            list<list<str>>: Rows of formatted values
+        '''
+        columns = [self.format_column(i) for i in range(len(self._columns))]
+        return [list(row) for row in zip(*columns)]
@@ -0,0 +1,438 @@
+# Filename: screen.py
+# Creation Date: Mon 19 Oct 2026
+# Last Modified: Mon 19 Oct 2026
+
+
+import collections
+import curses
+import curses.ascii as ascii
+from . import textwidth
+
+
+# Screen backend used by the UI framework; any object providing the subset of
+# the curses module API listed in FakeCurses may stand in for curses.
+backend = curses
+
+# Window from which regions read user input; created upon first use.
+input_window = None
+
+
+def set_backend(new_backend):
+    '''
+    Replaces the screen backend used by the UI framework
+
+    Parameters:
+        new_backend (module|FakeCurses): Curses module or stand-in for it
+    '''
+    global backend, input_window
+    backend = new_backend
+    input_window = None
+
+
+class Region():
+    '''
+    Screen region standing in for the curses window of a widget until the
+    widget is first drawn; widgets that are never drawn, such as groups, never
+    allocate a window
+
+    Attributes:
+        _height (int): Region height in rows
+        _width (int): Region width in columns
+        _y (int): Screen row of the top edge of this region
+        _x (int): Screen column of the left edge of this region
+    '''
+    def __init__(self, height, width, y, x):
+        '''
+        Parameters:
+            height (int): Region height in rows
+            width (int): Region width in columns
+            y (int): Screen row of the top edge of this region
+            x (int): Screen column of the left edge of this region
+        '''
+        self._height = height
+        self._width = width
+        self._y = y
+        self._x = x
+
+
+    def getmaxyx(self):
+        return self._height, self._width
+
+
+    def getbegyx(self):
+        return self._y, self._x
+
+
+    def resize(self, height, width):
+        self._height = height
+        self._width = width
+
+
+    def mvwin(self, y, x):
+        self._y = y
+        self._x = x
+
+
+    def getch(self):
+        # Read input through a single window shared by all regions.
+        global input_window
+        if not input_window:
+            input_window = backend.newwin(1, 1, 0, 0)
+            input_window.keypad(1)
+            input_window.nodelay(1)
+        return input_window.getch()
+
+
+    def allocate(self):
+        '''
+        Allocates a curses window matching the extents of this region
+
+        Returns:
+            window: Curses window
+        '''
+        win = backend.newwin(self._height, self._width, self._y, self._x)
+        win.keypad(1)
+        win.nodelay(1)
+        return win
+
+
+# Line drawing characters that curses defines upon initialization.
+fake_acs = {
+    'ACS_VLINE': ord('|'), 'ACS_HLINE': ord('-'), 'ACS_ULCORNER': ord('+'),
+    'ACS_URCORNER': ord('+'), 'ACS_LLCORNER': ord('+'),
+    'ACS_LRCORNER': ord('+'), 'ACS_LTEE': ord('+'), 'ACS_RTEE': ord('+'),
+    'ACS_TTEE': ord('+'), 'ACS_BTEE': ord('+'), 'ACS_PLUS': ord('+')
+}
+
+
+class FakeCurses():
+    '''
+    In-memory stand-in for the curses module, for running the UI framework
+    without a terminal; scripted input is consumed by getch, and each window
+    is composited onto a virtual screen upon refresh
+
+    Attributes:
+        _width (int): Screen width in columns
+        _height (int): Screen height in rows
+        _input (deque<int|callable>): Pending key codes, and callbacks to run
+            in place of reading a key
+        _lines (list<list<str>>): Characters of the virtual screen
+        _is_endwin (bool): Flag indicating if the screen is deinitialized
+        frames (int): Number of screen updates
+    '''
+    def __init__(self, width = 80, height = 24):
+        '''
+        Parameters:
+            width (int): Screen width in columns (Optional)
+            height (int): Screen height in rows (Optional)
+        '''
+        self._width = width
+        self._height = height
+        self._input = collections.deque()
+        self._lines = [[' '] * width for i in range(height)]
+        self._is_endwin = True
+        self.frames = 0
+
+
+    def feed(self, *keys):
+        '''
+        Queues scripted input
+
+        Parameters:
+            keys (int|str|callable): Key codes, strings of characters to type,
+                or callbacks to run when read (e.g. to forward a signal)
+        '''
+        for key in keys:
+            if isinstance(key, str):
+                self._input.extend(ord(char) for char in key)
+            else:
+                self._input.append(key)
+
+
+    def resizeterm(self, nlines, ncols):
+        '''
+        Resizes the virtual screen, as a terminal resize does; as with curses,
+        the application learns of it by reading curses.KEY_RESIZE
+
+        Parameters:
+            nlines (int): Screen height in rows
+            ncols (int): Screen width in columns
+        '''
+        self._height = nlines
+        self._width = ncols
+        self._lines = [[' '] * ncols for i in range(nlines)]
+
+
+    def pending(self):
+        '''
+        Counts queued input
+
+        Returns:
+            int: Number of queued keys and callbacks
+        '''
+        return len(self._input)
+
+
+    def display(self):
+        '''
+        Renders the virtual screen as text
+
+        Returns:
+            list<str>: Lines of text
+        '''
+        return [''.join(line) for line in self._lines]
+
+
+    def read_input(self):
+        '''
+        Reads the next scripted key, or runs the next scripted callback
+
+        Returns:
+            int: Key code; -1 if no key is read
+        '''
+        if not self._input:
+            return -1
+        key = self._input.popleft()
+        if callable(key):
+            key()
+            return -1
+        return key
+
+
+    def initscr(self):
+        # Define line drawing characters, as curses does upon initialization.
+        for name, char in fake_acs.items():
+            if not hasattr(curses, name):
+                setattr(curses, name, char)
+        self._is_endwin = False
+        return self.newwin(0, 0)
+
+
+    def endwin(self):
+        self._is_endwin = True
+
+
+    def isendwin(self):
+        return self._is_endwin
+
+
+    def newwin(self, *args):
+        # Fill the screen from the given origin, if no dimensions are given.
+        if len(args) < 4:
+            y, x = args if args else (0, 0)
+            height, width = 0, 0
+        else:
+            height, width, y, x = args
+        height = height if height else self._height - y
+        width = width if width else self._width - x
+        return FakeWindow(self, height, width, y, x)
+
+
+    def newpad(self, nlines, ncols):
+        return FakeWindow(self, nlines, ncols, 0, 0)
+
+
+    def doupdate(self):
+        self.frames += 1
+
+
+    def keyname(self, n):
+        for name in dir(curses):
+            if name.startswith('KEY_') and getattr(curses, name) == n:
+                return name.encode('utf-8')
+        return ascii.unctrl(n).encode('utf-8')
+
+
+    def noecho(self):
+        return
+
+
+    def cbreak(self):
+        return
+
+
+    def curs_set(self, visibility):
+        return
+
+
+    def has_colors(self):
+        return False
+
+
+    def can_change_color(self):
+        return False
+
+
+    def start_color(self):
+        return
+
+
+    def init_color(self, color_number, r, g, b):
+        return
+
+
+    def init_pair(self, pair_number, fg, bg):
+        return
+
+
+    def color_pair(self, pair_number):
+        return pair_number << 8
+
+
+class FakeWindow():
+    '''
+    In-memory stand-in for a curses window; text attributes are discarded
+
+    Attributes:
+        _screen (FakeCurses): Screen on which this window is displayed
+        _height (int): Window height in rows
+        _width (int): Window width in columns
+        _y (int): Screen row of the top edge of this window
+        _x (int): Screen column of the left edge of this window
+        _lines (list<list<str>>): Characters of this window
+    '''
+    def __init__(self, screen, height, width, y, x):
+        '''
+        Parameters:
+            screen (FakeCurses): Screen on which this window is displayed
+            height (int): Window height in rows
+            width (int): Window width in columns
+            y (int): Screen row of the top edge of this window
+            x (int): Screen column of the left edge of this window
+        '''
+        self._screen = screen
+        self._height = height
+        self._width = width
+        self._y = y
+        self._x = x
+        self._lines = [[' '] * width for i in range(height)]
+
+
+    def getmaxyx(self):
+        return self._height, self._width
+
+
+    def getbegyx(self):
+        return self._y, self._x
+
+
+    def resize(self, height, width):
+        lines = self._lines
+        for line in lines:
+            del line[width:]
+            line.extend([' '] * (width - len(line)))
+        del lines[height:]
+        lines.extend([' '] * width for i in range(height - len(lines)))
+        self._height = height
+        self._width = width
+
+
+    def mvwin(self, y, x):
+        self._y = y
+        self._x = x
+
+
+    def keypad(self, flag):
+        return
+
+
+    def nodelay(self, flag):
+        return
+
+
+    def getch(self):
+        return self._screen.read_input()
+
+
+    def bkgdset(self, attr):
+        return
+
+
+    def erase(self):
+        width = self._width
+        for line in self._lines:
+            line[:] = [' '] * width
+
+
+    def attron(self, attr):
+        return
+
+
+    def attroff(self, attr):
+        return
+
+
+    def chgat(self, y, x, num, attr):
+        return
+
+
+    def addstr(self, y, x, text, attr = 0):
+        if 0 <= y < self._height and 0 <= x < self._width:
+
+            # Lay out characters in cells as a terminal does; wide characters
+            # span two cells, and combining marks join the preceding character.
+            cells = text
+            if not text.isascii():
+                cells = []
+                for char in text:
+                    char_width = textwidth.char_width(char)
+                    if not char_width:
+                        if cells:
+                            cells[-1] += char
+                    elif char_width == 2:
+                        cells.extend((char, ''))
+                    else:
+                        cells.append(char)
+            cells = cells[:self._width - x]
+            self._lines[y][x:x + len(cells)] = cells
+
+
+    def addch(self, y, x, ch, attr = 0):
+        if 0 <= y < self._height and 0 <= x < self._width:
+            self._lines[y][x] = ch if isinstance(ch, str) else chr(ch)
+
+
+    def insch(self, y, x, ch, attr = 0):
+        self.addch(y, x, ch, attr)
+
+
+    def hline(self, y, x, ch, n):
+        for i in range(max(0, n)):
+            self.addch(y, x + i, ch)
+
+
+    def vline(self, y, x, ch, n):
+        for i in range(max(0, n)):
+            self.addch(y + i, x, ch)
+
+
+    def noutrefresh(self, *args):
+        # Composite a region of this pad onto the virtual screen.
+        if args:
+            pminrow, pmincol, sminrow, smincol, smaxrow, smaxcol = args
+            screen_lines = self._screen._lines
+            screen_width = len(screen_lines[0]) if screen_lines else 0
+            width = max(0, min(smaxcol + 1, screen_width) - smincol)
+            for i in range(smaxrow - sminrow + 1):
+                y = sminrow + i
+                if 0 <= y < len(screen_lines) and pminrow + i < self._height:
+                    line = self._lines[pminrow + i]
+                    segment = line[pmincol:pmincol + width]
+
+                    # Blank wide characters cut by either edge of the region.
+                    if segment and segment[0] == '':
+                        segment[0] = ' '
+                    if segment and line[pmincol + len(segment):pmincol + len(segment) + 1] == ['']:
+                        segment[-1] = ' '
+                    screen_lines[y][smincol:smincol + len(segment)] = segment
+            return
+
+        # Composite this window onto the virtual screen.
+        screen_lines = self._screen._lines
+        screen_width = len(screen_lines[0]) if screen_lines else 0
+        for i, line in enumerate(self._lines):
+            y = self._y + i
+            if 0 <= y < len(screen_lines):
+                x = self._x
+                segment = line[:max(0, screen_width - x)]
+                screen_lines[y][x:x + len(segment)] = segment
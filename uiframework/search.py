@@ -0,0 +1,291 @@
+# Filename: search.py
+# Creation Date: Mon 19 Oct 2026
+# Last Modified: Mon 19 Oct 2026
+
+
+class SearchIndex():
+    '''
+    Incremental, case-insensitive search over rows of text cells; lowercase
+    cells are indexed and scanned for matches a few rows at a time, so that
+    large datasets can be searched without blocking user input
+
+    Attributes:
+        _rows (list<list<str>>): Rows of text cells to search
+        _index (list<list<str>>): Lowercase cells of each indexed row
+        _query (str): Lowercase search query
+        _matches (list<3-tuple<int>>): Row, cell, and character offset of each
+            match found so far, in order of occurrence
+        _scanned (int): Number of rows scanned for matches
+        _match_curr (int): Index of current match; -1 if none
+    '''
+    @property
+    def query(self):
+        ''' Getter for "query" property '''
+        return self._query
+
+
+    @property
+    def is_complete(self):
+        ''' Getter for "is_complete" property '''
+        return self._scanned == len(self._rows)
+
+
+    def __init__(self, rows = []):
+        '''
+        Parameters:
+            rows (list<list<str>>): Rows of text cells to search (Optional)
+        '''
+        self._query = ''
+        self.reset(rows)
+
+
+    def reset(self, rows):
+        '''
+        Discards the index and any matches in favor of new rows
+
+        Parameters:
+            rows (list<list<str>>): Rows of text cells to search
+        '''
+        self._rows = rows
+        self._index = []
+        self._matches = []
+        self._scanned = 0
+        self._match_curr = -1
+
+
+    def search(self, query):
+        '''
+        Starts searching for the given query; refining a completed search
+        filters its matches instead of scanning all rows again
+
+        Parameters:
+            query (str): Search query
+        '''
+        query = query.lower()
+        prev_query = self._query
+        self._query = query
+        self._match_curr = -1
+
+        # Narrow the existing matches down to those of the refined query.
+        if query and prev_query and query.startswith(prev_query) and self.is_complete:
+            index = self._index
+            self._matches = [
+                match for match in self._matches
+                if index[match[0]][match[1]].startswith(query, match[2])
+            ]
+
+        # Otherwise, start the scan over.
+        else:
+            self._matches = []
+            self._scanned = 0
+
+
+    def advance(self, budget = 5000):
+        '''
+        Indexes and scans the next batch of rows
+
+        Parameters:
+            budget (int): Maximum number of rows to process (Optional)
+
+        Returns:
+            bool: True if matches are found; False otherwise
+        '''
+        rows = self._rows
+        index = self._index
+        query = self._query
+        if not query or self.is_complete:
+            return False
+
+        # Index the rows being scanned, if not already indexed.
+        start = self._scanned
+        stop = min(len(rows), start + budget)
+        for row in rows[len(index):stop]:
+            index.append([cell.lower() for cell in row])
+
+        # Scan indexed rows for every occurrence of the query.
+        num_matches = len(self._matches)
+        matches = self._matches
+        for i in range(start, stop):
+            for j, cell in enumerate(index[i]):
+                offset = cell.find(query)
+                while offset != -1:
+                    matches.append((i, j, offset))
+                    offset = cell.find(query, offset + 1)
+        self._scanned = stop
+
+        return len(matches) > num_matches
+
+
+    def count(self):
+        '''
+        Counts the matches found so far
+
+        Returns:
+            int: Number of matches
+        '''
+        return len(self._matches)
+
+
+    def current(self):
+        '''
+        Retrieves the current match
+
+        Returns:
+            3-tuple<int>: Row, cell, and character offset; None if no match is
+                current
+        '''
+        if self._match_curr < 0:
+            return None
+        return self._matches[self._match_curr]
+
+
+    def step(self, direction = 1, row = None):
+        '''
+        Moves to the next or previous match, wrapping around at either end
+
+        Parameters:
+            direction (int): Step direction in {1, -1} (Optional)
+            row (int): Row from which to find the first match (Optional)
+
+        Returns:
+            3-tuple<int>: Row, cell, and character offset; None if there are no
+                matches
+        '''
+        matches = self._matches
+        if not matches:
+            return None
+
+        # Start from the first match at or after the given row, or from the
+        # last match before it when stepping backward.
+        if self._match_curr < 0:
+            if row is None:
+                self._match_curr = 0 if direction > 0 else len(matches) - 1
+            elif direction > 0:
+                self._match_curr = next(
+                    (i for i, match in enumerate(matches) if match[0] >= row), 0
+                )
+            else:
+                self._match_curr = next(
+                    (i for i in range(len(matches) - 1, -1, -1) if matches[i][0] < row),
+                    len(matches) - 1
+                )
+
+        # Otherwise, step relative to the current match.
+        else:
+            self._match_curr = (self._match_curr + direction) % len(matches)
+
+        return matches[self._match_curr]
+
+
+    def is_match(self, row, cell):
+        '''
+        Checks if the given cell contains the query
+
+        Parameters:
+            row (int): Row index
+            cell (int): Cell index
+
+        Returns:
+            bool: True if the cell matches; False otherwise
+        '''
+        if not self._query:
+            return False
+        if row < len(self._index):
+            return self._query in self._index[row][cell]
+        return self._query in self._rows[row][cell].lower()
+
+
+class TrigramIndex():
+    '''
+    Case-insensitive, fuzzy filter over a list of names; each whitespace-
+    separated fragment of a query must occur in a name, in any order, and
+    candidates are found by intersecting precomputed trigram postings
+
+    Attributes:
+        _names (sequence<str>): Names to filter
+        _lowered (list<str>): Lowercase names; None until the index is built
+        _postings (dict<str:set<int>>): Indices of names keyed by trigram
+    '''
+    @property
+    def is_built(self):
+        ''' Getter for "is_built" property '''
+        return self._lowered is not None
+
+
+    def __init__(self, names = []):
+        '''
+        Parameters:
+            names (sequence<str>): Names to filter (Optional)
+        '''
+        self.reset(names)
+
+
+    def reset(self, names):
+        '''
+        Discards the index in favor of new names; the index is rebuilt upon the
+        next match
+
+        Parameters:
+            names (sequence<str>): Names to filter
+        '''
+        self._names = names
+        self._lowered = None
+        self._postings = {}
+
+
+    def build(self):
+        ''' Indexes the trigrams of every name '''
+        postings = {}
+        lowered = [name.lower() for name in self._names[0:len(self._names)]]
+        for i, name in enumerate(lowered):
+            for trigram in {name[j:j + 3] for j in range(len(name) - 2)}:
+                posting = postings.get(trigram)
+                if posting is None:
+                    postings[trigram] = posting = set()
+                posting.add(i)
+        self._lowered = lowered
+        self._postings = postings
+
+
+    def match(self, query, candidates = None):
+        '''
+        Filters names by the given query
+
+        Parameters:
+            query (str): Filter query
+            candidates (list<int>): Indices of names to filter, e.g. the matches
+                of a query that this one refines; all names if unspecified
+                (Optional)
+
+        Returns:
+            list<int>: Indices of matching names, in ascending order
+        '''
+        if not self.is_built:
+            self.build()
+        lowered = self._lowered
+        postings = self._postings
+        fragments = query.lower().split()
+
+        # Intersect the postings of each fragment's trigrams, smallest first.
+        trigrams = {
+            fragment[j:j + 3]
+            for fragment in fragments for j in range(len(fragment) - 2)
+        }
+        matches = None
+        for posting in sorted((postings.get(t, ()) for t in trigrams), key = len):
+            matches = set(posting) if matches is None else matches & posting
+            if not matches:
+                return []
+        if matches is None:
+            matches = candidates if candidates is not None else range(len(lowered))
+        else:
+            if candidates is not None:
+                matches.intersection_update(candidates)
+            matches = sorted(matches)
+
+        # Check fragments that trigrams alone do not decide.
+        for fragment in fragments:
+            if len(fragment) != 3:
+                matches = [i for i in matches if fragment in lowered[i]]
+
+        return list(matches)
@@ -0,0 +1,208 @@
+# Filename: session.py
+# Creation Date: Mon 19 Oct 2026
+# Last Modified: Mon 19 Oct 2026
+
+
+import json
+import time
+
+
+class KeyboardInput():
+    ''' Source of user input read from the focused widget's curses window '''
+    def read(self, win):
+        '''
+        Reads a key
+
+        Parameters:
+            win (window): Curses window of the focused widget
+
+        Returns:
+            int: Key code; -1 if no input is pending
+        '''
+        return win.getch()
+
+
+class SessionRecorder():
+    '''
+    Source of user input that passes through keys from another source while
+    recording them with timestamps
+
+    Attributes:
+        _source (KeyboardInput): Source of recorded keys
+        _events (list<2-tuple<float, int>>): Time (sec) since the start of the
+            session and code of each key
+        _start (float): Start time of the session; None until the first read
+    '''
+    @property
+    def events(self):
+        ''' Getter for "events" property '''
+        return self._events
+
+
+    def __init__(self, source = None):
+        '''
+        Parameters:
+            source (KeyboardInput): Source of recorded keys (Optional)
+        '''
+        self._source = source if source else KeyboardInput()
+        self._events = []
+        self._start = None
+
+
+    def read(self, win):
+        '''
+        Reads and records a key
+
+        Parameters:
+            win (window): Curses window of the focused widget
+
+        Returns:
+            int: Key code; -1 if no input is pending
+        '''
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+        c = self._source.read(win)
+        if c != -1:
+            self._events.append((now - self._start, c))
+        return c
+
+
+    def save(self, path):
+        '''
+        Writes the recorded session to a file
+
+        Parameters:
+            path (str): Path to session file
+        '''
+        with open(path, 'w') as f:
+            json.dump({'events': self._events}, f)
+
+
+class SessionReplayer():
+    '''
+    Source of user input that replays a recorded session, either at full
+    speed or in real time, and measures the latency of each step
+
+    Attributes:
+        _events (list<2-tuple<float, int>>): Time (sec) since the start of the
+            session and code of each key
+        _realtime (bool): Flag indicating if recorded timing is reproduced
+        _on_end (function): Callback run once the session is exhausted
+        _step (int): Index of the next event to replay
+        _start (float): Start time of the replay; None until the first read
+        _delivered (float): Time at which the last key was delivered; None if
+            its step is complete
+        _latencies (list<2-tuple<int, float>>): Key code and latency (sec) of
+            each replayed step, from delivering its key until the next read
+    '''
+    @property
+    def latencies(self):
+        ''' Getter for "latencies" property '''
+        return self._latencies
+
+
+    @property
+    def is_complete(self):
+        ''' Getter for "is_complete" property '''
+        return self._step >= len(self._events)
+
+
+    def __init__(self, events, realtime = False, on_end = None):
+        '''
+        Parameters:
+            events (list<2-tuple<float, int>>): Time (sec) since the start of
+                the session and code of each key
+            realtime (bool): Flag controlling reproduction of recorded timing
+                (Optional)
+            on_end (function): Callback run once the session is exhausted,
+                e.g. to exit the user interface (Optional)
+        '''
+        self._events = [tuple(event) for event in events]
+        self._realtime = realtime
+        self._on_end = on_end
+        self._step = 0
+        self._start = None
+        self._delivered = None
+        self._latencies = []
+
+
+    @classmethod
+    def load(cls, path, realtime = False, on_end = None):
+        '''
+        Reads a recorded session from a file
+
+        Parameters:
+            path (str): Path to session file
+            realtime (bool): Flag controlling reproduction of recorded timing
+                (Optional)
+            on_end (function): Callback run once the session is exhausted
+                (Optional)
+
+        Returns:
+            SessionReplayer: Replayer of the recorded session
+        '''
+        with open(path) as f:
+            return cls(json.load(f)['events'], realtime, on_end)
+
+
+    def read(self, win):
+        '''
+        Replays the next key once it is due
+
+        Parameters:
+            win (window): Curses window of the focused widget
+
+        Returns:
+            int: Key code; -1 if no key is due
+        '''
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+
+        # Complete the step of the previously delivered key.
+        if self._delivered is not None:
+            self._latencies[-1] = (self._latencies[-1][0], now - self._delivered)
+            self._delivered = None
+
+        # Signal the end of the session.
+        if self.is_complete:
+            if self._on_end:
+                on_end, self._on_end = self._on_end, None
+                on_end()
+            return -1
+
+        # Deliver the next key once it is due.
+        t, c = self._events[self._step]
+        if self._realtime and now - self._start < t:
+            return -1
+        self._step += 1
+        self._delivered = now
+        self._latencies.append((c, 0.0))
+        return c
+
+
+    def report(self, key_name = str):
+        '''
+        Summarizes the latency of each replayed step
+
+        Parameters:
+            key_name (function): Converts a key code to a display name
+                (Optional)
+
+        Returns:
+            str: Report with one line per step, followed by totals
+        '''
+        lines = ['{:>6}  {:<12} {:>10}'.format('Step', 'Key', 'Latency ms')]
+        for i, (c, latency) in enumerate(self._latencies):
+            lines.append('{:>6}  {:<12} {:>10.2f}'.format(i + 1, key_name(c), latency * 1000))
+
+        # Summarize latencies.
+        latencies = sorted(latency for c, latency in self._latencies)
+        if latencies:
+            lines.append('Steps: {}, Mean: {:.2f} ms, 95th: {:.2f} ms, Max: {:.2f} ms'.format(
+                len(latencies), sum(latencies) / len(latencies) * 1000,
+                latencies[int(0.95 * (len(latencies) - 1))] * 1000,
+                latencies[-1] * 1000
+            ))
+        return '\n'.join(lines)
@@ -4,7 +4,9 @@
 # Author: Brett Fedack
 
 
+import collections
 import inspect
+import time
 import weakref
 
 
@@ -43,17 +45,149 @@ class Signal():
         return self._data
 
 
+class SignalTrace():
+    '''
+    Ring buffer of forwarded signals and per-signal summaries, recorded while
+    signal routers are tracing
+
+    Attributes:
+        _records (deque<tuple>): Most recent forwards; each holds the signal
+            name, hop count, handler count, duration (sec), and the name and
+            duration (sec) of each visited handler
+        _summaries (dict<str:list>): Number of forwards, forwards that reached
+            a handler, handler calls, total duration (sec), maximum duration
+            (sec), and maximum hop count keyed by signal name
+        _hops (int): Number of forwards in progress, i.e. the hop count of a
+            signal forwarded by a handler
+    '''
+    @property
+    def records(self):
+        ''' Getter for "records" property '''
+        return self._records
+
+
+    def __init__(self, capacity = 4096):
+        '''
+        Parameters:
+            capacity (int): Maximum number of recent forwards to keep
+                (Optional)
+        '''
+        self._records = collections.deque(maxlen = capacity)
+        self._summaries = {}
+        self._hops = 0
+
+
+    def record(self, signame, hops, handlers, duration):
+        '''
+        Records a forwarded signal
+
+        Parameters:
+            signame (str): Signal name
+            hops (int): Number of forwards in progress when the signal was
+                forwarded
+            handlers (list<2-tuple<str, float>>): Name and duration (sec) of each
+                visited handler
+            duration (float): Duration (sec) of the forward
+        '''
+        self._records.append((signame, hops, len(handlers), duration, handlers))
+        if signame not in self._summaries:
+            self._summaries[signame] = [0, 0, 0, 0.0, 0.0, 0]
+        summary = self._summaries[signame]
+        summary[0] += 1
+        summary[1] += 1 if handlers else 0
+        summary[2] += len(handlers)
+        summary[3] += duration
+        summary[4] = max(summary[4], duration)
+        summary[5] = max(summary[5], hops)
+
+
+    def summary(self):
+        '''
+        Summarizes traced signals
+
+        Returns:
+            dict<str:dict>: Number of forwards, forwards that reached a handler,
+                handler calls, total, mean, and maximum duration (sec), and
+                maximum hop count keyed by signal name
+        '''
+        return {
+            signame: {
+                'forwards': forwards, 'handled': handled, 'handlers': handlers,
+                'total': total, 'mean': total / forwards, 'max': maximum,
+                'max_hops': max_hops
+            }
+            for signame, (forwards, handled, handlers, total, maximum, max_hops)
+            in self._summaries.items()
+        }
+
+
+    def report(self):
+        '''
+        Formats the summary of traced signals as text, slowest total first
+
+        Returns:
+            str: Report with one line per signal name
+        '''
+        lines = ['{:<24} {:>9} {:>8} {:>9} {:>10} {:>9} {:>5}'.format(
+            'Signal', 'Forwards', 'Handled', 'Handlers', 'Total ms', 'Max ms', 'Hops'
+        )]
+        summary = sorted(self.summary().items(), key = lambda item: -item[1]['total'])
+        for signame, stats in summary:
+            lines.append('{:<24} {:>9} {:>8} {:>9} {:>10.2f} {:>9.3f} {:>5}'.format(
+                signame[:24], stats['forwards'], stats['handled'],
+                stats['handlers'], stats['total'] * 1000, stats['max'] * 1000,
+                stats['max_hops']
+            ))
+        return '\n'.join(lines)
+
+
 class SignalRouter():
     '''
     Mediator for managing signal handlers and forwarding received signals
 
     Attributes:
+        trace (SignalTrace): Trace shared by all signal routers; None unless
+            tracing
         _signal_handlers (dict): Signal handler lists keyed by signal name
     '''
+    trace = None
+
+
     def __init__(self):
         self._signal_handlers = dict()
 
 
+    @classmethod
+    def start_tracing(cls, capacity = 4096):
+        '''
+        Traces signals forwarded by all signal routers; the traced forward
+        method replaces the regular one, so tracing costs nothing while off
+
+        Parameters:
+            capacity (int): Maximum number of recent forwards to keep
+                (Optional)
+
+        Returns:
+            SignalTrace: Trace of forwarded signals
+        '''
+        cls.trace = SignalTrace(capacity)
+        cls.forward = cls._forward_traced
+        return cls.trace
+
+
+    @classmethod
+    def stop_tracing(cls):
+        '''
+        Stops tracing signals
+
+        Returns:
+            SignalTrace: Trace of forwarded signals; None if not tracing
+        '''
+        trace, cls.trace = cls.trace, None
+        cls.forward = cls._forward
+        return trace
+
+
     def forward(self, signal, reverse = False):
         '''
         Forwards the given signal to registered signal handlers
@@ -91,6 +225,67 @@ class SignalRouter():
         return False
 
 
+    # Keep the regular forward method while the traced one replaces it.
+    _forward = forward
+
+
+    def _forward_traced(self, signal, reverse = False):
+        '''
+        Forwards the given signal to registered signal handlers, and records
+        the number and duration of visited handlers in the shared trace
+
+        Parameters:
+            signal (Signal): Received signal to forward
+            reverse (bool): Flag controlling order of signal handler traversal
+                (Optional)
+
+        Returns:
+            bool: True if given signal is forwarded; False otherwise
+        '''
+        trace = SignalRouter.trace
+        clock = time.perf_counter
+        signame = signal.data['_name']
+        propagate = signal.data['_propagate']
+        handlers = []
+
+        # Count the forwards in progress as hops.
+        hops = trace._hops
+        trace._hops += 1
+        start = clock()
+        try:
+
+            # Determine if the signal can be handled.
+            if signame in self._signal_handlers:
+
+                # Create a shallow working copy of the signal handlers list.
+                handlers_list = self._signal_handlers[signame].copy()
+                if reverse:
+                    handlers_list.reverse()
+
+                # Visit registered signal handlers in order, timing each.
+                for handler in handlers_list:
+                    handler = handler() # Called from weak reference
+                    handler_start = clock()
+                    try:
+                        handler(**signal.data)
+                    finally:
+                        handlers.append((
+                            handler.__qualname__, clock() - handler_start
+                        ))
+
+                    # Only handle once if the signal cannot propagate.
+                    if not propagate:
+                        break
+
+                return True
+            return False
+
+        # Record the forward.
+        finally:
+            trace._hops = hops
+            trace.record(signame, hops, handlers, clock() - start)
+
+
     def register(self, signame, handler):
         '''
         Registers the given signal handler for signal forwarding
@@ -0,0 +1,408 @@
+# Filename: textwidth.py
+# Creation Date: Mon 19 Oct 2026
+# Last Modified: Mon 19 Oct 2026
+
+
+import bisect
+import unicodedata
+
+
+# Display width of code points, as the first code point of each range sharing a
+# width and that width: 0 for combining marks and format characters, 2 for East
+# Asian wide and fullwidth characters, and 1 otherwise. Generated from Unicode
+# 14.0.0 by running this module.
+width_table = (
+    (0x0, 1), (0x300, 0), (0x370, 1), (0x483, 0), (0x48A, 1), (0x591, 0),
+    (0x5BE, 1), (0x5BF, 0), (0x5C0, 1), (0x5C1, 0), (0x5C3, 1), (0x5C4, 0),
+    (0x5C6, 1), (0x5C7, 0), (0x5C8, 1), (0x600, 0), (0x606, 1), (0x610, 0),
+    (0x61B, 1), (0x61C, 0), (0x61D, 1), (0x64B, 0), (0x660, 1), (0x670, 0),
+    (0x671, 1), (0x6D6, 0), (0x6DE, 1), (0x6DF, 0), (0x6E5, 1), (0x6E7, 0),
+    (0x6E9, 1), (0x6EA, 0), (0x6EE, 1), (0x70F, 0), (0x710, 1), (0x711, 0),
+    (0x712, 1), (0x730, 0), (0x74B, 1), (0x7A6, 0), (0x7B1, 1), (0x7EB, 0),
+    (0x7F4, 1), (0x7FD, 0), (0x7FE, 1), (0x816, 0), (0x81A, 1), (0x81B, 0),
+    (0x824, 1), (0x825, 0), (0x828, 1), (0x829, 0), (0x82E, 1), (0x859, 0),
+    (0x85C, 1), (0x890, 0), (0x892, 1), (0x898, 0), (0x8A0, 1), (0x8CA, 0),
+    (0x903, 1), (0x93A, 0), (0x93B, 1), (0x93C, 0), (0x93D, 1), (0x941, 0),
+    (0x949, 1), (0x94D, 0), (0x94E, 1), (0x951, 0), (0x958, 1), (0x962, 0),
+    (0x964, 1), (0x981, 0), (0x982, 1), (0x9BC, 0), (0x9BD, 1), (0x9C1, 0),
+    (0x9C5, 1), (0x9CD, 0), (0x9CE, 1), (0x9E2, 0), (0x9E4, 1), (0x9FE, 0),
+    (0x9FF, 1), (0xA01, 0), (0xA03, 1), (0xA3C, 0), (0xA3D, 1), (0xA41, 0),
+    (0xA43, 1), (0xA47, 0), (0xA49, 1), (0xA4B, 0), (0xA4E, 1), (0xA51, 0),
+    (0xA52, 1), (0xA70, 0), (0xA72, 1), (0xA75, 0), (0xA76, 1), (0xA81, 0),
+    (0xA83, 1), (0xABC, 0), (0xABD, 1), (0xAC1, 0), (0xAC6, 1), (0xAC7, 0),
+    (0xAC9, 1), (0xACD, 0), (0xACE, 1), (0xAE2, 0), (0xAE4, 1), (0xAFA, 0),
+    (0xB00, 1), (0xB01, 0), (0xB02, 1), (0xB3C, 0), (0xB3D, 1), (0xB3F, 0),
+    (0xB40, 1), (0xB41, 0), (0xB45, 1), (0xB4D, 0), (0xB4E, 1), (0xB55, 0),
+    (0xB57, 1), (0xB62, 0), (0xB64, 1), (0xB82, 0), (0xB83, 1), (0xBC0, 0),
+    (0xBC1, 1), (0xBCD, 0), (0xBCE, 1), (0xC00, 0), (0xC01, 1), (0xC04, 0),
+    (0xC05, 1), (0xC3C, 0), (0xC3D, 1), (0xC3E, 0), (0xC41, 1), (0xC46, 0),
+    (0xC49, 1), (0xC4A, 0), (0xC4E, 1), (0xC55, 0), (0xC57, 1), (0xC62, 0),
+    (0xC64, 1), (0xC81, 0), (0xC82, 1), (0xCBC, 0), (0xCBD, 1), (0xCBF, 0),
+    (0xCC0, 1), (0xCC6, 0), (0xCC7, 1), (0xCCC, 0), (0xCCE, 1), (0xCE2, 0),
+    (0xCE4, 1), (0xD00, 0), (0xD02, 1), (0xD3B, 0), (0xD3D, 1), (0xD41, 0),
+    (0xD45, 1), (0xD4D, 0), (0xD4E, 1), (0xD62, 0), (0xD64, 1), (0xD81, 0),
+    (0xD82, 1), (0xDCA, 0), (0xDCB, 1), (0xDD2, 0), (0xDD5, 1), (0xDD6, 0),
+    (0xDD7, 1), (0xE31, 0), (0xE32, 1), (0xE34, 0), (0xE3B, 1), (0xE47, 0),
+    (0xE4F, 1), (0xEB1, 0), (0xEB2, 1), (0xEB4, 0), (0xEBD, 1), (0xEC8, 0),
+    (0xECE, 1), (0xF18, 0), (0xF1A, 1), (0xF35, 0), (0xF36, 1), (0xF37, 0),
+    (0xF38, 1), (0xF39, 0), (0xF3A, 1), (0xF71, 0), (0xF7F, 1), (0xF80, 0),
+    (0xF85, 1), (0xF86, 0), (0xF88, 1), (0xF8D, 0), (0xF98, 1), (0xF99, 0),
+    (0xFBD, 1), (0xFC6, 0), (0xFC7, 1), (0x102D, 0), (0x1031, 1), (0x1032, 0),
+    (0x1038, 1), (0x1039, 0), (0x103B, 1), (0x103D, 0), (0x103F, 1),
+    (0x1058, 0), (0x105A, 1), (0x105E, 0), (0x1061, 1), (0x1071, 0),
+    (0x1075, 1), (0x1082, 0), (0x1083, 1), (0x1085, 0), (0x1087, 1),
+    (0x108D, 0), (0x108E, 1), (0x109D, 0), (0x109E, 1), (0x1100, 2),
+    (0x1160, 1), (0x135D, 0), (0x1360, 1), (0x1712, 0), (0x1715, 1),
+    (0x1732, 0), (0x1734, 1), (0x1752, 0), (0x1754, 1), (0x1772, 0),
+    (0x1774, 1), (0x17B4, 0), (0x17B6, 1), (0x17B7, 0), (0x17BE, 1),
+    (0x17C6, 0), (0x17C7, 1), (0x17C9, 0), (0x17D4, 1), (0x17DD, 0),
+    (0x17DE, 1), (0x180B, 0), (0x1810, 1), (0x1885, 0), (0x1887, 1),
+    (0x18A9, 0), (0x18AA, 1), (0x1920, 0), (0x1923, 1), (0x1927, 0),
+    (0x1929, 1), (0x1932, 0), (0x1933, 1), (0x1939, 0), (0x193C, 1),
+    (0x1A17, 0), (0x1A19, 1), (0x1A1B, 0), (0x1A1C, 1), (0x1A56, 0),
+    (0x1A57, 1), (0x1A58, 0), (0x1A5F, 1), (0x1A60, 0), (0x1A61, 1),
+    (0x1A62, 0), (0x1A63, 1), (0x1A65, 0), (0x1A6D, 1), (0x1A73, 0),
+    (0x1A7D, 1), (0x1A7F, 0), (0x1A80, 1), (0x1AB0, 0), (0x1ACF, 1),
+    (0x1B00, 0), (0x1B04, 1), (0x1B34, 0), (0x1B35, 1), (0x1B36, 0),
+    (0x1B3B, 1), (0x1B3C, 0), (0x1B3D, 1), (0x1B42, 0), (0x1B43, 1),
+    (0x1B6B, 0), (0x1B74, 1), (0x1B80, 0), (0x1B82, 1), (0x1BA2, 0),
+    (0x1BA6, 1), (0x1BA8, 0), (0x1BAA, 1), (0x1BAB, 0), (0x1BAE, 1),
+    (0x1BE6, 0), (0x1BE7, 1), (0x1BE8, 0), (0x1BEA, 1), (0x1BED, 0),
+    (0x1BEE, 1), (0x1BEF, 0), (0x1BF2, 1), (0x1C2C, 0), (0x1C34, 1),
+    (0x1C36, 0), (0x1C38, 1), (0x1CD0, 0), (0x1CD3, 1), (0x1CD4, 0),
+    (0x1CE1, 1), (0x1CE2, 0), (0x1CE9, 1), (0x1CED, 0), (0x1CEE, 1),
+    (0x1CF4, 0), (0x1CF5, 1), (0x1CF8, 0), (0x1CFA, 1), (0x1DC0, 0),
+    (0x1E00, 1), (0x200B, 0), (0x2010, 1), (0x202A, 0), (0x202F, 1),
+    (0x2060, 0), (0x2065, 1), (0x2066, 0), (0x2070, 1), (0x20D0, 0),
+    (0x20F1, 1), (0x231A, 2), (0x231C, 1), (0x2329, 2), (0x232B, 1),
+    (0x23E9, 2), (0x23ED, 1), (0x23F0, 2), (0x23F1, 1), (0x23F3, 2),
+    (0x23F4, 1), (0x25FD, 2), (0x25FF, 1), (0x2614, 2), (0x2616, 1),
+    (0x2648, 2), (0x2654, 1), (0x267F, 2), (0x2680, 1), (0x2693, 2),
+    (0x2694, 1), (0x26A1, 2), (0x26A2, 1), (0x26AA, 2), (0x26AC, 1),
+    (0x26BD, 2), (0x26BF, 1), (0x26C4, 2), (0x26C6, 1), (0x26CE, 2),
+    (0x26CF, 1), (0x26D4, 2), (0x26D5, 1), (0x26EA, 2), (0x26EB, 1),
+    (0x26F2, 2), (0x26F4, 1), (0x26F5, 2), (0x26F6, 1), (0x26FA, 2),
+    (0x26FB, 1), (0x26FD, 2), (0x26FE, 1), (0x2705, 2), (0x2706, 1),
+    (0x270A, 2), (0x270C, 1), (0x2728, 2), (0x2729, 1), (0x274C, 2),
+    (0x274D, 1), (0x274E, 2), (0x274F, 1), (0x2753, 2), (0x2756, 1),
+    (0x2757, 2), (0x2758, 1), (0x2795, 2), (0x2798, 1), (0x27B0, 2),
+    (0x27B1, 1), (0x27BF, 2), (0x27C0, 1), (0x2B1B, 2), (0x2B1D, 1),
+    (0x2B50, 2), (0x2B51, 1), (0x2B55, 2), (0x2B56, 1), (0x2CEF, 0),
+    (0x2CF2, 1), (0x2D7F, 0), (0x2D80, 1), (0x2DE0, 0), (0x2E00, 1),
+    (0x2E80, 2), (0x2E9A, 1), (0x2E9B, 2), (0x2EF4, 1), (0x2F00, 2),
+    (0x2FD6, 1), (0x2FF0, 2), (0x2FFC, 1), (0x3000, 2), (0x302A, 0),
+    (0x302E, 2), (0x303F, 1), (0x3041, 2), (0x3097, 1), (0x3099, 0),
+    (0x309B, 2), (0x3100, 1), (0x3105, 2), (0x3130, 1), (0x3131, 2),
+    (0x318F, 1), (0x3190, 2), (0x31E4, 1), (0x31F0, 2), (0x321F, 1),
+    (0x3220, 2), (0x3248, 1), (0x3250, 2), (0x4DC0, 1), (0x4E00, 2),
+    (0xA48D, 1), (0xA490, 2), (0xA4C7, 1), (0xA66F, 0), (0xA673, 1),
+    (0xA674, 0), (0xA67E, 1), (0xA69E, 0), (0xA6A0, 1), (0xA6F0, 0),
+    (0xA6F2, 1), (0xA802, 0), (0xA803, 1), (0xA806, 0), (0xA807, 1),
+    (0xA80B, 0), (0xA80C, 1), (0xA825, 0), (0xA827, 1), (0xA82C, 0),
+    (0xA82D, 1), (0xA8C4, 0), (0xA8C6, 1), (0xA8E0, 0), (0xA8F2, 1),
+    (0xA8FF, 0), (0xA900, 1), (0xA926, 0), (0xA92E, 1), (0xA947, 0),
+    (0xA952, 1), (0xA960, 2), (0xA97D, 1), (0xA980, 0), (0xA983, 1),
+    (0xA9B3, 0), (0xA9B4, 1), (0xA9B6, 0), (0xA9BA, 1), (0xA9BC, 0),
+    (0xA9BE, 1), (0xA9E5, 0), (0xA9E6, 1), (0xAA29, 0), (0xAA2F, 1),
+    (0xAA31, 0), (0xAA33, 1), (0xAA35, 0), (0xAA37, 1), (0xAA43, 0),
+    (0xAA44, 1), (0xAA4C, 0), (0xAA4D, 1), (0xAA7C, 0), (0xAA7D, 1),
+    (0xAAB0, 0), (0xAAB1, 1), (0xAAB2, 0), (0xAAB5, 1), (0xAAB7, 0),
+    (0xAAB9, 1), (0xAABE, 0), (0xAAC0, 1), (0xAAC1, 0), (0xAAC2, 1),
+    (0xAAEC, 0), (0xAAEE, 1), (0xAAF6, 0), (0xAAF7, 1), (0xABE5, 0),
+    (0xABE6, 1), (0xABE8, 0), (0xABE9, 1), (0xABED, 0), (0xABEE, 1),
+    (0xAC00, 2), (0xD7A4, 1), (0xF900, 2), (0xFA6E, 1), (0xFA70, 2),
+    (0xFADA, 1), (0xFB1E, 0), (0xFB1F, 1), (0xFE00, 0), (0xFE10, 2),
+    (0xFE1A, 1), (0xFE20, 0), (0xFE30, 2), (0xFE53, 1), (0xFE54, 2),
+    (0xFE67, 1), (0xFE68, 2), (0xFE6C, 1), (0xFEFF, 0), (0xFF00, 1),
+    (0xFF01, 2), (0xFF61, 1), (0xFFE0, 2), (0xFFE7, 1), (0xFFF9, 0),
+    (0xFFFC, 1), (0x101FD, 0), (0x101FE, 1), (0x102E0, 0), (0x102E1, 1),
+    (0x10376, 0), (0x1037B, 1), (0x10A01, 0), (0x10A04, 1), (0x10A05, 0),
+    (0x10A07, 1), (0x10A0C, 0), (0x10A10, 1), (0x10A38, 0), (0x10A3B, 1),
+    (0x10A3F, 0), (0x10A40, 1), (0x10AE5, 0), (0x10AE7, 1), (0x10D24, 0),
+    (0x10D28, 1), (0x10EAB, 0), (0x10EAD, 1), (0x10F46, 0), (0x10F51, 1),
+    (0x10F82, 0), (0x10F86, 1), (0x11001, 0), (0x11002, 1), (0x11038, 0),
+    (0x11047, 1), (0x11070, 0), (0x11071, 1), (0x11073, 0), (0x11075, 1),
+    (0x1107F, 0), (0x11082, 1), (0x110B3, 0), (0x110B7, 1), (0x110B9, 0),
+    (0x110BB, 1), (0x110BD, 0), (0x110BE, 1), (0x110C2, 0), (0x110C3, 1),
+    (0x110CD, 0), (0x110CE, 1), (0x11100, 0), (0x11103, 1), (0x11127, 0),
+    (0x1112C, 1), (0x1112D, 0), (0x11135, 1), (0x11173, 0), (0x11174, 1),
+    (0x11180, 0), (0x11182, 1), (0x111B6, 0), (0x111BF, 1), (0x111C9, 0),
+    (0x111CD, 1), (0x111CF, 0), (0x111D0, 1), (0x1122F, 0), (0x11232, 1),
+    (0x11234, 0), (0x11235, 1), (0x11236, 0), (0x11238, 1), (0x1123E, 0),
+    (0x1123F, 1), (0x112DF, 0), (0x112E0, 1), (0x112E3, 0), (0x112EB, 1),
+    (0x11300, 0), (0x11302, 1), (0x1133B, 0), (0x1133D, 1), (0x11340, 0),
+    (0x11341, 1), (0x11366, 0), (0x1136D, 1), (0x11370, 0), (0x11375, 1),
+    (0x11438, 0), (0x11440, 1), (0x11442, 0), (0x11445, 1), (0x11446, 0),
+    (0x11447, 1), (0x1145E, 0), (0x1145F, 1), (0x114B3, 0), (0x114B9, 1),
+    (0x114BA, 0), (0x114BB, 1), (0x114BF, 0), (0x114C1, 1), (0x114C2, 0),
+    (0x114C4, 1), (0x115B2, 0), (0x115B6, 1), (0x115BC, 0), (0x115BE, 1),
+    (0x115BF, 0), (0x115C1, 1), (0x115DC, 0), (0x115DE, 1), (0x11633, 0),
+    (0x1163B, 1), (0x1163D, 0), (0x1163E, 1), (0x1163F, 0), (0x11641, 1),
+    (0x116AB, 0), (0x116AC, 1), (0x116AD, 0), (0x116AE, 1), (0x116B0, 0),
+    (0x116B6, 1), (0x116B7, 0), (0x116B8, 1), (0x1171D, 0), (0x11720, 1),
+    (0x11722, 0), (0x11726, 1), (0x11727, 0), (0x1172C, 1), (0x1182F, 0),
+    (0x11838, 1), (0x11839, 0), (0x1183B, 1), (0x1193B, 0), (0x1193D, 1),
+    (0x1193E, 0), (0x1193F, 1), (0x11943, 0), (0x11944, 1), (0x119D4, 0),
+    (0x119D8, 1), (0x119DA, 0), (0x119DC, 1), (0x119E0, 0), (0x119E1, 1),
+    (0x11A01, 0), (0x11A0B, 1), (0x11A33, 0), (0x11A39, 1), (0x11A3B, 0),
+    (0x11A3F, 1), (0x11A47, 0), (0x11A48, 1), (0x11A51, 0), (0x11A57, 1),
+    (0x11A59, 0), (0x11A5C, 1), (0x11A8A, 0), (0x11A97, 1), (0x11A98, 0),
+    (0x11A9A, 1), (0x11C30, 0), (0x11C37, 1), (0x11C38, 0), (0x11C3E, 1),
+    (0x11C3F, 0), (0x11C40, 1), (0x11C92, 0), (0x11CA8, 1), (0x11CAA, 0),
+    (0x11CB1, 1), (0x11CB2, 0), (0x11CB4, 1), (0x11CB5, 0), (0x11CB7, 1),
+    (0x11D31, 0), (0x11D37, 1), (0x11D3A, 0), (0x11D3B, 1), (0x11D3C, 0),
+    (0x11D3E, 1), (0x11D3F, 0), (0x11D46, 1), (0x11D47, 0), (0x11D48, 1),
+    (0x11D90, 0), (0x11D92, 1), (0x11D95, 0), (0x11D96, 1), (0x11D97, 0),
+    (0x11D98, 1), (0x11EF3, 0), (0x11EF5, 1), (0x13430, 0), (0x13439, 1),
+    (0x16AF0, 0), (0x16AF5, 1), (0x16B30, 0), (0x16B37, 1), (0x16F4F, 0),
+    (0x16F50, 1), (0x16F8F, 0), (0x16F93, 1), (0x16FE0, 2), (0x16FE4, 0),
+    (0x16FE5, 1), (0x16FF0, 2), (0x16FF2, 1), (0x17000, 2), (0x187F8, 1),
+    (0x18800, 2), (0x18CD6, 1), (0x18D00, 2), (0x18D09, 1), (0x1AFF0, 2),
+    (0x1AFF4, 1), (0x1AFF5, 2), (0x1AFFC, 1), (0x1AFFD, 2), (0x1AFFF, 1),
+    (0x1B000, 2), (0x1B123, 1), (0x1B150, 2), (0x1B153, 1), (0x1B164, 2),
+    (0x1B168, 1), (0x1B170, 2), (0x1B2FC, 1), (0x1BC9D, 0), (0x1BC9F, 1),
+    (0x1BCA0, 0), (0x1BCA4, 1), (0x1CF00, 0), (0x1CF2E, 1), (0x1CF30, 0),
+    (0x1CF47, 1), (0x1D167, 0), (0x1D16A, 1), (0x1D173, 0), (0x1D183, 1),
+    (0x1D185, 0), (0x1D18C, 1), (0x1D1AA, 0), (0x1D1AE, 1), (0x1D242, 0),
+    (0x1D245, 1), (0x1DA00, 0), (0x1DA37, 1), (0x1DA3B, 0), (0x1DA6D, 1),
+    (0x1DA75, 0), (0x1DA76, 1), (0x1DA84, 0), (0x1DA85, 1), (0x1DA9B, 0),
+    (0x1DAA0, 1), (0x1DAA1, 0), (0x1DAB0, 1), (0x1E000, 0), (0x1E007, 1),
+    (0x1E008, 0), (0x1E019, 1), (0x1E01B, 0), (0x1E022, 1), (0x1E023, 0),
+    (0x1E025, 1), (0x1E026, 0), (0x1E02B, 1), (0x1E130, 0), (0x1E137, 1),
+    (0x1E2AE, 0), (0x1E2AF, 1), (0x1E2EC, 0), (0x1E2F0, 1), (0x1E8D0, 0),
+    (0x1E8D7, 1), (0x1E944, 0), (0x1E94B, 1), (0x1F004, 2), (0x1F005, 1),
+    (0x1F0CF, 2), (0x1F0D0, 1), (0x1F18E, 2), (0x1F18F, 1), (0x1F191, 2),
+    (0x1F19B, 1), (0x1F200, 2), (0x1F203, 1), (0x1F210, 2), (0x1F23C, 1),
+    (0x1F240, 2), (0x1F249, 1), (0x1F250, 2), (0x1F252, 1), (0x1F260, 2),
+    (0x1F266, 1), (0x1F300, 2), (0x1F321, 1), (0x1F32D, 2), (0x1F336, 1),
+    (0x1F337, 2), (0x1F37D, 1), (0x1F37E, 2), (0x1F394, 1), (0x1F3A0, 2),
+    (0x1F3CB, 1), (0x1F3CF, 2), (0x1F3D4, 1), (0x1F3E0, 2), (0x1F3F1, 1),
+    (0x1F3F4, 2), (0x1F3F5, 1), (0x1F3F8, 2), (0x1F43F, 1), (0x1F440, 2),
+    (0x1F441, 1), (0x1F442, 2), (0x1F4FD, 1), (0x1F4FF, 2), (0x1F53E, 1),
+    (0x1F54B, 2), (0x1F54F, 1), (0x1F550, 2), (0x1F568, 1), (0x1F57A, 2),
+    (0x1F57B, 1), (0x1F595, 2), (0x1F597, 1), (0x1F5A4, 2), (0x1F5A5, 1),
+    (0x1F5FB, 2), (0x1F650, 1), (0x1F680, 2), (0x1F6C6, 1), (0x1F6CC, 2),
+    (0x1F6CD, 1), (0x1F6D0, 2), (0x1F6D3, 1), (0x1F6D5, 2), (0x1F6D8, 1),
+    (0x1F6DD, 2), (0x1F6E0, 1), (0x1F6EB, 2), (0x1F6ED, 1), (0x1F6F4, 2),
+    (0x1F6FD, 1), (0x1F7E0, 2), (0x1F7EC, 1), (0x1F7F0, 2), (0x1F7F1, 1),
+    (0x1F90C, 2), (0x1F93B, 1), (0x1F93C, 2), (0x1F946, 1), (0x1F947, 2),
+    (0x1FA00, 1), (0x1FA70, 2), (0x1FA75, 1), (0x1FA78, 2), (0x1FA7D, 1),
+    (0x1FA80, 2), (0x1FA87, 1), (0x1FA90, 2), (0x1FAAD, 1), (0x1FAB0, 2),
+    (0x1FABB, 1), (0x1FAC0, 2), (0x1FAC6, 1), (0x1FAD0, 2), (0x1FADA, 1),
+    (0x1FAE0, 2), (0x1FAE8, 1), (0x1FAF0, 2), (0x1FAF7, 1), (0x20000, 2),
+    (0x3FFFE, 1), (0xE0001, 0), (0xE0002, 1), (0xE0020, 0), (0xE0080, 1),
+    (0xE0100, 0), (0xE01F0, 1),
+)
+
+# First code point of each range in the width table, for binary search.
+range_starts = [start for start, width in width_table]
+
+# Maximum number of strings whose widths are memoized.
+cache_size = 4096
+
+# Memoized display widths of strings, and of characters, keyed by text.
+_string_widths = {}
+_char_widths = {}
+
+
+def char_width(char):
+    '''
+    Determines the number of terminal columns a character occupies
+
+    Parameters:
+        char (str): Character
+
+    Returns:
+        int: Display width in {0, 1, 2}
+    '''
+    width = _char_widths.get(char)
+    if width is None:
+        i = bisect.bisect_right(range_starts, ord(char)) - 1
+        width = _char_widths[char] = width_table[i][1]
+    return width
+
+
+def width(text):
+    '''
+    Determines the number of terminal columns a string of text occupies
+
+    Parameters:
+        text (str): Text
+
+    Returns:
+        int: Display width
+    '''
+    # Count ASCII text by its length.
+    if text.isascii():
+        return len(text)
+
+    # Otherwise, sum the widths of its characters once.
+    text_width = _string_widths.get(text)
+    if text_width is None:
+        if len(_string_widths) >= cache_size:
+            _string_widths.clear()
+        text_width = _string_widths[text] = sum(char_width(char) for char in text)
+    return text_width
+
+
+def clip(text, columns):
+    '''
+    Clips text on the right to fit within the given number of columns
+
+    Parameters:
+        text (str): Text
+        columns (int): Number of terminal columns
+
+    Returns:
+        str: Longest leading part of the text that fits
+    '''
+    if text.isascii():
+        return text[:max(0, columns)]
+    if width(text) <= columns:
+        return text
+    span = 0
+    for i, char in enumerate(text):
+        span += char_width(char)
+        if span > columns:
+            return text[:i]
+    return text
+
+
+def clip_left(text, columns):
+    '''
+    Clips text on the left to fit within the given number of columns
+
+    Parameters:
+        text (str): Text
+        columns (int): Number of terminal columns
+
+    Returns:
+        str: Longest trailing part of the text that fits
+    '''
+    if text.isascii():
+        return text[max(0, len(text) - columns):] if columns > 0 else ''
+    if width(text) <= columns:
+        return text
+    span = 0
+    for i in range(len(text) - 1, -1, -1):
+        span += char_width(text[i])
+        if span > columns:
+            return text[i + 1:]
+    return text
+
+
+def skip(text, columns):
+    '''
+    Removes the given number of leading columns from text, e.g. to scroll it
+    horizontally; a wide character split by the cut is replaced by a space
+
+    Parameters:
+        text (str): Text
+        columns (int): Number of terminal columns to remove
+
+    Returns:
+        str: Remaining text
+    '''
+    if columns <= 0:
+        return text
+    if text.isascii():
+        return text[columns:]
+    span = 0
+    for i, char in enumerate(text):
+        if span >= columns:
+
+            # Drop combining marks of the removed character.
+            while i < len(text) and not char_width(text[i]) and span == columns:
+                i += 1
+            return ' ' * (span - columns) + text[i:]
+        span += char_width(char)
+    return ' ' * max(0, span - columns)
+
+
+def pad(text, columns, align = 'LEFT'):
+    '''
+    Pads text with spaces to span the given number of columns
+
+    Parameters:
+        text (str): Text
+        columns (int): Number of terminal columns
+        align (str): Text alignment option {'LEFT', 'CENTER', 'RIGHT'}
+            (Optional)
+
+    Returns:
+        str: Padded text; unchanged if it already spans the columns
+    '''
+    space = columns - width(text)
+    if space <= 0:
+        return text
+    if align == 'RIGHT':
+        return ' ' * space + text
+    if align == 'CENTER':
+        return ' ' * (space // 2) + text + ' ' * (space - space // 2)
+    return text + ' ' * space
+
+
+def wrap(text, columns):
+    '''
+    Breaks text into lines that each fit within the given number of columns
+
+    Parameters:
+        text (str): Text
+        columns (int): Number of terminal columns
+
+    Returns:
+        list<str>: Lines of text
+    '''
+    if text.isascii():
+        return [text[i:i + columns] for i in range(0, len(text), columns)]
+    lines = []
+    while text:
+        line = clip(text, columns) or text[0]
+        lines.append(line)
+        text = text[len(line):]
+    return lines
+
+
+def _build_table():
+    '''
+    Builds the width table from the Unicode database of this Python
+
+    Returns:
+        list<2-tuple<int>>: First code point of each range sharing a display
+            width, and that width
+    '''
+    table = []
+    for code_point in range(0x110000):
+        char = chr(code_point)
+        category = unicodedata.category(char)
+
+        # Combining marks and invisible format characters take no space,
+        # except soft hyphens, which terminals show.
+        if category in ('Mn', 'Me') or (category == 'Cf' and code_point != 0xAD):
+            char_width = 0
+
+        # Wide and fullwidth characters take two columns, as do unassigned
+        # code points of the ideographic planes.
+        elif category != 'Cn' and unicodedata.east_asian_width(char) in ('W', 'F'):
+            char_width = 2
+        elif category == 'Cn' and 0x20000 <= code_point <= 0x3FFFD:
+            char_width = 2
+        else:
+            char_width = 1
+
+        if not table or table[-1][1] != char_width:
+            table.append((code_point, char_width))
+    return table
+
+
+if __name__ == '__main__':
+    # Print the width table for pasting into this module.
+    print('# Unicode {}'.format(unicodedata.unidata_version))
+    line = '   '
+    for start, char_width in _build_table():
+        item = ' (0x{:X}, {}),'.format(start, char_width)
+        if len(line) + len(item) > 79:
+            print(line)
+            line = '   '
+        line += item
+    print(line)
@@ -6,6 +6,7 @@
 
 import curses
 import math
+from . import screen
 
 
 class Theme():
@@ -24,7 +25,14 @@ class Theme():
                 ...
             }
             state in {'default', 'focused', 'disabled'}
+        _version (int): Number of changes made to theme data
     '''
+    @property
+    def version(self):
+        ''' Getter for "version" property '''
+        return self._version
+
+
     def __init__(self):
         # Initialize theme data.
         self._colors = {}
@@ -34,6 +42,7 @@ class Theme():
             'focused': {},
             'disabled': {},
         }
+        self._version = 0
 
 
     def edit(self, state, name, fg, bg, *args):
@@ -57,7 +66,7 @@ class Theme():
 
         # Process color input.
         color_attr = 0;
-        if curses.has_colors() and curses.can_change_color():
+        if screen.backend.has_colors() and screen.backend.can_change_color():
 
             # Translate give colors to curses color items.
             colors = self._colors
@@ -66,7 +75,7 @@ class Theme():
             for rgb in fg, bg:
                 if rgb not in colors:
                     color_idx = len(colors) + 16 # 16-color terminal palette
-                    curses.init_color(color_idx, *rgb)
+                    screen.backend.init_color(color_idx, *rgb)
                     colors[rgb] = color_idx
 
             # Associate foreground and background as a curses color pair object.
@@ -74,11 +83,11 @@ class Theme():
             pair = (fg, bg)
             if pair not in color_pairs:
                 color_pair_idx = len(color_pairs) + 8 # 16-color terminal palette
-                curses.init_pair(color_pair_idx, colors[fg], colors[bg])
+                screen.backend.init_pair(color_pair_idx, colors[fg], colors[bg])
                 color_pairs[pair] = color_pair_idx
 
             # Get color attribute.
-            color_attr = curses.color_pair(color_pairs[pair])
+            color_attr = screen.backend.color_pair(color_pairs[pair])
 
         # Combine formatting attributes into a single curses attribute.
         format_attr = 0
@@ -93,6 +102,7 @@ class Theme():
 
         # Insert combined color and formatting attributes into this theme.
         self._data[state][name] = color_attr | format_attr
+        self._version += 1
 
 
     def load(self, theme_data):
@@ -105,6 +115,7 @@ class Theme():
         for state in theme_data:
             for name in theme_data[state]:
                 self.edit(state, name, *theme_data[state][name])
+        self._version += 1
 
 
     def query(self, state, name):
@@ -119,3 +130,16 @@ class Theme():
             if name in self._data[state]:
                 return self._data[state][name]
         return 0
+
+
+    def resolve(self, state):
+        '''
+        Retrieves all curses attributes of the given state from theme
+
+        Parameters:
+            state (str): Theme state
+
+        Returns:
+            dict<str:int>: Curses attributes keyed by identifier
+        '''
+        return dict(self._data.get(state, {}))
@@ -8,8 +8,11 @@ import math
 import curses
 import curses.ascii as ascii
 import weakref
-from . import signals
-from .core import Widget, ContentWidget, Group
+from . import signals, textwidth
+from .core import Widget, ContentWidget, Group, layout_operation
+from .pad import RowPad
+from .results import ResultBatch
+from .search import SearchIndex, TrigramIndex
 
 
 class Button(ContentWidget):
@@ -60,6 +63,7 @@ class Button(ContentWidget):
         return 'CONTINUE'
 
 
+    @layout_operation
     def fit(self):
         ''' Fits button to padded label width '''
         self.resize(len(self._label) + 4, 1)
@@ -439,13 +443,15 @@ class Label(ContentWidget):
 
 
     def draw(self):
-        # Used referenced style.
+        # Used referenced style, which may not be resolved yet in this draw.
+        self.used_by._resolve_style()
         style = self.used_by.style
 
         # Draw the embellished label.
         self.draw_text(self.label, attr = style('label'), hint = self.used_by._focus_key)
 
 
+    @layout_operation
     def embellish(self, prefix = '', suffix = ''):
         '''
         Embellishes the label with leading and trailing text
@@ -462,6 +468,7 @@ class Label(ContentWidget):
         return self
 
 
+    @layout_operation
     def fit(self):
         '''
         Fits this widget's dimensions to its content
@@ -473,6 +480,7 @@ class Label(ContentWidget):
         return self
 
 
+    @layout_operation
     def shift(self, multiple):
         '''
         Offsets horizontally by a multiple of this label's width
@@ -487,6 +495,7 @@ class Label(ContentWidget):
         return self
 
 
+    @layout_operation
     def to_center(self, cross = False):
         '''
         Moves this label to the center of the widget that uses it
@@ -507,6 +516,7 @@ class Label(ContentWidget):
         return self
 
 
+    @layout_operation
     def to_left(self):
         '''
         Moves this label to the left edge of the widget that uses it
@@ -519,6 +529,7 @@ class Label(ContentWidget):
         return self
 
 
+    @layout_operation
     def to_right(self):
         '''
         Moves this label to the right edge of the widget that uses it
@@ -533,6 +544,7 @@ class Label(ContentWidget):
         return self
 
 
+    @layout_operation
     def to_top(self):
         '''
         Moves this label to the top edge of the widget that uses it
@@ -545,6 +557,7 @@ class Label(ContentWidget):
         return self
 
 
+    @layout_operation
     def to_bottom(self):
         '''
         Moves this label to the bottom edge of the widget that uses it
@@ -585,6 +598,210 @@ class Labeled(ContentWidget):
         self._links.append(ref)
 
 
+class Searchable(Labeled):
+    '''
+    Class of labeled widgets whose rows of text can be searched incrementally,
+    and optionally prerendered offscreen for scrolling
+
+    Attributes:
+        _search (SearchIndex): Search over this widget's rows of text
+        _search_keys (3-tuple<int>): Keys that start a search, and step to the
+            next & previous matches; None if searching is not allowed
+        _search_editing (bool): Flag indicating if the query is being typed
+        _search_stale (bool): Flag indicating if searched rows are outdated
+        _row_pad (RowPad): Pad of prerendered rows; None if rows are drawn
+            directly into this widget's window
+    '''
+    def __init__(self, label, parent, focus_key = None):
+        # Initialize inherited state.
+        super().__init__(label, parent, focus_key)
+
+        # Initialize attributes.
+        self._search = SearchIndex()
+        self._search_keys = None
+        self._search_editing = False
+        self._search_stale = True
+        self._row_pad = None
+
+
+    def composite(self):
+        if self._row_pad:
+            self._row_pad.refresh()
+
+
+    def prerender(self, rows = 256):
+        '''
+        Renders blocks of rows into an offscreen pad, so that scrolling within
+        a block copies rows already rendered instead of formatting them again;
+        rows are drawn directly while search matches or a cursor are shown
+
+        Parameters:
+            rows (int): Number of rows rendered into each block (Optional)
+        '''
+        self._row_pad = RowPad(rows)
+
+
+    def allow_search(self, key = ord('/'), next_key = ord('n'), prev_key = ord('N')):
+        '''
+        Binds keys for searching this widget's content
+
+        Parameters:
+            key (int): Key that starts a search (Optional)
+            next_key (int): Key that steps to the next match (Optional)
+            prev_key (int): Key that steps to the previous match (Optional)
+        '''
+        self._search_keys = (key, next_key, prev_key)
+
+
+    def _search_rows(self):
+        '''
+        * Abstract method for inserting user-defined code into UI framework *
+
+        Defines the rows of text cells to search
+
+        Returns:
+            list<list<str>>: Rows of text cells
+        '''
+        return []
+
+
+    def _show_match(self, match):
+        '''
+        * Abstract method for inserting user-defined code into UI framework *
+
+        Defines how to bring a match into view
+
+        Parameters:
+            match (3-tuple<int>): Row, cell, and character offset of match
+        '''
+        return
+
+
+    def _refresh_search(self):
+        ''' Marks searched rows as outdated after content changes '''
+        self._search_stale = True
+
+
+    def _sync_search(self):
+        ''' Replaces outdated rows of an ongoing search '''
+        if self._search_stale and self._search.query:
+            self._search.reset(self._search_rows())
+            self._search_stale = False
+
+
+    def _search_usage(self):
+        '''
+        Describes the search keys, if any
+
+        Returns:
+            str: Usage text
+        '''
+        if not self._search_keys:
+            return ''
+        if self._search_editing:
+            return ', Enter: Done, Esc: Cancel'
+        key, next_key, prev_key = [ascii.unctrl(k) for k in self._search_keys]
+        usage = ', {}: Search'.format(key)
+        if self._search.query:
+            usage += ', {}/{}: Next/Prev'.format(next_key, prev_key)
+        return usage
+
+
+    def _operate_search(self, c):
+        '''
+        Handles user input related to searching
+
+        Parameters:
+            c (int): Character code of user input
+
+        Returns:
+            bool: True if the input is consumed; False otherwise
+        '''
+        if not self._search_keys:
+            return False
+        key, next_key, prev_key = self._search_keys
+        search = self._search
+
+        # Search rows that are current.
+        self._sync_search()
+
+        # Search a batch of rows while no input is pending, bringing the first
+        # match into view.
+        if c == -1:
+            was_complete = search.is_complete
+            if search.advance():
+                if search.current() is None:
+                    self._show_match(search.step(row = self._row_scroll))
+                self.tag_redraw()
+            elif search.is_complete != was_complete:
+                self.tag_redraw()
+            return False
+
+        # Edit the query.
+        if self._search_editing:
+
+            # Finish editing.
+            if c in {curses.KEY_ENTER, ascii.LF, ascii.CR}:
+                self._search_editing = False
+                self._overrides_esc = False
+
+            # Cancel the search.
+            elif c == ascii.ESC:
+                search.search('')
+                self._search_editing = False
+                self._overrides_esc = False
+
+            # Delete a character.
+            elif c in {ascii.BS, ascii.DEL, curses.KEY_BACKSPACE}:
+                search.search(search.query[:-1])
+
+            # Add a character.
+            elif ascii.isprint(c):
+                search.search(search.query + chr(c))
+
+            # Let other keys through (e.g. scrolling).
+            else:
+                return False
+
+            self.tag_redraw()
+            return True
+
+        # Start a new search.
+        if c == key:
+            self.tag_redraw()
+            search.search('')
+            self._search_editing = True
+            self._overrides_esc = True # Escape cancels the search
+            return True
+
+        # Step between matches.
+        if search.query and c in {next_key, prev_key}:
+            match = search.step(1 if c == next_key else -1, self._row_scroll)
+            if match:
+                self._show_match(match)
+                self.tag_redraw()
+            return True
+
+        return False
+
+
+    def _draw_search(self):
+        ''' Draws the search query and status into the bottom border '''
+        search = self._search
+        if not (self._search_editing or search.query):
+            return
+        text = '/' + search.query
+        if not self._search_editing:
+            status = '{} matches'.format(search.count())
+            if not search.is_complete:
+                status = 'searching'
+            text += ' [{}]'.format(status)
+        self.draw_text(
+            text, row = self.get_size()[1] - 1, padding = (1, 1),
+            margin = (2, 3, 0, 0), attr = self.style('border')
+        )
+
+
 class FlipSwitch(Labeled):
     '''
     Boolean state widget
@@ -805,7 +1022,7 @@ class NavList(Labeled):
             Widget.input_focus = page_list[page_idx]
 
 
-class TextBox(Labeled):
+class TextBox(Searchable):
     '''
     Multi-line text input/display widget
 
@@ -815,6 +1032,7 @@ class TextBox(Labeled):
         _col_scroll (int): Index corresponding to left of viewable region
         _row_scroll (int): Index corresponding to top of viewable region
         _read_only (bool): Flag controlling ability to edit this widget
+        _line_cache (2-tuple): Text content and the lines of text built from it
     '''
     def __init__(self, label, parent, focus_key = None):
         # Initialize inherited state.
@@ -827,6 +1045,7 @@ class TextBox(Labeled):
         self._col_scroll = 0
         self._row_scroll = 0
         self._read_only = False
+        self._line_cache = (None, [])
 
 
     def clear(self, **kwargs):
@@ -834,6 +1053,7 @@ class TextBox(Labeled):
         self._cursor_offset = 0
         self._col_scroll = 0
         self._row_scroll = 0
+        self._refresh_search()
 
 
     def report(self):
@@ -842,6 +1062,7 @@ class TextBox(Labeled):
             usage = 'Type text input. Up/Down/Left/Right: Move Cursor'
         else:
             usage = 'Up/Down/Left/Right: Scroll'
+        usage += self._search_usage()
         return {'usage': usage}
 
 
@@ -867,11 +1088,34 @@ class TextBox(Labeled):
         # Draw border around the text box.
         self.draw_border(offset_right = 1)
 
-        # Draw lines of text.
+        # Show the prerendered lines of text, unless search matches are
+        # highlighted or the cursor is drawn over them.
+        self._sync_search()
         line_list = self._build_line_list()
-        for i in range(min(len(line_list[row_scroll:]), effective_height)):
-            line = line_list[i + row_scroll]
-            self.draw_text(line[col_scroll:], row = i + margin[2], margin = margin, fit = 'NO_WRAP')
+        num_cols = max([len(line) for line in line_list])
+        row_pad = self._row_pad
+        if row_pad and self._read_only and not self._search.query:
+            row_pad.hold(
+                lambda start, stop: line_list[start:stop],
+                row_scroll, effective_height, len(line_list), num_cols,
+                self.style('text'), self.style('fill'), text
+            )
+            row_pad.show(
+                self._win, margin[2], margin[0], row_scroll, col_scroll,
+                effective_height, effective_width
+            )
+
+        # Otherwise, draw lines of text, highlighting search matches.
+        else:
+            if row_pad:
+                row_pad.hide()
+            lines = line_list[row_scroll:row_scroll + effective_height]
+            self.draw_rows(
+                [line[col_scroll:] for line in lines], row = margin[2], margin = margin
+            )
+            for i in range(len(lines)):
+                self._draw_matches(lines[i], i + row_scroll, i + margin[2], margin)
+        self._draw_search()
 
         # Draw the cursor.
         if not self._read_only:
@@ -889,7 +1133,6 @@ class TextBox(Labeled):
             self.draw_text(left_arrow, row = center_row, align = 'LEFT', attr = attr)
 
         # Indicate content after.
-        num_cols = max([len(i) for i in text.splitlines() or [text]])
         if col_scroll < num_cols - effective_width:
             right_arrow = u'\u25B6'
             self.draw_text(right_arrow, row = center_row, margin = (width - 2, 0, 0, 0), attr = attr)
@@ -906,6 +1149,23 @@ class TextBox(Labeled):
             self.draw_text(down_arrow, row = height - 1, padding = padding, align = 'CENTER', attr = attr)
 
 
+    def reflow(self, **kwargs):
+        margin = [2, 3, 1, 1]
+        width, height = self.get_size()
+        effective_width = width - margin[0] - margin[1]
+        effective_height = height - margin[2] - margin[3]
+        line_list = self._build_line_list()
+        num_cols = max([len(line) for line in line_list] or [0])
+
+        # Keep the scroll position within the bounds of the new viewport.
+        self._row_scroll = min(
+            self._row_scroll, max(0, len(line_list) - effective_height)
+        )
+        self._col_scroll = min(
+            self._col_scroll, max(0, num_cols - effective_width)
+        )
+
+
     def operate(self, c):
         margin = [2, 3, 1, 1]
         width, height = self.get_size()
@@ -917,6 +1177,10 @@ class TextBox(Labeled):
         col_scroll = self._col_scroll
         row_scroll = self._row_scroll
 
+        # Handle searching ahead of editing & scrolling.
+        if self._operate_search(c):
+            return 'CONTINUE'
+
         # Enforce read-only constraint.
         if not self._read_only:
 
@@ -928,6 +1192,7 @@ class TextBox(Labeled):
 
                 # Insert character before the cursor.
                 self._text = text[:offset] + chr(c) + text[offset:]
+                self._refresh_search()
 
                 # Update offset of the cursor.
                 self._cursor_offset += 1
@@ -940,6 +1205,7 @@ class TextBox(Labeled):
 
                 # Delete character preceding the cursor.
                 self._text = text[:offset - 1] + text[offset:]
+                self._refresh_search()
 
                 # Update offset of the cursor.
                 self._cursor_offset -= 1
@@ -1032,6 +1298,63 @@ class TextBox(Labeled):
         self._overrides_enter = False
 
 
+    def _search_rows(self):
+        return [[line] for line in self._build_line_list()]
+
+
+    def _show_match(self, match):
+        margin = [2, 3, 1, 1]
+        width, height = self.get_size()
+        effective_width = width - margin[0] - margin[1]
+        effective_height = height - margin[2] - margin[3]
+        row, _, col = match
+
+        # Move the cursor to the match.
+        if not self._read_only:
+            self._cursor_offset = self._join_offsets(col, row)
+
+        # Scroll the match into view.
+        if row < self._row_scroll:
+            self._row_scroll = row
+        elif row >= self._row_scroll + effective_height:
+            self._row_scroll = row - (effective_height - 1)
+        end = col + len(self._search.query)
+        if col < self._col_scroll or end > self._col_scroll + effective_width:
+            self._col_scroll = max(0, min(col, end - effective_width))
+
+
+    def _draw_matches(self, line, i, row, margin):
+        '''
+        Highlights occurrences of the search query within a line of text
+
+        Parameters:
+            line (str): Line of text
+            i (int): Index of line
+            row (int): Row in which the line is drawn
+            margin (sequence<int>): Left, right, top, and bottom widget margins
+        '''
+        search = self._search
+        query = search.query
+        if not search.is_match(i, 0):
+            return
+        current = search.current()
+        col_scroll = self._col_scroll
+        lower_line = line.lower()
+        col = lower_line.find(query)
+        while col != -1:
+            start = col - col_scroll
+            text = line[col + max(0, -start):col + len(query)]
+            attr = self.style('highlight')
+            if current == (i, 0, col):
+                attr |= curses.A_BOLD
+            if text:
+                self.draw_text(
+                    text, row = row, margin = (margin[0] + max(0, start), margin[1], 0, 0),
+                    fit = 'NO_WRAP', attr = attr
+                )
+            col = lower_line.find(query, col + 1)
+
+
     def _build_line_list(self, strip = False):
         '''
         Builds lines of text from the string of text content
@@ -1042,11 +1365,16 @@ class TextBox(Labeled):
         Returns:
             list<str>: Lines of text
         '''
-        # Build line list from text content.
-        line_list = self._text.splitlines() or [self._text]
+        # Build line list from text content, unless it is unchanged since the
+        # last build.
+        text = self._text
+        if self._line_cache[0] is not text:
+            self._line_cache = (text, text.splitlines() or [text])
+        line_list = self._line_cache[1]
 
         # Remove any trailing blank lines.
         if strip:
+            line_list = list(line_list)
             while len(line_list) > 1 and line_list[-1].strip() == '':
                 line_list.pop()
 
@@ -1233,10 +1561,19 @@ class SelectField(Labeled):
     Enumerated input widget
 
     Attributes:
-        _options (list<str>): Enumerated input options
+        _options (sequence<str>): Enumerated input options, held by reference;
+            any source supporting len() and range slicing
         _options_limit (int): Maximum number of options to display
-        _highlight (int): Highlighted index in list of options
+        _highlight (int): Highlighted index in list of options (0 is the
+            "no selection" option, which precedes the enumerated options)
+        _prev_highlight (int): Highlighted index pending a partial redraw, if
+            any
         _init_highlight (int): Highlight index at the time of gaining focus
+        _filter (str): Type-ahead query narrowing the options
+        _filter_index (TrigramIndex): Fuzzy filter over the options, rebuilt
+            only when a new options list is loaded
+        _filtered (list<int>): Indices of options matching the type-ahead
+            query; None if the options are not filtered
         _row_scroll (int): Index corresponding to top of viewable region
         _expanded (bool): Flag indicating if options list is expanded/collapsed
         _overlayed (bool): Flag indicating if expanded options list has been
@@ -1248,29 +1585,34 @@ class SelectField(Labeled):
         super().__init__(label, parent, focus_key)
 
         # Initialize attributes.
-        self._options = ['-- NO SELECTION --']
+        self._options = []
         self._options_limit = -1
         self._highlight = 0
+        self._prev_highlight = None
         self._init_highlight = 0
+        self._filter = ''
+        self._filter_index = TrigramIndex()
+        self._filtered = None
         self._row_scroll = 0
         self._auto_expand = False
         self.collapse()
 
 
     def clear(self, **kwargs):
-        self._options = ['-- NO SELECTION --']
+        self._filter_options('')
+        self._options = []
+        self._filter_index.reset(self._options)
         self._highlight = 0
 
 
     def report(self):
-        return {'usage': 'Up/Down:Scroll, Enter:Select'}
+        return {'usage': 'Up/Down/PgUp/PgDn:Scroll, Type:Filter, Enter:Select'}
 
 
     def compose(self):
         highlight = self._highlight
-        option = self._options[highlight]
-        selection_changed = highlight != self._init_highlight
-        return (selection_changed, {'option': option if highlight > 0 else None})
+        selection_changed = self._source_index(highlight) != self._init_highlight
+        return (selection_changed, {'option': self._get_option(highlight)})
 
 
     def decompose(self, options, **kwargs):
@@ -1282,7 +1624,7 @@ class SelectField(Labeled):
 
     def focus(self, **kwargs):
         # Store initial highlighted option.
-        self._init_highlight = self._highlight
+        self._init_highlight = self._source_index(self._highlight)
 
         # Expand options list on focus.
         if self._auto_expand:
@@ -1290,6 +1632,9 @@ class SelectField(Labeled):
 
 
     def blur(self):
+        # Discard the type-ahead query, keeping the highlighted option.
+        self._filter_options('')
+
         # Collapse options list on blur if automated.
         if self._auto_expand:
             self.collapse()
@@ -1297,27 +1642,35 @@ class SelectField(Labeled):
 
     def draw(self):
         width, height = self.get_size()
-        margin = [1, 1, 1, 1]
-        padding = (1, 1)
 
         # Draw border around the text field.
         self.draw_border()
 
-        # Draw the list of options.
+        # Draw the visible page of options, fetching only that range.
         row_scroll = self._row_scroll
-        options_section = self._options[row_scroll:][:height - 2]
-        for i in range(len(options_section)):
-            option = options_section[i]
-
-            # Format and style option.
-            expand = 'AROUND' if not i + row_scroll else 'RIGHT'
-            if i + row_scroll == self._highlight:
-                attr = self.style('highlight')
-            else:
-                attr = self.style('text')
+        start = max(0, row_scroll - 1)
+        options_section = self._slice_options(start, row_scroll + height - 3)
+        if row_scroll == 0:
+            options_section.insert(0, None)
+        lines = [
+            self._format_option(i + row_scroll, options_section[i])
+            for i in range(len(options_section))
+        ]
+        self.draw_rows(lines, row = 1, margin = (1, 1, 1, 1))
 
-            # Draw option.
-            self.draw_text(option, row = margin[2] + i, margin = margin, padding = padding, expand = expand, attr = attr)
+        # Draw the highlighted option over the page.
+        highlight = self._highlight
+        if highlight is not None and 0 <= highlight - row_scroll < len(options_section):
+            self._draw_option(highlight, options_section[highlight - row_scroll])
+        self._prev_highlight = None
+
+        # Draw the type-ahead query and number of matching options.
+        if self._filter:
+            text = '{} [{}]'.format(self._filter, self._count_options() - 1)
+            self.draw_text(
+                text, row = height - 1, padding = (1, 1), margin = (2, 3, 0, 0),
+                attr = self.style('border')
+            )
 
         # Indicate if content exists outside of the visible region.
         if Widget.input_focus is self:
@@ -1331,10 +1684,17 @@ class SelectField(Labeled):
 
             # Indicate content below.
             down_arrow = u'\u25BC'
-            if self._row_scroll + height - 2 < len(self._options):
+            if self._row_scroll + height - 2 < self._count_options():
                 self.draw_text(down_arrow, row = height - 1, padding = padding, align = 'CENTER', attr = attr)
 
 
+    def patch(self):
+        # Redraw only the options whose highlight state has changed.
+        for i in {self._prev_highlight, self._highlight}:
+            self._draw_option(i, self._get_option(i))
+        self._prev_highlight = None
+
+
     def operate(self, c):
         margin = [1, 1, 1, 1]
 
@@ -1343,30 +1703,63 @@ class SelectField(Labeled):
             self.tag_redraw()
             self._overlayed = True
 
-        if c in {curses.KEY_DOWN, curses.KEY_UP, curses.KEY_ENTER, ascii.LF, ascii.CR}:
-            self.tag_redraw()
+        if c in {
+            curses.KEY_DOWN, curses.KEY_UP, curses.KEY_NPAGE, curses.KEY_PPAGE,
+            curses.KEY_ENTER, ascii.LF, ascii.CR
+        }:
+            effective_height = self.get_size()[1] - margin[2] - margin[3]
+            option_count = self._count_options()
+            if self._prev_highlight is None:
+                self._prev_highlight = self._highlight
 
             # Highlight the next option, wrapping if necessary.
             if c == curses.KEY_DOWN:
                 self._highlight += 1
-                self._highlight %= len(self._options)
+                self._highlight %= option_count
 
             # Highlight the previous option, wrapping if necessary.
             elif c == curses.KEY_UP:
                 self._highlight -= 1
-                self._highlight %= len(self._options)
+                self._highlight %= option_count
+
+            # Highlight the option a page down.
+            elif c == curses.KEY_NPAGE:
+                self._highlight = min(self._highlight + effective_height, option_count - 1)
+
+            # Highlight the option a page up.
+            elif c == curses.KEY_PPAGE:
+                self._highlight = max(self._highlight - effective_height, 0)
 
             # Select the highlighted option.
             elif c in {curses.KEY_ENTER, ascii.LF, ascii.CR}:
                 return 'END'
 
             # Scroll list if necessary.
-            effective_height = self.get_size()[1] - margin[2] - margin[3]
+            row_scroll = self._row_scroll
             if self._highlight < self._row_scroll:
                 self._row_scroll = self._highlight
             elif self._highlight >= self._row_scroll + effective_height:
                 self._row_scroll = self._highlight - effective_height + 1
 
+            # Redraw everything if scrolled; otherwise, redraw only the
+            # previously and newly highlighted options.
+            if self._row_scroll != row_scroll or not self._expanded:
+                self.tag_redraw()
+            else:
+                self.tag_patch()
+
+        # Clear the type-ahead query.
+        elif c == ascii.ESC:
+            self._filter_options('')
+
+        # Remove the last character of the type-ahead query.
+        elif c in {ascii.BS, ascii.DEL, curses.KEY_BACKSPACE}:
+            self._filter_options(self._filter[:-1])
+
+        # Narrow the options with the type-ahead query.
+        elif ascii.isprint(c):
+            self._filter_options(self._filter + chr(c))
+
         return 'CONTINUE'
 
 
@@ -1398,7 +1791,7 @@ class SelectField(Labeled):
         sy = self.get_position()[1]
         option_count = ph if self._options_limit < 0 else self._options_limit
         option_count = min(option_count, ph - sy - 3)
-        option_count = min(option_count, len(self._options))
+        option_count = min(option_count, self._count_options())
         sh = option_count + 2
         self.resize(height = sh)
 
@@ -1406,6 +1799,12 @@ class SelectField(Labeled):
         self._expanded = True
 
 
+    def reflow(self, **kwargs):
+        # Expand the options list again to fit its new bounds.
+        if self._expanded:
+            self.expand()
+
+
     def limit_options(self, count):
         '''
         Limits the number of options presented
@@ -1420,18 +1819,172 @@ class SelectField(Labeled):
 
     def load_options(self, options):
         '''
-        Loads enumerated options from a list
+        Loads enumerated options by reference, without copying them
 
         Parameters:
-            options (list<str>): Options list
+            options (sequence<str>): Options list, or any virtual source that
+                supports len() and range slicing (e.g. source[start:stop])
         '''
-        self._options = ['-- NO SELECTION --']
-        self._options.extend(options)
+        # Index a new list of options upon the next type-ahead query.
+        if options is not self._options:
+            self._filter_index.reset(options)
+        self._options = options
+
+        # Reapply any type-ahead query to the loaded options.
+        if self._filter:
+            self._filtered = self._filter_index.match(self._filter)
+        self._highlight = min(self._highlight, self._count_options() - 1)
         if self._expanded:
             self.expand()
 
 
-class Table(Labeled):
+    def _filter_options(self, text):
+        '''
+        Narrows the options to those matching a type-ahead query
+
+        Parameters:
+            text (str): Type-ahead query; an empty query restores all options
+        '''
+        if text == self._filter:
+            return
+
+        # Keep the highlighted option when restoring all options.
+        if not text:
+            self._highlight = self._source_index(self._highlight)
+            self._filtered = None
+
+        # Otherwise, filter the options, refining the previous matches if the
+        # query has been extended; then highlight the first match.
+        else:
+            refined = self._filter and text.startswith(self._filter)
+            candidates = self._filtered if refined else None
+            self._filtered = self._filter_index.match(text, candidates)
+            self._highlight = 1 if self._filtered else 0
+
+        # Scroll the highlighted option into view.
+        effective_height = self.get_size()[1] - 2
+        self._row_scroll = max(0, self._highlight - effective_height + 1)
+
+        # Update state.
+        self._filter = text
+        self._overrides_esc = bool(text) # Escape clears the query
+        self._prev_highlight = None
+        self.tag_redraw()
+
+
+    def _source_index(self, i):
+        '''
+        Maps an index in the (possibly filtered) list of options to an index in
+        the unfiltered list of options
+
+        Parameters:
+            i (int): Index in list of options
+
+        Returns:
+            int: Index in unfiltered list of options
+        '''
+        if self._filtered is None or i <= 0:
+            return i
+        return self._filtered[i - 1] + 1
+
+
+    def _count_options(self):
+        '''
+        Counts options, including the "no selection" option
+
+        Returns:
+            int: Number of options
+        '''
+        if self._filtered is not None:
+            return len(self._filtered) + 1
+        return len(self._options) + 1
+
+
+    def _get_option(self, i):
+        '''
+        Fetches a single option
+
+        Parameters:
+            i (int): Index in list of options
+
+        Returns:
+            str: Option; None for the "no selection" option
+        '''
+        if i <= 0:
+            return None
+        return self._options[self._source_index(i) - 1]
+
+
+    def _slice_options(self, start, stop):
+        '''
+        Fetches a range of options, excluding the "no selection" option
+
+        Parameters:
+            start (int): Start index in list of options, less one
+            stop (int): Stop index in list of options, less one
+
+        Returns:
+            list<str>: Options
+        '''
+        if self._filtered is not None:
+            options = self._options
+            return [options[i] for i in self._filtered[start:stop]]
+        return list(self._options[start:stop])
+
+
+    def _draw_option(self, i, option):
+        '''
+        Draws a single option, if visible
+
+        Parameters:
+            i (int): Index in list of options
+            option (str): Option; None for the "no selection" option
+        '''
+        height = self.get_size()[1]
+        margin = [1, 1, 1, 1]
+        row = i - self._row_scroll
+        if not 0 <= row < height - 2:
+            return
+
+        # Style option.
+        if i == self._highlight:
+            attr = self.style('highlight')
+        else:
+            attr = self.style('text')
+
+        # Draw option.
+        line = self._format_option(i, option)
+        self.draw_rows([line], row = margin[2] + row, margin = margin, attr = attr)
+
+
+    def _format_option(self, i, option):
+        '''
+        Formats a single option as a line of text spanning the field
+
+        Parameters:
+            i (int): Index in list of options
+            option (str): Option; None for the "no selection" option
+
+        Returns:
+            str: Line of text; empty if the field is too narrow
+        '''
+        width = self.get_size()[0] - 2
+        effective_width = width - 2
+        if effective_width < 1:
+            return ''
+
+        # Clip option, indicating clipping with an ellipsis.
+        text = str(option) if option is not None else '-- NO SELECTION --'
+        line = textwidth.clip(text, effective_width)
+        if len(text) > len(line):
+            line_width = textwidth.width(line)
+            line = textwidth.clip(textwidth.clip(line, line_width - 3) + '...', line_width)
+
+        # Pad option, centering the "no selection" option.
+        return textwidth.pad(' ' + line + ' ', width, 'CENTER' if not i else 'LEFT')
+
+
+class Table(Searchable):
     '''
     Display widget for tabulated data
 
@@ -1439,14 +1992,26 @@ class Table(Labeled):
         _header (list<str>): Column names for tabulated data
         _body (list<str>): Rows of tabulated data
         _col_widths (list<int>): Span of each column in characters
+        _col_aligns (list<str>): Alignment of each column in
+            {'LEFT', 'RIGHT'}; empty if every column is left-aligned
         _col_scroll (int): Index corresponding to left of viewable region
         _row_scroll (int): Index corresponding to top of viewable region
+        _caption (str): Summary shown in the top border, if any
+        _sort_column (str): Name of column the data is sorted by, if any
+        _sort_descending (bool): Flag indicating if sort order is descending
+        _dirty_rows (set<int>): Indices of body rows pending a partial redraw
+        _track_changes (bool): Flag controlling in-place updates of the body
+        _refresh_key (int): Key that requests fresh data, if any
+        _sort_key (int): Key that requests a change of sort order, if any
     '''
     def __init__(self, label, parent, focus_key = None):
         # Initialize inherited state.
         super().__init__(label, parent, focus_key)
 
         # Initialize attributes.
+        self._track_changes = False
+        self._refresh_key = None
+        self._sort_key = None
         self.clear()
 
 
@@ -1454,18 +2019,30 @@ class Table(Labeled):
         self._header = []
         self._body = []
         self._col_widths = []
+        self._col_aligns = []
         self._col_scroll = 0
         self._row_scroll = 0
+        self._caption = ''
+        self._sort_column = None
+        self._sort_descending = False
+        self._dirty_rows = set()
+        self._refresh_search()
+        if self._row_pad:
+            self._row_pad.invalidate()
 
 
     def report(self):
-        return {'usage': 'Up/Down/Left/Right/PgUp/PgDn: Scroll'}
+        usage = 'Up/Down/Left/Right/PgUp/PgDn: Scroll'
+        if self._refresh_key:
+            usage += ', {}: Refresh'.format(chr(self._refresh_key))
+        if self._sort_key:
+            usage += ', {}: Sort by left column'.format(chr(self._sort_key))
+        usage += self._search_usage()
+        return {'usage': usage}
 
 
-    def decompose(self, table = [], pretty_print = '', **kwargs):
-        self.tag_redraw()
-        self.clear()
-
+    def decompose(self, table = [], pretty_print = '', caption = '', sort = None,
+                  descending = False, **kwargs                                ):
         # Parse ASCII "Pretty Print" text, if available.
         if pretty_print:
             table = [
@@ -1474,16 +2051,49 @@ class Table(Labeled):
                 if row[0] == '|'
             ]
 
-        # Convert table items into strings.
-        table = [[str(item) if item else '' for item in row] for row in table]
+        # Format typed result batches column by column, right-aligning
+        # numbers.
+        col_aligns = []
+        if isinstance(table, ResultBatch):
+            if any(table.is_numeric(i) for i in range(len(table.names))):
+                col_aligns = [
+                    'RIGHT' if table.is_numeric(i) else 'LEFT'
+                    for i in range(len(table.names))
+                ]
+            table = [list(table.names)] + table.format_rows()
+
+        # Otherwise, convert table items into strings.
+        else:
+            table = [[str(item) if item else '' for item in row] for row in table]
+
+        # Update the body in place if the header of a tracked table is intact.
+        header_len = len(self._header)
+        if (self._track_changes
+            and table and table[0] == self._header
+            and all(len(row) == header_len for row in table[1:])
+        ):
+            if caption != self._caption:
+                self._caption = caption
+                self.tag_redraw()
+            self._update_body(table[1:])
+            return
+
+        self.tag_redraw()
+        self.clear()
+        self._caption = caption
+        self._sort_column = sort
+        self._sort_descending = descending
+        self._col_aligns = col_aligns
 
         # Separate table data into header and body sections.
         self._header = table[0]
         self._body = table[1:]
+        self._refresh_search()
 
         # Calculate the maximum width of each column.
+        table = [self._sorted_header()] + self._body
         self._col_widths = [
-            max([len(row[i]) + 4 for row in table])
+            max([textwidth.width(row[i]) + 4 for row in table])
             for i in range(len(self._header))
         ]
         self._col_widths[-1] -= 4
@@ -1509,7 +2119,6 @@ class Table(Labeled):
         margin = [2, 3, 1, 1]
         effective_width = width - margin[0] - margin[1]
         effective_height = height - margin[2] - margin[3] - 2
-        header = self._header
         body = self._body
         col_widths = self._col_widths
         col_scroll = self._col_scroll
@@ -1522,22 +2131,45 @@ class Table(Labeled):
             char_bottom_left = curses.ACS_LTEE, char_bottom_right = curses.ACS_RTEE
         )
 
-        # Draw the table header.
-        line = ''.join([
-            '{:<{}}'.format(header[i], col_widths[i])
-            for i in range(len(header))
-        ])
-        self.draw_text(line[col_scroll:], row = margin[2], margin = margin, fit = 'NO_WRAP')
+        # Draw the caption into the top border.
+        if self._caption:
+            self.draw_text(
+                self._caption, padding = (1, 1), margin = (2, 3, 0, 0),
+                align = 'RIGHT', attr = self.style('border')
+            )
+
+        # Draw the table header, indicating sort order.
+        line = self._format_row(self._sorted_header())
+        self.draw_text(textwidth.skip(line, col_scroll), row = margin[2], margin = margin, fit = 'NO_WRAP')
         margin[2] += 2
 
-        # Draw the table body.
-        for i in range(min(len(body[row_scroll:]), effective_height)):
-            line = ''.join([
-                '{:<{}}'.format(body[i + row_scroll][j], col_widths[j])
-                for j in range(len(body[i + row_scroll]))
-            ])
-            self.draw_text(line[col_scroll:], row = margin[2], margin = margin, fit = 'NO_WRAP')
-            margin[2] += 1
+        # Show the prerendered table body, unless search matches are highlighted.
+        self._sync_search()
+        row_pad = self._row_pad
+        if row_pad and not self._search.query:
+            row_pad.hold(
+                lambda start, stop: [self._format_row(row) for row in body[start:stop]],
+                row_scroll, effective_height, len(body), sum(col_widths),
+                self.style('text'), self.style('fill')
+            )
+            row_pad.show(
+                self._win, margin[2], margin[0], row_scroll, col_scroll,
+                effective_height, effective_width
+            )
+
+        # Otherwise, draw the table body, highlighting search matches.
+        else:
+            if row_pad:
+                row_pad.hide()
+            lines = [
+                textwidth.skip(self._format_row(row), col_scroll)
+                for row in body[row_scroll:row_scroll + effective_height]
+            ]
+            self.draw_rows(lines, row = margin[2], margin = margin)
+            for i in range(len(lines)):
+                self._draw_matches(i + row_scroll, margin[2] + i, margin)
+        self._dirty_rows.clear()
+        self._draw_search()
 
         # Indicate if content exists outside of the visible region.
         attr = self.style('border')
@@ -1572,6 +2204,11 @@ class Table(Labeled):
         effective_height = height - margin[2] - margin[3]
         body = self._body
         col_widths = self._col_widths
+
+        # Handle searching ahead of scrolling.
+        if self._operate_search(c):
+            return 'CONTINUE'
+
         col_scroll = self._col_scroll
         row_scroll = self._row_scroll
         scroll_sensitivity = 1
@@ -1615,4 +2252,267 @@ class Table(Labeled):
                 max(0, len(self._body) - effective_height)
             )
 
+        # Request fresh data.
+        elif c == self._refresh_key:
+            signal = signals.Signal('DATASIG_REQ', {'refresh': True}, False)
+            self.bubble(**signal.data)
+
+        # Cycle the sort order of the leftmost visible column.
+        elif c == self._sort_key and self._header:
+            column = self._header[self._leftmost_column()]
+            if column != self._sort_column:
+                sort, descending = column, False
+            elif not self._sort_descending:
+                sort, descending = column, True
+            else:
+                sort, descending = None, False
+            signal = signals.Signal('DATASIG_OUT', {'sort': sort, 'descending': descending}, False)
+            self.bubble(**signal.data)
+
         return 'CONTINUE'
+
+
+    def reflow(self, **kwargs):
+        margin = [2, 3, 3, 1]
+        width, height = self.get_size()
+        effective_width = width - margin[0] - margin[1]
+        effective_height = height - margin[2] - margin[3]
+
+        # Keep the scroll position within the bounds of the new viewport.
+        self._row_scroll = min(
+            self._row_scroll, max(0, len(self._body) - effective_height)
+        )
+        self._col_scroll = min(
+            self._col_scroll, max(0, sum(self._col_widths) - effective_width)
+        )
+
+
+    def allow_refresh(self, key = ord('r')):
+        '''
+        Enables a key that requests fresh data, bypassing any cached data
+
+        Parameters:
+            key (int): Key that requests fresh data (Optional)
+        '''
+        self._refresh_key = key
+
+
+    def allow_sort(self, key = ord('s')):
+        '''
+        Binds a key that requests data sorted by the leftmost visible column,
+        cycling through ascending, descending, and unsorted orders
+
+        Parameters:
+            key (int): Key that requests a change of sort order (Optional)
+        '''
+        self._sort_key = key
+
+
+    def patch(self):
+        margin = [2, 3, 3, 1]
+        height = self.get_size()[1]
+        effective_height = height - margin[2] - margin[3]
+        body = self._body
+        col_scroll = self._col_scroll
+        row_scroll = self._row_scroll
+
+        # Skip changed rows shown from the pad, which are already rendered.
+        if self._row_pad and self._row_pad.is_shown():
+            self._dirty_rows.clear()
+            return
+
+        # Redraw changed rows that are within the visible region.
+        self._sync_search()
+        for i in sorted(self._dirty_rows):
+            row = i - row_scroll
+            if 0 <= row < effective_height and i < len(body):
+                line = self._format_row(body[i])
+                self.draw_text(
+                    textwidth.skip(line, col_scroll), row = margin[2] + row, margin = margin,
+                    fit = 'NO_WRAP', expand = 'RIGHT'
+                )
+                self._draw_matches(i, margin[2] + row, margin)
+        self._dirty_rows.clear()
+
+
+    def track_changes(self):
+        '''
+        Preserves scroll state across input signals, and redraws only the rows
+        that have changed when the header of the received table is unchanged
+        '''
+        self._track_changes = True
+
+
+    def _format_row(self, row):
+        '''
+        Formats given row of tabulated data as a single line of text
+
+        Parameters:
+            row (list<str>): Row of tabulated data
+
+        Returns:
+            str: Line of text
+        '''
+        col_widths = self._col_widths
+        if not self._col_aligns:
+            return ''.join([
+                textwidth.pad(row[i], col_widths[i])
+                for i in range(len(row))
+            ])
+
+        # Right-align cells within their columns, ahead of the column gap.
+        cells = []
+        for i in range(len(row)):
+            if self._col_aligns[i] == 'RIGHT':
+                gap = self._col_gap(i)
+                cells.append(textwidth.pad(row[i], col_widths[i] - gap, 'RIGHT') + ' ' * gap)
+            else:
+                cells.append(textwidth.pad(row[i], col_widths[i]))
+        return ''.join(cells)
+
+
+    def _col_gap(self, i):
+        '''
+        Determines the space separating a column from the next
+
+        Parameters:
+            i (int): Column index
+
+        Returns:
+            int: Number of spaces
+        '''
+        return 4 if i < len(self._col_widths) - 1 else 0
+
+
+    def _search_rows(self):
+        return self._body
+
+
+    def _show_match(self, match):
+        margin = [2, 3, 3, 1]
+        width, height = self.get_size()
+        effective_width = width - margin[0] - margin[1]
+        effective_height = height - margin[2] - margin[3]
+        col_widths = self._col_widths
+        row, cell, _ = match
+
+        # Scroll the matching row into view.
+        if not self._row_scroll <= row < self._row_scroll + effective_height:
+            self._row_scroll = min(row, max(0, len(self._body) - effective_height))
+
+        # Scroll the matching cell into view.
+        start = sum(col_widths[:cell])
+        end = start + col_widths[cell]
+        if start < self._col_scroll or end > self._col_scroll + effective_width:
+            self._col_scroll = min(start, max(0, sum(col_widths) - effective_width))
+
+
+    def _draw_matches(self, i, row, margin):
+        '''
+        Highlights cells of a body row that match the search query
+
+        Parameters:
+            i (int): Index of body row
+            row (int): Row in which the body row is drawn
+            margin (sequence<int>): Left, right, top, and bottom widget margins
+        '''
+        search = self._search
+        if not search.query:
+            return
+        current = search.current()
+        start = -self._col_scroll
+        for j, col_width in enumerate(self._col_widths):
+            if search.is_match(i, j):
+                cell_start = start
+                if self._col_aligns and self._col_aligns[j] == 'RIGHT':
+                    cell_start += (
+                        col_width - self._col_gap(j) - textwidth.width(self._body[i][j])
+                    )
+                text = textwidth.skip(self._body[i][j], -cell_start)
+                attr = self.style('highlight')
+                if current and current[:2] == (i, j):
+                    attr |= curses.A_BOLD
+                if text:
+                    self.draw_text(
+                        text, row = row, margin = (margin[0] + max(0, cell_start), margin[1], 0, 0),
+                        fit = 'NO_WRAP', attr = attr
+                    )
+            start += col_width
+
+
+    def _sorted_header(self):
+        '''
+        Marks the sorted column, if any, of the header with an arrow
+
+        Returns:
+            list<str>: Column names
+        '''
+        arrow = u' \u25BC' if self._sort_descending else u' \u25B2'
+        return [
+            name + arrow if name == self._sort_column else name
+            for name in self._header
+        ]
+
+
+    def _leftmost_column(self):
+        '''
+        Finds the column at the left of the viewable region
+
+        Returns:
+            int: Column index
+        '''
+        span = 0
+        for i, width in enumerate(self._col_widths):
+            span += width
+            if span > self._col_scroll:
+                return i
+        return len(self._col_widths) - 1
+
+
+    def _update_body(self, body):
+        '''
+        Replaces the body of this table, tagging only changed rows for redraw
+
+        Parameters:
+            body (list<list<str>>): Rows of tabulated data
+        '''
+        old_body = self._body
+        self._body = body
+        self._refresh_search()
+
+        # Widen columns to fit new content; never shrink them, since doing so
+        # would shift every row.
+        table = [self._sorted_header()] + body
+        col_widths = [
+            max([textwidth.width(row[i]) + 4 for row in table])
+            for i in range(len(self._header))
+        ]
+        col_widths[-1] -= 4
+        col_widths = [max(pair) for pair in zip(col_widths, self._col_widths)]
+
+        # Keep the scroll position within the bounds of the new body.
+        self._row_scroll = min(self._row_scroll, max(0, len(body) - 1))
+
+        # Redraw everything if the layout has changed.
+        if col_widths != self._col_widths or len(body) != len(old_body):
+            self._col_widths = col_widths
+            self.tag_redraw()
+            if self._row_pad:
+                self._row_pad.invalidate()
+
+        # Otherwise, redraw only the rows that differ.
+        else:
+            dirty_rows = {
+                i for i in range(len(body))
+                if body[i] != old_body[i]
+            }
+
+            # Render changed rows into the pad, including those held outside
+            # of the visible region.
+            if self._row_pad:
+                for i in dirty_rows:
+                    self._row_pad.update(i, self._format_row(body[i]))
+
+            if dirty_rows:
+                self._dirty_rows |= dirty_rows
+                self.tag_patch()